@@ -1,65 +1,77 @@
 import re
-import emoji
 import logging
 import numpy as np
-import tensorflow as tf
 from typing import List, Optional, Dict, Union
-from soynlp.normalizer import repeat_normalize
-from transformers import AutoTokenizer, TFElectraForSequenceClassification
-from kss import split_sentences as kss_split_sentences
+from app.analyzer.matcher import AspectMatcher, ASPECT_KEYWORDS
+from app.analyzer.cache import SentimentCache
+from app.analyzer.backends import InferenceBackend, load_backend
+from app.analyzer.splitter import SentenceSplitter
+from app.analyzer.metrics import BatchMetrics
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# transformers / kss / emoji / soynlp 는 무거우므로 Analyzer 생성 시점에 import
+# (app 을 import 하는 것만으로는 TensorFlow 가 로딩되지 않도록)
+
+def length_buckets(input_ids: List[List[int]], batch_size: int) -> List[List[int]]:
+    """
+    토큰 길이 오름차순으로 정렬한 인덱스를 batch_size 씩 나눈 버킷 목록
+    (각 버킷은 원래 문장 인덱스를 담고 있어 결과를 입력 순서로 되돌릴 수 있음)
+    """
+    order = sorted(range(len(input_ids)), key=lambda i: len(input_ids[i]))
+    return [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
 
 class Analyzer:
-    def __init__(self, model_dir: str = "./asset/kcelectra-base-DC", max_length: int = 64):
+    # 배치 길이를 8의 배수로 맞춰 서로 다른 입력 shape 수를 줄임 (TF 재트레이싱 방지)
+    pad_multiple: int = 8
+
+    def __init__(
+        self,
+        model_dir: str = "./asset/kcelectra-base-DC",
+        max_length: int = 64,
+        backend: str = "tf",
+        cache_path: Optional[str] = None,
+        cache_size: int = 100_000,
+        split_backend: str = "auto",
+        split_workers: int = 1
+    ):
         self.model_dir = model_dir
         self.max_length = max_length
+        self.backend_name = backend
         try:
+            import emoji
+            from transformers import AutoTokenizer
+
+            self._emoji_pattern = emoji.get_emoji_regexp()
+            self._clean_pattern = re.compile(rf"[^ .,?!/@\$%~％·∼()\x00-\x7Fㄱ-ㅣ가-힣{self._emoji_pattern}]+")
             self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
-            self.model = TFElectraForSequenceClassification.from_pretrained(model_dir, num_labels=2)
+            self.backend: InferenceBackend = load_backend(backend, model_dir)
             self.keyword_dict = self._load_keyword_dict()
-            self.patterns = self._compile_patterns(self.keyword_dict)
-            logger.info("[INIT] 모델 및 키워드 패턴 로딩 완료")
+            self.matcher = AspectMatcher(self.keyword_dict)
+            # 같은 체크포인트라도 백엔드(양자화 여부)에 따라 결과가 다를 수 있으므로 모델 식별자에 포함
+            self.cache = SentimentCache.for_model(model_dir, backend=backend, db_path=cache_path, max_size=cache_size)
+            self.splitter = SentenceSplitter(backend=split_backend, workers=split_workers)
+            logger.info(f"[INIT] 모델({backend}) 및 키워드 패턴 로딩 완료")
         except Exception as e:
             logger.exception(f"[INIT ERROR] 모델 로딩 실패: {e}")
             raise
 
     def _load_keyword_dict(self) -> Dict[str, List[str]]:
-        return {
-            '맛': ['맛있', '달달', '단맛', '짠맛', '맛임', '감칠맛', '매워', '짠', '설탕',
-                 '단짠', '밍밍', '매콤', '상큼', '비릿', '인공적', '당충전', '느끼'],
-            '식감': ['식감', '쫀득', '쫀득함', '바삭', '퍽퍽', '부드러움', '쫀쫀함', '촉촉',
-                  '질겨', '씹싸름', '빠삭', '겉바속촉', '꾸덕', '미끌', '속쫀', '뻑뻑', '사르르'],
-            '기타': ['포장', '디자인', '스타일', '편의점', '사진', '인스타', '브랜드', '컬러',
-                  '비주', '비주얼', '선물', '리뉴얼', 'CU', 'GS', '세븐', '세븐일레븐',
-                  '지에스', '씨유', '이마트', '노브랜드', '이마트24', '배민', 'B마트',
-                  '비마트', '팝업', '미니스톱'],
-            '가격': ['가격', '가성', '할인', '가성비', '부담', '대비', '싸구려', '가격에비해',
-                  '비싸여', '넘비싸', '이딴게', '가심비', '이가격', '합리적'],
-            '주관적평가': ['감동', '행복', '만족', '대박', '최고', '실망', '아쉽', '아쉬운', '추천',
-                        '진심', '감탄', '존맛', '비추', '느낌', '퀄리티', '재구매', '강추',
-                        '굿굿', '중독성', '개존맛']
-        }
-
-    def _compile_patterns(self, keyword_dict: Dict[str, List[str]]) -> Dict[str, re.Pattern]:
-        return {
-            label: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
-            for label, keywords in keyword_dict.items()
-        }
+        return {label: list(keywords) for label, keywords in ASPECT_KEYWORDS.items()}
 
     def clean_text(self, content: str, min_length: int = 3, num_repeats: int = 2) -> Optional[str]:
+        from soynlp.normalizer import repeat_normalize
+
         try:
-            _emoji_pattern = emoji.get_emoji_regexp()
-            _clean_pattern = re.compile(rf"[^ .,?!/@\$%~％·∼()\x00-\x7Fㄱ-ㅣ가-힣{_emoji_pattern}]+")
             if any(kw in content for kw in ("레시피", "만들기")) or \
                re.search(r"https?://\S+", content) or \
                not re.search(r"[가-힣]", content):
                 return None
 
-            cleaned = _clean_pattern.sub(" ", content)
-            cleaned = _emoji_pattern.sub("", cleaned)
+            cleaned = self._clean_pattern.sub(" ", content)
+            cleaned = self._emoji_pattern.sub("", cleaned)
             cleaned = repeat_normalize(cleaned.strip(), num_repeats)
             return cleaned if len(cleaned) >= min_length else None
         except Exception as e:
@@ -67,37 +79,171 @@ class Analyzer:
             return None
 
     def split_sentences(self, content: str) -> List[str]:
-        try:
-            return [s.strip() for s in kss_split_sentences(content) if s.strip()]
-        except Exception as e:
-            logger.warning(f"[SPLIT ERROR] 문장 분리 실패: {e}")
-            return []
+        return self.splitter.split(content)
 
     def classify_sentiment(self, content: str) -> int:
         try:
             if not content.strip():
                 return -1
-            enc = self.tokenizer(
-                content,
-                return_tensors="tf",
-                truncation=True,
-                padding="max_length",
-                max_length=self.max_length
-            )
-            logits = self.model(enc).logits
-            probs = tf.nn.softmax(logits, axis=1).numpy()
-            return int(np.argmax(probs, axis=1)[0])
+            return self.classify_sentiments([content])[0]
         except Exception as e:
             logger.warning(f"[SENTIMENT ERROR] 감성 분류 실패: {e}")
             return -1
 
+    def classify_sentiments(self, sentences: List[str], batch_size: int = 256) -> List[int]:
+        """
+        여러 문장의 감성을 입력 순서대로 반환 (실패 시 -1)
+        - 캐시(LRU → 디스크)에 있는 문장은 추론 생략
+        - 캐시에 없는 문장은 정규화 기준으로 중복 제거 후 batch_size 단위로 추론하고 캐시에 저장
+        """
+        keys = [self.cache.make_key(sentence) for sentence in sentences]
+        labels = self.cache.get_many(keys)
+
+        pending: Dict[str, str] = {}
+        for key, sentence, label in zip(keys, sentences, labels):
+            if label is None and key not in pending:
+                pending[key] = sentence
+
+        if pending:
+            predicted = dict(zip(pending, self._predict(list(pending.values()), batch_size)))
+            self.cache.put_many(predicted)
+            labels = [predicted[key] if label is None else label for key, label in zip(keys, labels)]
+        return labels
+
+    def _predict(self, sentences: List[str], batch_size: int) -> List[int]:
+        """
+        여러 문장을 batch_size 단위로 묶어 한 번의 forward pass로 감성 분류
+        - 토큰 길이 순으로 정렬해 비슷한 길이끼리 배치를 만들고, 배치마다 가장 긴 문장 길이까지만 padding
+        - 입력 순서대로 라벨 리스트 반환, 실패한 배치는 -1로 채움
+        """
+        labels: List[int] = [-1] * len(sentences)
+        if not sentences:
+            return labels
+
+        try:
+            features = self.tokenizer(sentences, truncation=True, max_length=self.max_length)
+        except Exception as e:
+            logger.warning(f"[SENTIMENT ERROR] 토큰화 실패 ({len(sentences)}개 문장): {e}")
+            return labels
+
+        for batch_idx in length_buckets(features["input_ids"], batch_size):
+            try:
+                enc = self.tokenizer.pad(
+                    {name: [values[i] for i in batch_idx] for name, values in features.items()},
+                    padding="longest",
+                    pad_to_multiple_of=self.pad_multiple,
+                    return_tensors="np"
+                )
+                logits = self.backend.predict_logits(enc)
+                for i, label in zip(batch_idx, np.argmax(logits, axis=1)):
+                    labels[i] = int(label)
+            except Exception as e:
+                logger.warning(f"[SENTIMENT ERROR] 배치 감성 분류 실패 ({len(batch_idx)}개 문장): {e}")
+        return labels
+
+    def warmup(self, batch_size: int = 32):
+        """
+        첫 요청이 그래프 트레이싱/세션 초기화 비용을 내지 않도록 더미 배치로 미리 추론 (캐시 미사용)
+        """
+        # 길이가 다른 문장을 섞어 길이 버킷별 입력 shape 도 함께 워밍업
+        sentences = ["존맛", "가격 대비 아쉬워요", "식감이 쫀득하고 단짠 조합이 최고라서 재구매 의사 있음"] * batch_size
+        self._predict(sentences, batch_size)
+
     def extract_aspect_and_keywords(self, sentence: str) -> Optional[Dict[str, Union[int, List[str]]]]:
-        for i, (aspect, pattern) in enumerate(self.patterns.items(), start=1):  # 1~5
-            matches = pattern.findall(sentence)
-            if matches:
-                return {"aspect_id": i, "evidence_keywords": list(set(matches))}
+        for aspect, keywords in self.matcher.match(sentence, first_only=True).items():
+            return {"aspect_id": self.matcher.labels.index(aspect) + 1, "evidence_keywords": keywords}  # 1~5
         return None
 
+    def preprocess(self, raw_text: str) -> List[Dict[str, Union[str, int, List[str]]]]:
+        """
+        정제 → 문장 분리 → 속성 필터까지 수행하여 감성 분류 대상 문장 목록을 반환
+        """
+        return self.preprocess_many([raw_text])[0]
+
+    def preprocess_many(
+        self, raw_texts: List[str], metrics: Optional[BatchMetrics] = None
+    ) -> List[List[Dict[str, Union[str, int, List[str]]]]]:
+        """
+        여러 텍스트를 정제한 뒤 문장 분리는 SentenceSplitter 로 한 번에 처리하고 속성 필터 적용
+        (metrics 를 넘기면 정제/분리/속성 매칭 단계별 시간과 건수를 기록)
+        """
+        metrics = metrics or BatchMetrics()
+        with metrics.timer("clean"):
+            cleaned_texts = [self.clean_text(raw_text) or "" for raw_text in raw_texts]
+        texts_cleaned = sum(1 for cleaned in cleaned_texts if cleaned)
+        metrics.add("texts_cleaned", texts_cleaned)
+        metrics.add("texts_rejected", len(cleaned_texts) - texts_cleaned)
+
+        with metrics.timer("split"):
+            sentences_per_text = self.splitter.split_many(cleaned_texts)
+        metrics.add("sentences_split", sum(len(sentences) for sentences in sentences_per_text))
+
+        with metrics.timer("aspect"):
+            candidates_per_text = [self._filter_aspects(sentences) for sentences in sentences_per_text]
+        metrics.add("aspect_hits", sum(len(candidates) for candidates in candidates_per_text))
+        return candidates_per_text
+
+    def _filter_aspects(self, sentences: List[str]) -> List[Dict[str, Union[str, int, List[str]]]]:
+        candidates = []
+        for sentence in sentences:
+            aspect_result = self.extract_aspect_and_keywords(sentence)
+            if not aspect_result:
+                continue
+            candidates.append({
+                "content": sentence,
+                "aspect_id": aspect_result["aspect_id"],
+                "evidence_keywords": aspect_result["evidence_keywords"]
+            })
+        return candidates
+
+    def run_batch(
+        self, raw_texts: List[str], batch_size: int = 256, metrics: Optional[BatchMetrics] = None
+    ) -> List[List[Dict[str, Union[str, int, List[str]]]]]:
+        """
+        여러 텍스트를 한꺼번에 분석
+        1) 모든 텍스트를 먼저 정제/분리/속성 필터링
+        2) 살아남은 문장 전체를 batch_size 단위로 감성 분류
+        3) 결과를 입력 텍스트 순서대로 다시 나눠 반환 (run()과 동일한 형식)
+        """
+        logger.info(f"[RUN BATCH] 분석 시작: {len(raw_texts)}개 텍스트")
+        metrics = metrics or BatchMetrics()
+        return self.classify_candidates(self.preprocess_many(raw_texts, metrics), batch_size=batch_size, metrics=metrics)
+
+    def classify_candidates(
+        self,
+        candidates_per_text: List[List[Dict[str, Union[str, int, List[str]]]]],
+        batch_size: int = 256,
+        metrics: Optional[BatchMetrics] = None
+    ) -> List[List[Dict[str, Union[str, int, List[str]]]]]:
+        """
+        preprocess_many 결과(텍스트별 후보 문장)를 한꺼번에 감성 분류하여 run_batch 와 같은 형식으로 반환
+        """
+        metrics = metrics or BatchMetrics()
+        flat_sentences = [c["content"] for candidates in candidates_per_text for c in candidates]
+        hits_before = self.cache.memory_hits + self.cache.disk_hits
+        with metrics.timer("inference"):
+            flat_labels = self.classify_sentiments(flat_sentences, batch_size=batch_size)
+        metrics.add("cache_hits", self.cache.memory_hits + self.cache.disk_hits - hits_before)
+        metrics.add("sentences_classified", sum(1 for label in flat_labels if label != -1))
+        labels = iter(flat_labels)
+
+        results = []
+        for candidates in candidates_per_text:
+            text_result = []
+            for candidate in candidates:
+                sentiment_id = next(labels)
+                if sentiment_id == -1:
+                    continue
+                text_result.append({**candidate, "sentiment_id": sentiment_id})
+            results.append(text_result)
+
+        cache_stats = self.cache.stats()
+        logger.info(
+            f"[DONE] 배치 분석 완료: {len(flat_sentences)}개 문장 분류 "
+            f"(캐시 적중률 {cache_stats['hit_rate']:.1%}, 메모리 {cache_stats['memory_hits']} / 디스크 {cache_stats['disk_hits']} / 미스 {cache_stats['misses']})"
+        )
+        return results
+
     def run(self, raw_text: str) -> List[Dict[str, Union[str, int, List[str]]]]:
         logger.info("[RUN] 분석 시작")
         result = []
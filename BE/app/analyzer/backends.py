@@ -0,0 +1,77 @@
+import os
+import logging
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 백엔드 이름 → ONNX 파일명 (export_onnx 로 생성)
+ONNX_FILES = {
+    "onnx": "model.onnx",
+    "onnx-int8": "model.quant.onnx",
+}
+
+
+class InferenceBackend(ABC):
+    name: str = ""
+
+    @abstractmethod
+    def predict_logits(self, enc: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        토크나이저 출력(numpy)을 받아 (batch, num_labels) logits 반환
+        """
+        pass
+
+
+class TFBackend(InferenceBackend):
+    name = "tf"
+
+    def __init__(self, model_dir: str):
+        from transformers import TFElectraForSequenceClassification
+        self.model = TFElectraForSequenceClassification.from_pretrained(model_dir, num_labels=2)
+
+    def predict_logits(self, enc: Dict[str, np.ndarray]) -> np.ndarray:
+        return self.model(dict(enc), training=False).logits.numpy()
+
+
+class OnnxBackend(InferenceBackend):
+    def __init__(self, model_path: str, name: str = "onnx", num_threads: Optional[int] = None):
+        import onnxruntime as ort
+
+        if num_threads is None:
+            # 워커 풀에서 프로세스별 스레드 수를 나눠줄 때 사용 (0 = onnxruntime 기본값)
+            num_threads = int(os.environ.get("ANALYZER_INTRA_OP_THREADS", 0))
+
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX 모델이 없습니다: {model_path} (python -m app.analyzer.export_onnx 로 먼저 생성하세요)"
+            )
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.name = name
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        self._inputs = {
+            i.name: np.int64 if i.type == "tensor(int64)" else np.int32
+            for i in self.session.get_inputs()
+        }
+
+    def predict_logits(self, enc: Dict[str, np.ndarray]) -> np.ndarray:
+        feed = {name: np.asarray(enc[name], dtype=dtype) for name, dtype in self._inputs.items() if name in enc}
+        return self.session.run(None, feed)[0]
+
+
+def load_backend(name: str, model_dir: str) -> InferenceBackend:
+    """
+    설정값(ANALYZER_BACKEND)에 맞는 추론 백엔드 생성
+    - tf        : 기존 TFElectraForSequenceClassification
+    - onnx      : export 된 ONNX 모델 (onnxruntime CPU)
+    - onnx-int8 : 동적 int8 양자화 ONNX 모델
+    """
+    if name == "tf":
+        return TFBackend(model_dir)
+    if name in ONNX_FILES:
+        return OnnxBackend(os.path.join(model_dir, ONNX_FILES[name]), name=name)
+    raise ValueError(f"지원되지 않는 추론 백엔드입니다: {name} (tf, {', '.join(ONNX_FILES)})")
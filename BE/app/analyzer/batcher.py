@@ -0,0 +1,112 @@
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from app.analyzer.analyzer import Analyzer
+
+logger = logging.getLogger(__name__)
+
+AnalysisResult = List[Dict[str, Union[str, int, List[str]]]]
+
+
+class DynamicBatcher:
+    """
+    온라인 분석 요청용 동적 배치 큐
+    - 요청마다 모델을 호출하지 않고, 첫 요청이 들어온 뒤 max_wait_ms 동안(또는 max_texts 개가 찰 때까지)
+      들어온 요청들을 합쳐 Analyzer.run_batch 한 번으로 처리한 뒤 각 요청에 자기 결과만 돌려줌
+    - 모델 추론은 전용 스레드 1개에서 순서대로 실행 (이벤트 루프를 막지 않고, 모델을 동시에 호출하지 않음)
+    - 처리 루프는 첫 submit() 시점에 현재 이벤트 루프에서 시작
+    """
+
+    def __init__(
+        self,
+        analyzer_factory: Callable[[], Analyzer],
+        max_texts: int = 64,
+        max_wait_ms: float = 10.0,
+        batch_size: int = 256
+    ):
+        self.analyzer_factory = analyzer_factory
+        self.max_texts = max_texts
+        self.max_wait = max_wait_ms / 1000
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analyze-batcher")
+        self._analyzer: Optional[Analyzer] = None
+
+    @property
+    def analyzer(self) -> Analyzer:
+        # 전용 스레드에서만 호출됨 (최초 1회 모델 로딩)
+        if self._analyzer is None:
+            self._analyzer = self.analyzer_factory()
+        return self._analyzer
+
+    async def submit(self, texts: List[str]) -> Tuple[List[AnalysisResult], int]:
+        """
+        texts 를 큐에 넣고 결과를 기다림
+        (텍스트별 분석 결과, 함께 처리된 배치의 전체 텍스트 수) 반환
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[List[str], asyncio.Future]]:
+        requests = [await self._queue.get()]
+        text_count = len(requests[0][0])
+        deadline = time.monotonic() + self.max_wait
+
+        while text_count < self.max_texts:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            requests.append(request)
+            text_count += len(request[0])
+        return requests
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = await self._collect()
+            # 기다리는 동안 연결이 끊겨 취소된 요청은 제외
+            requests = [(texts, future) for texts, future in requests if not future.done()]
+            if not requests:
+                continue
+
+            merged = [text for texts, _ in requests for text in texts]
+            try:
+                results = await loop.run_in_executor(self._executor, self._analyze, merged)
+            except Exception as e:
+                logger.exception(f"[BATCHER ERROR] 배치 분석 실패 ({len(requests)}개 요청, {len(merged)}개 텍스트)")
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for texts, future in requests:
+                if not future.done():
+                    future.set_result((results[offset:offset + len(texts)], len(merged)))
+                offset += len(texts)
+
+    def _analyze(self, texts: List[str]) -> List[AnalysisResult]:
+        return self.analyzer.run_batch(texts, batch_size=self.batch_size)
+
+    async def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,160 @@
+import os
+import re
+import hashlib
+import logging
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 모델 식별자에 반영할 가중치/설정 파일
+_MODEL_FILES = ("config.json", "tf_model.h5", "model.onnx", "model.quant.onnx", "vocab.txt", "tokenizer_config.json")
+
+
+def model_fingerprint(model_dir: str) -> str:
+    """
+    model_dir 경로와 가중치 파일(크기, 수정 시각)로 모델 식별자를 생성
+    - 경로가 바뀌거나 가중치가 교체되면 식별자가 달라져 기존 캐시는 자동으로 무효화됨
+    - 로컬 경로가 아니면 (예: HuggingFace Hub 이름) 문자열 그대로 사용
+    """
+    if not os.path.isdir(model_dir):
+        return model_dir
+
+    digest = hashlib.sha1(os.path.abspath(model_dir).encode("utf-8"))
+    for name in _MODEL_FILES:
+        path = os.path.join(model_dir, name)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{name}:{stat.st_size}:{int(stat.st_mtime)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SentimentCache:
+    """
+    문장 단위 감성 분류 결과 2단 캐시
+    - 1단: 프로세스 내 LRU (OrderedDict)
+    - 2단: 로컬 디스크 SQLite 저장소 (db_path가 없으면 사용하지 않음)
+    키는 sha1(model_id + 정규화 문장) 이므로 모델이 바뀌면 이전 결과는 조회되지 않습니다.
+    같은 SQLite 파일을 다른 백엔드/모델의 프로세스(API, 분석 데몬, 비교 스크립트)가 함께 쓰므로
+    다른 model_id 의 항목은 지우지 않습니다.
+    """
+
+    def __init__(self, model_id: str, db_path: Optional[str] = None, max_size: int = 100_000):
+        self.model_id = model_id
+        self.max_size = max_size
+        self._lru: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sentiment_cache (
+                    key TEXT PRIMARY KEY,
+                    model_id TEXT NOT NULL,
+                    sentiment_id INTEGER NOT NULL,
+                    created_at TEXT
+                )
+                """
+            )
+            self._conn.commit()
+
+    @classmethod
+    def for_model(
+        cls, model_dir: str, backend: str = "tf", db_path: Optional[str] = None, max_size: int = 100_000
+    ) -> "SentimentCache":
+        return cls(f"{model_fingerprint(model_dir)}:{backend}", db_path=db_path, max_size=max_size)
+
+    @staticmethod
+    def normalize(sentence: str) -> str:
+        return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", sentence)).strip()
+
+    def make_key(self, sentence: str) -> str:
+        return hashlib.sha1(f"{self.model_id}\x00{self.normalize(sentence)}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[int]]:
+        """
+        키 목록에 대한 캐시 결과를 같은 순서로 반환 (없으면 None)
+        """
+        results: List[Optional[int]] = [None] * len(keys)
+        disk_lookup: Dict[str, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                label = self._lru.get(key)
+                if label is not None:
+                    self._lru.move_to_end(key)
+                    results[i] = label
+                    self.memory_hits += 1
+                else:
+                    disk_lookup.setdefault(key, []).append(i)
+
+            if disk_lookup and self._conn is not None:
+                found = self._fetch_from_disk(list(disk_lookup))
+                for key, label in found.items():
+                    self._remember(key, label)
+                    for i in disk_lookup.pop(key):
+                        results[i] = label
+                        self.disk_hits += 1
+
+            self.misses += sum(len(indices) for indices in disk_lookup.values())
+        return results
+
+    def put_many(self, items: Dict[str, int]):
+        """
+        {key: sentiment_id} 저장 (분류 실패(-1) 결과는 저장하지 않음)
+        """
+        items = {key: label for key, label in items.items() if label != -1}
+        if not items:
+            return
+        with self._lock:
+            for key, label in items.items():
+                self._remember(key, label)
+            if self._conn is not None:
+                now = datetime.now().isoformat()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache (key, model_id, sentiment_id, created_at) VALUES (?, ?, ?, ?)",
+                    [(key, self.model_id, label, now) for key, label in items.items()]
+                )
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_size": len(self._lru),
+        }
+
+    def _remember(self, key: str, label: int):
+        self._lru[key] = label
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def _fetch_from_disk(self, keys: List[str]) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        # SQLite 바인딩 변수 개수 제한을 피하기 위해 나눠서 조회
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, sentiment_id FROM sentiment_cache WHERE model_id = ? AND key IN ({placeholders})",
+                [self.model_id, *batch]
+            ).fetchall()
+            found.update(rows)
+        return found
@@ -0,0 +1,64 @@
+# app/analyzer/export_onnx.py
+#
+# 기존 KcELECTRA TF 체크포인트에서 ONNX / int8 양자화 ONNX 모델 생성
+#
+# 사용법: python -m app.analyzer.export_onnx --model-dir ./asset/kcelectra-base-DC
+
+import os
+import argparse
+import logging
+
+from app.analyzer.backends import ONNX_FILES
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def export_onnx(model_dir: str, opset: int = 13) -> str:
+    import tensorflow as tf
+    import tf2onnx
+    from transformers import TFElectraForSequenceClassification
+
+    model = TFElectraForSequenceClassification.from_pretrained(model_dir, num_labels=2)
+    # 배치 크기 / 문장 길이는 가변으로 export
+    input_signature = [
+        tf.TensorSpec([None, None], tf.int32, name="input_ids"),
+        tf.TensorSpec([None, None], tf.int32, name="attention_mask"),
+        tf.TensorSpec([None, None], tf.int32, name="token_type_ids"),
+    ]
+
+    @tf.function(input_signature=input_signature)
+    def serving(input_ids, attention_mask, token_type_ids):
+        return model(
+            input_ids=input_ids,
+            attention_mask=attention_mask,
+            token_type_ids=token_type_ids,
+            training=False
+        ).logits
+
+    output_path = os.path.join(model_dir, ONNX_FILES["onnx"])
+    tf2onnx.convert.from_function(serving, input_signature=input_signature, opset=opset, output_path=output_path)
+    logger.info(f"[EXPORT] ONNX 저장 완료: {output_path}")
+    return output_path
+
+
+def quantize_onnx(model_dir: str) -> str:
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    input_path = os.path.join(model_dir, ONNX_FILES["onnx"])
+    output_path = os.path.join(model_dir, ONNX_FILES["onnx-int8"])
+    quantize_dynamic(input_path, output_path, weight_type=QuantType.QInt8)
+    logger.info(f"[EXPORT] int8 양자화 ONNX 저장 완료: {output_path}")
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KcELECTRA TF 체크포인트 → ONNX / int8 ONNX 변환")
+    parser.add_argument("--model-dir", default="./asset/kcelectra-base-DC", help="TF 체크포인트 디렉토리")
+    parser.add_argument("--opset", type=int, default=13, help="ONNX opset 버전")
+    parser.add_argument("--skip-quantize", action="store_true", help="int8 양자화 모델은 만들지 않음")
+    args = parser.parse_args()
+
+    export_onnx(args.model_dir, opset=args.opset)
+    if not args.skip_quantize:
+        quantize_onnx(args.model_dir)
@@ -0,0 +1,149 @@
+from collections import deque
+from typing import Dict, List, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick (C 구현), 없으면 순수 파이썬 오토마톤 사용
+except ImportError:
+    ahocorasick = None
+
+# 속성(aspect) 사전: 순서가 곧 aspect_id (1~5)
+ASPECT_KEYWORDS: Dict[str, List[str]] = {
+    '맛': ['맛있', '달달', '단맛', '짠맛', '맛임', '감칠맛', '매워', '짠', '설탕',
+         '단짠', '밍밍', '매콤', '상큼', '비릿', '인공적', '당충전', '느끼'],
+    '식감': ['식감', '쫀득', '쫀득함', '바삭', '퍽퍽', '부드러움', '쫀쫀함', '촉촉',
+          '질겨', '씹싸름', '빠삭', '겉바속촉', '꾸덕', '미끌', '속쫀', '뻑뻑', '사르르'],
+    '기타': ['포장', '디자인', '스타일', '편의점', '사진', '인스타', '브랜드', '컬러',
+          '비주', '비주얼', '선물', '리뉴얼', 'CU', 'GS', '세븐', '세븐일레븐',
+          '지에스', '씨유', '이마트', '노브랜드', '이마트24', '배민', 'B마트',
+          '비마트', '팝업', '미니스톱'],
+    '가격': ['가격', '가성', '할인', '가성비', '부담', '대비', '싸구려', '가격에비해',
+          '비싸여', '넘비싸', '이딴게', '가심비', '이가격', '합리적'],
+    '주관적평가': ['감동', '행복', '만족', '대박', '최고', '실망', '아쉽', '아쉬운', '추천',
+                '진심', '감탄', '존맛', '비추', '느낌', '퀄리티', '재구매', '강추',
+                '굿굿', '중독성', '개존맛']
+}
+
+# (label_idx, keyword_idx, keyword_length)
+_Output = Tuple[int, int, int]
+
+
+class AspectMatcher:
+    """
+    속성 사전 전체를 하나의 Aho-Corasick 오토마톤으로 컴파일하여
+    문장을 한 번만 스캔하고 매칭된 모든 속성과 근거 키워드를 반환합니다.
+
+    근거 키워드는 기존 라벨별 정규식(`'|'.join(keywords)` + findall)과 같은 규칙으로 고릅니다.
+    (같은 위치에서는 사전에 먼저 나온 키워드 우선, 겹치지 않게 왼쪽부터)
+    """
+
+    def __init__(self, keyword_dict: Dict[str, List[str]] = ASPECT_KEYWORDS, ignore_case: bool = True):
+        self.labels: List[str] = list(keyword_dict.keys())
+        self.ignore_case = ignore_case
+
+        entries: Dict[str, List[_Output]] = {}
+        for label_idx, keywords in enumerate(keyword_dict.values()):
+            for kw_idx, keyword in enumerate(keywords):
+                key = self._normalize(keyword)
+                entries.setdefault(key, []).append((label_idx, kw_idx, len(key)))
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for key, outputs in entries.items():
+                self._automaton.add_word(key, tuple(outputs))
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build_trie(entries)
+
+    def _normalize(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        # 길이가 바뀌는 소문자 변환(예: 'İ')은 건너뛰어 원문 위치를 그대로 유지
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    def _build_trie(self, entries: Dict[str, List[_Output]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[_Output]] = [[]]
+
+        for key, outputs in entries.items():
+            node = 0
+            for ch in key:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].extend(outputs)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _collect(self, haystack: str) -> List[Tuple[int, int, int, int]]:
+        """
+        (label_idx, start, keyword_idx, end) 매칭 목록을 한 번의 스캔으로 수집
+        """
+        if self._automaton is not None:
+            return [
+                (label_idx, end_idx + 1 - length, kw_idx, end_idx + 1)
+                for end_idx, outputs in self._automaton.iter(haystack)
+                for label_idx, kw_idx, length in outputs
+            ]
+
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = []
+        node = 0
+        for i, ch in enumerate(haystack):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                hits.extend((label_idx, i + 1 - length, kw_idx, i + 1) for label_idx, kw_idx, length in out[node])
+        return hits
+
+    def match(self, text: str, first_only: bool = False) -> Dict[str, List[str]]:
+        """
+        문장에서 매칭된 속성별 근거 키워드를 사전 순서대로 반환
+        - first_only=True: 사전 순서상 첫 번째로 매칭된 속성 하나만 반환 (기존 동작 호환)
+        """
+        hits = self._collect(self._normalize(text))
+        if not hits:
+            return {}
+        if first_only:
+            first_label = min(hits)[0]
+            hits = [hit for hit in hits if hit[0] == first_label]
+
+        # (라벨, 시작 위치, 사전 순서) 로 정렬하면 라벨별로 왼쪽부터,
+        # 같은 위치에서는 사전에 먼저 나온 키워드가 앞에 오므로 한 번의 순회로 선택 가능
+        hits.sort()
+        result: Dict[str, List[str]] = {}
+        current_label = -1
+        pos = 0
+        keywords: List[str] = []
+        for label_idx, start, _, end in hits:
+            if label_idx != current_label:
+                if keywords:
+                    result[self.labels[current_label]] = list(dict.fromkeys(keywords))
+                    if first_only:
+                        return result
+                current_label, pos, keywords = label_idx, 0, []
+            if start < pos:
+                continue
+            keywords.append(text[start:end])
+            pos = end
+        result[self.labels[current_label]] = list(dict.fromkeys(keywords))
+        return result
@@ -0,0 +1,134 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# 단계 이름 → AnalysisBatchMetrics 의 {stage}_seconds 컬럼
+STAGES = ("fetch", "clean", "split", "aspect", "inference", "write")
+
+# 배치별 건수 지표 (AnalysisBatchMetrics 컬럼과 이름이 같음)
+COUNTERS = (
+    "items_fetched", "texts_cleaned", "texts_rejected", "sentences_split",
+    "aspect_hits", "sentences_classified", "cache_hits", "results_saved",
+)
+
+
+class BatchMetrics:
+    """
+    분석 배치 하나의 단계별 처리 시간/건수
+    - Analyzer / AnalysisService 가 단계마다 timer() 와 add() 로 기록하고,
+      process_chunk 가 배치 커밋 시 AnalysisBatchMetrics 행으로 함께 저장
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.counts: Dict[str, int] = {name: 0 for name in COUNTERS}
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] += time.perf_counter() - start
+
+    def add(self, name: str, value: int = 1):
+        self.counts[name] += value
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.seconds.values())
+
+    @property
+    def sentences_per_second(self) -> float:
+        return self.counts["aspect_hits"] / self.total_seconds if self.total_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            **self.counts,
+            **{f"{stage}_seconds": round(seconds, 4) for stage, seconds in self.seconds.items()},
+            "total_seconds": round(self.total_seconds, 4),
+            "sentences_per_second": round(self.sentences_per_second, 2),
+        }
+
+
+def render_prometheus(totals: Dict[str, float], last: Optional[Dict[str, float]], batch_count: int) -> str:
+    """
+    AnalysisBatchMetrics 집계값을 Prometheus text exposition format 으로 변환
+    - totals : 전체 배치 합계 (counter)
+    - last   : 가장 최근 배치 값 (gauge), 배치가 없으면 None
+    """
+    lines: List[str] = [
+        "# HELP analysis_batches_total 커밋된 분석 배치 수",
+        "# TYPE analysis_batches_total counter",
+        f"analysis_batches_total {batch_count}",
+    ]
+
+    for name in COUNTERS:
+        lines += [
+            f"# HELP analysis_{name}_total 분석 배치 누적 {name}",
+            f"# TYPE analysis_{name}_total counter",
+            f"analysis_{name}_total {int(totals.get(name) or 0)}",
+        ]
+
+    lines += [
+        "# HELP analysis_stage_seconds_total 단계별 누적 처리 시간",
+        "# TYPE analysis_stage_seconds_total counter",
+    ]
+    lines += [
+        f'analysis_stage_seconds_total{{stage="{stage}"}} {float(totals.get(f"{stage}_seconds") or 0):.6f}'
+        for stage in STAGES
+    ]
+
+    if last is not None:
+        lines += [
+            "# HELP analysis_last_batch_stage_seconds 가장 최근 배치의 단계별 처리 시간",
+            "# TYPE analysis_last_batch_stage_seconds gauge",
+        ]
+        lines += [
+            f'analysis_last_batch_stage_seconds{{stage="{stage}"}} {float(last.get(f"{stage}_seconds") or 0):.6f}'
+            for stage in STAGES
+        ]
+        lines += [
+            "# HELP analysis_last_batch_sentences_per_second 가장 최근 배치 처리량",
+            "# TYPE analysis_last_batch_sentences_per_second gauge",
+            f"analysis_last_batch_sentences_per_second {float(last.get('sentences_per_second') or 0):.3f}",
+            "# HELP analysis_last_batch_timestamp_seconds 가장 최근 배치 커밋 시각 (unix time)",
+            "# TYPE analysis_last_batch_timestamp_seconds gauge",
+            f"analysis_last_batch_timestamp_seconds {float(last.get('timestamp') or 0):.0f}",
+        ]
+
+    return "\n".join(lines) + "\n"
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_registry_prometheus(stats: List[Dict]) -> str:
+    """
+    ModelRegistry.stats() 를 Prometheus text exposition format 으로 변환 (이 프로세스에 로딩된 Analyzer 별 gauge)
+    - 로딩/워밍업 시간, 로딩 전후 RSS 증가량(psutil 이 없으면 생략), 로딩 시각
+    """
+    gauges = [
+        ("analysis_model_load_seconds", "모델 로딩 시간", lambda s: s["load_seconds"]),
+        ("analysis_model_warmup_seconds", "모델 워밍업 시간", lambda s: s["warmup_seconds"]),
+        ("analysis_model_warmup_size", "모델 워밍업 배치 크기", lambda s: s["warmup_size"]),
+        (
+            "analysis_model_memory_bytes", "모델 로딩 전후 RSS 증가량",
+            lambda s: s["memory_mb"] * 1024 * 1024 if s["memory_mb"] is not None else None
+        ),
+        ("analysis_model_loaded_timestamp_seconds", "모델 로딩 시각 (unix time)", lambda s: s["loaded_at"]),
+    ]
+
+    lines: List[str] = []
+    for name, help_text, value_of in gauges:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        for s in stats:
+            value = value_of(s)
+            if value is None:
+                continue
+            options = ",".join(f"{key}={option}" for key, option in sorted(s["options"].items()))
+            labels = f'backend="{_label(s["backend"])}",model_dir="{_label(s["model_dir"])}",options="{_label(options)}"'
+            lines.append(f"{name}{{{labels}}} {float(value):.3f}")
+
+    return "\n".join(lines) + "\n"
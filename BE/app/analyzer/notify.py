@@ -0,0 +1,79 @@
+import time
+import select
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.db import engine
+
+logger = logging.getLogger(__name__)
+
+# 새 미분석 행이 저장되었음을 분석 데몬(app.analyzer.worker)에 알리는 PostgreSQL 채널
+UNANALYZED_CHANNEL = "unanalyzed_content"
+
+
+def notify_unanalyzed(db: Session, table_name: str, count: int):
+    """
+    커밋 직전, 같은 트랜잭션 안에서 호출
+    - NOTIFY 는 커밋될 때 전달되고 롤백되면 버려지므로, 데몬은 항상 커밋된 행만 보게 됨
+    - 같은 트랜잭션 안의 동일한 알림은 PostgreSQL 이 하나로 합쳐서 전달
+    """
+    if count:
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": UNANALYZED_CHANNEL, "payload": table_name})
+
+
+class NotificationListener:
+    """
+    PostgreSQL LISTEN 전용 연결 (분석 데몬, 크롤링 워커 공용)
+    - 연결/LISTEN 에 실패하면 available = False 가 되고 wait() 는 timeout 동안 대기만 함 (polling fallback)
+    """
+
+    def __init__(self, channel: str = UNANALYZED_CHANNEL):
+        self.channel = channel
+        self._conn: Optional[Connection] = None
+        self._raw = None
+        try:
+            self._conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            self._conn.exec_driver_sql(f"LISTEN {channel}")
+            self._raw = self._conn.connection.driver_connection
+            logger.info(f"[LISTEN] {channel}")
+        except Exception as e:
+            logger.warning(f"[LISTEN] {self.channel} 실패, polling 으로 동작합니다: {e}")
+            self.close()
+
+    @property
+    def available(self) -> bool:
+        return self._raw is not None
+
+    def wait(self, timeout: float) -> bool:
+        """
+        알림이 오거나 timeout 이 지날 때까지 대기, 알림을 받았으면 True
+        """
+        if not self.available:
+            time.sleep(max(timeout, 0))
+            return False
+        try:
+            if select.select([self._raw], [], [], max(timeout, 0)) == ([], [], []):
+                return False
+            self._raw.poll()
+            received = bool(self._raw.notifies)
+            self._raw.notifies.clear()
+            return received
+        except Exception as e:
+            logger.warning(f"[LISTEN] {self.channel} 연결 오류, polling 으로 전환합니다: {e}")
+            self.close()
+            return False
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                # 풀로 돌아간 연결이 계속 알림을 쌓지 않도록 해제
+                self._conn.exec_driver_sql("UNLISTEN *")
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._raw = None
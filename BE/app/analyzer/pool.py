@@ -0,0 +1,127 @@
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스마다 한 번만 로딩되는 Analyzer
+_analyzer = None
+
+
+def _init_worker(threads_per_worker: int):
+    """
+    워커 시작 시 1회 실행: 스레드 수 제한 후 모델 로딩
+    (워커 N개가 각자 모든 코어를 쓰려고 하면 오히려 느려지므로 코어를 나눠 가짐)
+    """
+    global _analyzer
+    for name in ("OMP_NUM_THREADS", "TF_NUM_INTRAOP_THREADS", "ANALYZER_INTRA_OP_THREADS"):
+        os.environ.setdefault(name, str(threads_per_worker))
+    os.environ.setdefault("TF_NUM_INTEROP_THREADS", "1")
+
+    from app.analyzer.services import build_analyzer
+    _analyzer = build_analyzer()
+    logger.info(f"[WORKER] pid={os.getpid()} 모델 로딩 완료")
+
+
+def _analyze_chunk(log_id: int, table_name: str, ids: List) -> Dict[str, int]:
+    """
+    워커에서 실행: id chunk를 자기 세션으로 조회 → 분석 → 저장 → 커밋
+    """
+    from app.core.db import SessionLocal
+    from app.analyzer.metrics import BatchMetrics
+    from app.analyzer.services import AnalysisService
+
+    db = SessionLocal()
+    try:
+        service = AnalysisService(db, analyzer=_analyzer)
+        metrics = BatchMetrics()
+        with metrics.timer("fetch"):
+            items = service.repo.get_unanalyzed_by_ids(table_name, ids)
+        analyzed_count = service.process_chunk(log_id, items, metrics=metrics) if items else 0
+        return {"source_count": len(items), "analyzed_count": analyzed_count}
+    finally:
+        db.close()
+
+
+class AnalysisWorkerPool:
+    """
+    Analyzer 모델을 미리 올려둔 워커 프로세스 N개에 id chunk를 나눠주는 풀
+    - 작업 큐는 ProcessPoolExecutor 내부 큐를 사용하고, 메인 프로세스는 최대 max_pending 개까지만 미리 넣음
+    - chunk 하나가 실패해도 나머지는 계속 진행 (실패한 chunk는 is_analyzed = false 로 남아 다음 실행 때 재처리)
+    - 워커 프로세스가 죽으면(BrokenProcessPool) 풀을 다시 만들고 이어서 진행
+    """
+
+    def __init__(self, workers: int, max_pending: Optional[int] = None):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending or self.workers * 2
+        self.threads_per_worker = max(1, (os.cpu_count() or 1) // self.workers)
+        self._context = multiprocessing.get_context("spawn")  # TF/ORT 는 fork 후 사용 불가
+        self._executor = self._new_executor()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,)
+        )
+
+    def __enter__(self) -> "AnalysisWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, log_id: int, id_chunks: Iterable[Tuple[str, List]]) -> Dict[str, int]:
+        summary = {"source_count": 0, "analyzed_count": 0, "chunk_count": 0, "failed_chunks": 0}
+        chunks = iter(id_chunks)
+        pending = {}
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < self.max_pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                table_name, ids = chunk
+                pending[self._executor.submit(_analyze_chunk, log_id, table_name, ids)] = chunk
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                table_name, ids = pending.pop(future)
+                summary["chunk_count"] += 1
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    summary["failed_chunks"] += 1
+                    logger.error(f"[POOL ERROR] 워커 프로세스 종료로 chunk 실패: {table_name} ({len(ids)}건)")
+                except Exception as e:
+                    summary["failed_chunks"] += 1
+                    logger.error(f"[POOL ERROR] chunk 실패: {table_name} ({len(ids)}건): {e}")
+                else:
+                    summary["source_count"] += result["source_count"]
+                    summary["analyzed_count"] += result["analyzed_count"]
+
+            if broken:
+                # 깨진 풀에 남은 작업은 모두 실패로 처리하고 새 풀로 이어서 진행
+                summary["chunk_count"] += len(pending)
+                summary["failed_chunks"] += len(pending)
+                pending.clear()
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+
+            logger.info(
+                f"[POOL] 완료 chunk {summary['chunk_count']} (실패 {summary['failed_chunks']}), "
+                f"누적 {summary['source_count']}개 아이템"
+            )
+
+        return summary
@@ -0,0 +1,96 @@
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.analyzer.analyzer import Analyzer
+
+logger = logging.getLogger(__name__)
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss
+    except Exception:
+        return None
+
+
+class ModelRegistry:
+    """
+    프로세스 전역 Analyzer 레지스트리
+    - (model_dir, backend, Analyzer 생성 인자) 별로 처음 요청될 때 한 번만 로딩
+      (cache_path, split_backend 등이 다른 요청은 다른 Analyzer 를 받음)
+    - 로딩 직후 warmup 배치를 돌려 첫 실제 요청이 초기화 비용을 내지 않도록 함
+      (이미 로딩된 Analyzer 를 더 큰 warmup_size 로 요청하면 그 크기로 한 번 더 워밍업)
+    - 로딩/워밍업 시간과 로딩 전후 RSS 증가량을 기록
+    """
+
+    def __init__(self):
+        self._analyzers: Dict[Tuple, Analyzer] = {}
+        self._stats: Dict[Tuple, Dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(model_dir: str, backend: str, analyzer_kwargs: Dict[str, Any]) -> Tuple:
+        return (
+            os.path.abspath(model_dir) if os.path.isdir(model_dir) else model_dir,
+            backend,
+            tuple(sorted(analyzer_kwargs.items()))
+        )
+
+    def _warmup(self, analyzer: Analyzer, warmup_size: int) -> float:
+        start = time.perf_counter()
+        analyzer.warmup(batch_size=warmup_size)
+        return time.perf_counter() - start
+
+    def get(self, model_dir: str, backend: str = "tf", warmup_size: int = 0, **analyzer_kwargs) -> Analyzer:
+        key = self._key(model_dir, backend, analyzer_kwargs)
+        analyzer = self._analyzers.get(key)
+        if analyzer is not None and self._stats[key]["warmup_size"] >= warmup_size:
+            return analyzer
+
+        with self._lock:
+            analyzer = self._analyzers.get(key)
+            if analyzer is not None:
+                if self._stats[key]["warmup_size"] < warmup_size:
+                    self._stats[key]["warmup_seconds"] = round(self._warmup(analyzer, warmup_size), 3)
+                    self._stats[key]["warmup_size"] = warmup_size
+                return analyzer
+
+            rss_before = _rss_bytes()
+            start = time.perf_counter()
+            analyzer = Analyzer(model_dir=model_dir, backend=backend, **analyzer_kwargs)
+            load_seconds = time.perf_counter() - start
+
+            warmup_seconds = self._warmup(analyzer, warmup_size) if warmup_size > 0 else 0.0
+
+            rss_after = _rss_bytes()
+            memory_mb = (rss_after - rss_before) / 1024 / 1024 if rss_before is not None and rss_after is not None else None
+
+            self._stats[key] = {
+                "model_dir": model_dir,
+                "backend": backend,
+                "options": dict(analyzer_kwargs),
+                "warmup_size": warmup_size,
+                "load_seconds": round(load_seconds, 3),
+                "warmup_seconds": round(warmup_seconds, 3),
+                "memory_mb": round(memory_mb, 1) if memory_mb is not None else None,
+                "loaded_at": time.time(),
+            }
+            self._analyzers[key] = analyzer
+            logger.info(
+                f"[REGISTRY] 모델 로딩 완료 ({backend}, {model_dir}): "
+                f"load {load_seconds:.2f}s, warmup {warmup_seconds:.2f}s, memory {self._stats[key]['memory_mb']}MB"
+            )
+            return analyzer
+
+    def is_loaded(self, model_dir: str, backend: str = "tf", **analyzer_kwargs) -> bool:
+        return self._key(model_dir, backend, analyzer_kwargs) in self._analyzers
+
+    def stats(self) -> List[Dict]:
+        return list(self._stats.values())
+
+
+registry = ModelRegistry()
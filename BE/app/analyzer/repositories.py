@@ -1,8 +1,16 @@
-from app.models import InstizPosts, InstizComments, TiktokComments, YoutubeComments, ContentAnalysis, AnalysisLogs
+from app.models import InstizPosts, InstizComments, TiktokComments, YoutubeComments, ContentAnalysis, AnalysisLogs, AnalysisBatchMetrics
+from sqlalchemy import insert, update, bindparam, any_, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 from app.analyzer.factory import AdapterFactory
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
+from app.analyzer.interfaces import Analyzable
+from app.analyzer.metrics import BatchMetrics, COUNTERS, STAGES
+
+# 분석 대상 원본 테이블 (순회 순서)
+UNANALYZED_MODELS = (InstizPosts, InstizComments, TiktokComments, YoutubeComments)
+
 
 class AnalysisRepository:
     def __init__(self, db: Session):
@@ -33,6 +41,76 @@ class AnalysisRepository:
         combined += self.get_unanalyzed_youtube_comments()
         return combined
 
+    def iter_unanalyzed_chunks(self, chunk_size: int = 1000) -> Iterator[List[Analyzable]]:
+        """
+        미분석 데이터를 테이블별로 id 기준 keyset pagination 하여 chunk_size 단위로 반환
+        - 호출 측에서 chunk를 분석/저장/커밋한 뒤 다음 chunk를 요청해야 함
+        - 커밋된 chunk는 is_analyzed = True 가 되므로, 중단 후 재실행 시 남은 행부터 이어서 처리
+        """
+        for model in UNANALYZED_MODELS:
+            last_id = None
+            while True:
+                query = self.db.query(model).filter(model.is_analyzed == False)
+                if last_id is not None:
+                    query = query.filter(model.id > last_id)
+                rows = query.order_by(model.id).limit(chunk_size).all()
+                if not rows:
+                    break
+
+                last_id = rows[-1].id
+                yield [self.factory.wrap(r) for r in rows]
+
+                if len(rows) < chunk_size:
+                    break
+
+    def iter_unanalyzed_id_chunks(self, chunk_size: int = 1000) -> Iterator[Tuple[str, List]]:
+        """
+        iter_unanalyzed_chunks 와 같은 순서로 (테이블명, id 목록) 만 반환
+        - 워커 프로세스에 chunk를 나눠줄 때 사용 (ORM 객체를 프로세스 간에 넘기지 않음)
+        """
+        for model in UNANALYZED_MODELS:
+            last_id = None
+            while True:
+                query = self.db.query(model.id).filter(model.is_analyzed == False)
+                if last_id is not None:
+                    query = query.filter(model.id > last_id)
+                ids = [row.id for row in query.order_by(model.id).limit(chunk_size).all()]
+                if not ids:
+                    break
+
+                last_id = ids[-1]
+                yield model.__tablename__, ids
+
+                if len(ids) < chunk_size:
+                    break
+
+    def get_unanalyzed_after(self, cursors: Dict[str, object], limit: int = 64) -> List[Analyzable]:
+        """
+        테이블 순서대로 cursors[테이블명] 이후의 미분석 행을 최대 limit 개 반환하고 cursor 를 전진
+        - 분석 데몬이 아직 커밋하지 않은 행을 다시 가져오지 않도록 호출 측에서 같은 cursors 를 유지
+        - 모든 테이블을 다 읽었으면 빈 리스트
+        """
+        for model in UNANALYZED_MODELS:
+            query = self.db.query(model).filter(model.is_analyzed == False)
+            last_id = cursors.get(model.__tablename__)
+            if last_id is not None:
+                query = query.filter(model.id > last_id)
+            rows = query.order_by(model.id).limit(limit).all()
+            if rows:
+                cursors[model.__tablename__] = rows[-1].id
+                return [self.factory.wrap(r) for r in rows]
+        return []
+
+    def get_unanalyzed_by_ids(self, table_name: str, ids: List) -> List[Analyzable]:
+        model = next(m for m in UNANALYZED_MODELS if m.__tablename__ == table_name)
+        rows = (
+            self.db.query(model)
+            .filter(model.id.in_(ids), model.is_analyzed == False)
+            .order_by(model.id)
+            .all()
+        )
+        return [self.factory.wrap(r) for r in rows]
+
     # ✅ 배치 로그 시작
     def start_analysis_log(self) -> int:
         log = AnalysisLogs(started_at=datetime.utcnow())
@@ -48,8 +126,34 @@ class AnalysisRepository:
             log.finished_at = datetime.now()
             self.db.commit()
 
+    # ✅ 배치 단계별 지표 저장 (커밋은 호출 측에서, 분석 결과와 같은 트랜잭션)
+    def create_batch_metrics(self, log_id: int, metrics: BatchMetrics):
+        self.db.add(AnalysisBatchMetrics(
+            analysis_log_id=log_id,
+            created_at=datetime.now(),
+            **metrics.as_dict()
+        ))
+
+    def get_batch_metrics_summary(self) -> Tuple[int, Dict[str, float], Optional[Dict[str, float]]]:
+        """
+        (배치 수, 전체 합계, 가장 최근 배치) 반환 — Prometheus /metrics 용
+        """
+        columns = [*COUNTERS, *(f"{stage}_seconds" for stage in STAGES)]
+        row = self.db.query(
+            func.count(AnalysisBatchMetrics.id),
+            *(func.sum(getattr(AnalysisBatchMetrics, name)) for name in columns)
+        ).one()
+        batch_count, totals = row[0], dict(zip(columns, row[1:]))
+
+        latest = self.db.query(AnalysisBatchMetrics).order_by(AnalysisBatchMetrics.id.desc()).first()
+        last = None
+        if latest is not None:
+            last = {name: getattr(latest, name) for name in (*columns, "sentences_per_second")}
+            last["timestamp"] = latest.created_at.timestamp() if latest.created_at else 0
+        return batch_count, totals, last
+
     # ✅ 분석 결과 다건 저장
-    def create_content_analysis_results(self, log_id: int, results: List[Dict]):
+    def create_content_analysis_results(self, log_id: int, results: List[Dict], commit: bool = True):
         for r in results:
             self.db.add(ContentAnalysis(
                 analysis_log_id=log_id,
@@ -60,13 +164,55 @@ class AnalysisRepository:
                 aspect_id=r["aspect_id"],
                 evidence_keywords=",".join(r["evidence_keywords"])
             ))
-        self.db.commit()
+        if commit:
+            self.db.commit()
 
-    def mark_as_analyzed(self, original_objects: List[object]):
+    def mark_as_analyzed(self, original_objects: List[object], commit: bool = True):
         """
         분석된 원본 객체들의 is_analyzed 플래그를 True로 설정
         """
         for obj in original_objects:
             if hasattr(obj, "is_analyzed"):
                 obj.is_analyzed = True
-        self.db.commit()
\ No newline at end of file
+        if commit:
+            self.db.commit()
+
+    # ✅ 분석 결과 bulk 저장 (multi-row INSERT, 커밋은 호출 측에서)
+    def bulk_create_content_analysis_results(self, log_id: int, results: List[Dict]) -> int:
+        if not results:
+            return 0
+        self.db.execute(
+            insert(ContentAnalysis),
+            [
+                {
+                    "analysis_log_id": log_id,
+                    "source_type": r["source_type"],
+                    "source_id": r["source_id"],
+                    "sentence": r["sentence"],
+                    "sentiment_id": r["sentiment_id"],
+                    "aspect_id": r["aspect_id"],
+                    "evidence_keywords": ",".join(r["evidence_keywords"])
+                }
+                for r in results
+            ]
+        )
+        return len(results)
+
+    def bulk_mark_as_analyzed(self, source_ids: Dict[str, List]) -> int:
+        """
+        테이블명별 id 목록을 받아 테이블당 한 번의
+        UPDATE ... SET is_analyzed = true WHERE id = ANY(:ids) 를 실행 (커밋은 호출 측에서)
+        """
+        updated = 0
+        for model in UNANALYZED_MODELS:
+            ids = source_ids.get(model.__tablename__)
+            if not ids:
+                continue
+            stmt = (
+                update(model)
+                .where(model.id == any_(bindparam("ids", type_=ARRAY(model.id.type))))
+                .values(is_analyzed=True)
+                .execution_options(synchronize_session=False)
+            )
+            updated += self.db.execute(stmt, {"ids": list(ids)}).rowcount
+        return updated
@@ -1,36 +1,86 @@
+import logging
+from collections import defaultdict
 from datetime import datetime
+from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 from app.analyzer.analyzer import Analyzer
+from app.analyzer.interfaces import Analyzable
+from app.analyzer.metrics import BatchMetrics, STAGES
+from app.analyzer.registry import registry
 from app.analyzer.repositories import AnalysisRepository
+from app.core.config import settings
 from app.models import ContentAnalysis
 
+logger = logging.getLogger(__name__)
+
+
+def build_analyzer() -> Analyzer:
+    """
+    설정값 기준 Analyzer 를 프로세스 전역 레지스트리에서 가져옴 (최초 1회만 로딩 + 워밍업)
+    """
+    return registry.get(
+        settings.ANALYZER_MODEL_DIR,
+        backend=settings.ANALYZER_BACKEND,
+        warmup_size=settings.ANALYZER_WARMUP_SIZE,
+        cache_path=settings.SENTIMENT_CACHE_PATH or None,
+        cache_size=settings.SENTIMENT_CACHE_SIZE,
+        split_backend=settings.ANALYZER_SPLIT_BACKEND,
+        split_workers=settings.ANALYZER_SPLIT_WORKERS
+    )
+
 
 class AnalysisService:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = settings.ANALYSIS_BATCH_SIZE,
+        chunk_size: int = settings.ANALYSIS_CHUNK_SIZE,
+        analyzer: Optional[Analyzer] = None
+    ):
         self.db = db
         self.repo = AnalysisRepository(db)
-        self.analyzer = Analyzer()
-
-    def run_batch_analysis(self):
-        # 1. 로그 시작 시간 기록
-        started_at = datetime.now()
-        log_id = self.repo.start_analysis_log()
+        self._analyzer = analyzer
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
 
-        # 2. 분석할 데이터 가져오기
-        unanalyzed_items = self.repo.get_all_unanalyzed()
+    @property
+    def analyzer(self) -> Analyzer:
+        # 모델 로딩은 실제 분석 시점까지 미룸 (run_parallel_analysis 에서는 워커만 로딩)
+        if self._analyzer is None:
+            self._analyzer = build_analyzer()
+        return self._analyzer
 
-        all_results = []
+    def analyze_items(
+        self,
+        log_id: int,
+        items: List[Analyzable],
+        candidates_per_text: Optional[List[List[Dict]]] = None,
+        metrics: Optional[BatchMetrics] = None
+    ) -> List[Dict]:
+        """
+        아이템 묶음을 한 번에 전처리 후 문장 단위 배치 추론하고,
+        결과를 source_type/source_id 별 ContentAnalysis 저장 형식으로 변환
+        (candidates_per_text 를 넘기면 이미 끝난 전처리 결과를 그대로 사용)
+        """
+        if candidates_per_text is None:
+            batch_results = self.analyzer.run_batch(
+                [item.content for item in items],
+                batch_size=self.batch_size,
+                metrics=metrics
+            )
+        else:
+            batch_results = self.analyzer.classify_candidates(
+                candidates_per_text, batch_size=self.batch_size, metrics=metrics
+            )
 
-        for item in unanalyzed_items:
-            raw_text = item.content
+        results = []
+        for item, analysis_results in zip(items, batch_results):
             original = item.get_original()
             source_type = original.__table__.name
             source_id = str(original.id)
 
-            analysis_results = self.analyzer.run(raw_text)
-
             for result in analysis_results:
-                all_results.append({
+                results.append({
                     "analysis_log_id": log_id,
                     "source_type": source_type,
                     "source_id": source_id,
@@ -39,20 +89,103 @@ class AnalysisService:
                     "sentiment_id": result["sentiment_id"],
                     "evidence_keywords": result["evidence_keywords"]
                 })
+        return results
+
+    @staticmethod
+    def _group_source_ids(items: List[Analyzable]) -> Dict[str, List]:
+        source_ids = defaultdict(list)
+        for item in items:
+            original = item.get_original()
+            source_ids[original.__table__.name].append(original.id)
+        return source_ids
+
+    def process_chunk(
+        self,
+        log_id: int,
+        chunk: List[Analyzable],
+        candidates_per_text: Optional[List[List[Dict]]] = None,
+        metrics: Optional[BatchMetrics] = None
+    ) -> int:
+        """
+        chunk 하나를 분석 → 결과 저장 → is_analyzed 업데이트 → 단계별 지표 저장 → 커밋 (한 트랜잭션)
+        저장된 분석 결과 수를 반환, 실패 시 롤백 후 예외 전파
+        (조회 시간처럼 chunk 밖에서 잰 지표는 metrics 에 미리 기록해서 넘김)
+        """
+        metrics = metrics or BatchMetrics()
+        metrics.add("items_fetched", len(chunk))
+        try:
+            chunk_results = self.analyze_items(log_id, chunk, candidates_per_text, metrics)
+
+            with metrics.timer("write"):
+                # 3. 분석 결과 bulk 저장
+                self.repo.bulk_create_content_analysis_results(log_id, chunk_results)
+
+                # 4. 원본 is_analyzed 업데이트 (테이블당 UPDATE 1회)
+                self.repo.bulk_mark_as_analyzed(self._group_source_ids(chunk))
+            metrics.add("results_saved", len(chunk_results))
+
+            self.repo.create_batch_metrics(log_id, metrics)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        summary = metrics.as_dict()
+        logger.info(
+            f"[METRICS] log_id={log_id} items {summary['items_fetched']} "
+            f"(rejected {summary['texts_rejected']}) → sentences {summary['sentences_split']} → "
+            f"aspect {summary['aspect_hits']} → saved {summary['results_saved']} | "
+            + " ".join(f"{stage} {summary[f'{stage}_seconds']:.2f}s" for stage in STAGES)
+            + f" | {summary['sentences_per_second']:.1f} sentences/s"
+        )
+        return len(chunk_results)
+
+    def run_parallel_analysis(self, workers: int = settings.ANALYSIS_WORKERS):
+        """
+        워커 프로세스 풀로 미분석 데이터 분석 (app.analyzer.pool 참고)
+        - 이 프로세스는 id chunk만 나눠주고, 각 워커가 모델 로딩/분석/저장을 담당
+        """
+        from app.analyzer.pool import AnalysisWorkerPool
+
+        log_id = self.repo.start_analysis_log()
+        with AnalysisWorkerPool(workers=workers) as pool:
+            summary = pool.run(log_id, self.repo.iter_unanalyzed_id_chunks(chunk_size=self.chunk_size))
+        self.repo.finish_analysis_log(log_id=log_id)
+
+        return {"log_id": log_id, **summary}
+
+    def run_batch_analysis(self):
+        # 1. 로그 시작 시간 기록
+        started_at = datetime.now()
+        log_id = self.repo.start_analysis_log()
+
+        analyzed_count = 0
+        source_count = 0
+
+        # 2. 미분석 데이터를 chunk 단위로 가져와 분석 → 저장 → is_analyzed 업데이트 → 커밋
+        #    (커밋된 chunk까지는 중단되어도 다시 분석하지 않음)
+        chunks = self.repo.iter_unanalyzed_chunks(chunk_size=self.chunk_size)
+        while True:
+            metrics = BatchMetrics()
+            with metrics.timer("fetch"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
 
-        print(all_results)
-        # 3. 분석 결과 저장
-        if all_results:
-            self.repo.create_content_analysis_results(log_id, all_results)
+            try:
+                analyzed_count += self.process_chunk(log_id, chunk, metrics=metrics)
+            except Exception:
+                logger.exception(f"[CHUNK ERROR] chunk 처리 실패 (log_id={log_id}), 커밋된 chunk까지만 반영됨")
+                raise
 
-        # 4. 원본 is_analyzed 업데이트
-        self.repo.mark_as_analyzed([item.get_original() for item in unanalyzed_items])
+            source_count += len(chunk)
+            logger.info(f"[CHUNK] {len(chunk)}개 아이템 커밋 완료 (누적 {source_count}개)")
 
         # 5. 로그 종료 시간 기록
         self.repo.finish_analysis_log(log_id=log_id)
 
         return {
             "log_id": log_id,
-            "analyzed_count": len(all_results),
-            "source_count": len(unanalyzed_items)
+            "analyzed_count": analyzed_count,
+            "source_count": source_count
         }
@@ -0,0 +1,139 @@
+import re
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# kss 6.x 에서 지원하는 형태소 분석 백엔드 (auto: mecab 이 있으면 mecab, 없으면 pecab)
+KSS_BACKENDS = ("auto", "mecab", "pecab", "punct", "fast")
+
+# 문장 중간에 문장부호가 있으면 여러 문장일 수 있음 (끝에 붙은 문장부호는 제외)
+_INNER_BOUNDARY_PATTERN = re.compile(r"[.!?~…。]+(?=.*[^\s.!?~…。])")
+
+
+def is_single_sentence(text: str, max_chars: int = 30) -> bool:
+    """
+    kss 를 거치지 않아도 되는 '명백한 한 문장' 여부
+    - max_chars 이하이고 띄어쓰기/줄바꿈 없는 한 어절이며, 중간에 문장부호가 없을 때만 True
+      (kss 는 문장부호가 없어도 "맛있다ㅋㅋ 근데 비쌈" 처럼 어절 사이에서 문장을 나누므로 어절이 둘 이상이면 kss 에 맡김)
+    """
+    text = text.strip()
+    if len(text) > max_chars or any(c.isspace() for c in text):
+        return False
+    return not _INNER_BOUNDARY_PATTERN.search(text)
+
+
+def _kss_split(texts: List[str], backend: str) -> List[List[str]]:
+    """
+    kss 로 여러 텍스트를 한 번에 분리 (병렬화는 SentenceSplitter 가 담당하므로 kss 자체 워커는 1개)
+    - 묶음 전체가 실패하면 텍스트 하나씩 다시 시도하고, 그래도 실패한 텍스트는 빈 리스트
+    """
+    from kss import split_sentences
+
+    try:
+        return split_sentences(texts, backend=backend, num_workers=1)
+    except Exception:
+        results = []
+        for text in texts:
+            try:
+                results.append(split_sentences(text, backend=backend, num_workers=1))
+            except Exception as e:
+                logger.warning(f"[SPLIT ERROR] 문장 분리 실패: {e}")
+                results.append([])
+        return results
+
+
+class SentenceSplitter:
+    """
+    문장 분리 서비스
+    - 텍스트 목록을 chunk_size 씩 나눠 프로세스 풀에 분배 (workers=1 이면 현재 프로세스에서 처리)
+    - backend 로 kss 형태소 분석 백엔드 선택 (KSS_BACKENDS)
+    - fast_path_chars > 0 이면 그 이하 길이의 한 어절 텍스트는 kss 없이 그대로 반환 (기본값 0: 사용 안 함)
+    - 누적 처리량(texts/s)과 fast path 비율을 stats() 로 제공
+    """
+
+    def __init__(self, backend: str = "auto", workers: int = 1, chunk_size: int = 500, fast_path_chars: int = 0):
+        if backend not in KSS_BACKENDS:
+            raise ValueError(f"지원되지 않는 문장 분리 백엔드입니다: {backend} ({', '.join(KSS_BACKENDS)})")
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.fast_path_chars = fast_path_chars
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.text_count = 0
+        self.fast_path_count = 0
+        self.elapsed = 0.0
+
+    def split(self, text: str) -> List[str]:
+        return self.split_many([text])[0]
+
+    def split_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        입력 순서대로 텍스트별 문장 리스트 반환 (공백 문장 제거)
+        """
+        start = time.perf_counter()
+        results: List[List[str]] = [[] for _ in texts]
+        pending: List[int] = []
+        fast_count = 0
+
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if self.fast_path_chars and is_single_sentence(text, self.fast_path_chars):
+                results[i] = [text.strip()]
+                fast_count += 1
+            else:
+                pending.append(i)
+
+        if pending:
+            chunks = [pending[s:s + self.chunk_size] for s in range(0, len(pending), self.chunk_size)]
+            payloads = [[texts[i] for i in chunk] for chunk in chunks]
+            if self.workers > 1 and len(chunks) > 1:
+                outputs = self._get_executor().map(_kss_split, payloads, [self.backend] * len(payloads))
+            else:
+                outputs = (_kss_split(payload, self.backend) for payload in payloads)
+            for chunk, sentences_per_text in zip(chunks, outputs):
+                for i, sentences in zip(chunk, sentences_per_text):
+                    results[i] = [s.strip() for s in sentences if s.strip()]
+
+        elapsed = time.perf_counter() - start
+        self.text_count += len(texts)
+        self.fast_path_count += fast_count
+        self.elapsed += elapsed
+        if len(texts) > 1:
+            logger.info(
+                f"[SPLIT] {len(texts)}개 텍스트 분리 ({self.backend}, workers {self.workers}): "
+                f"{elapsed:.2f}s, {len(texts) / elapsed if elapsed else 0.0:.1f} texts/s "
+                f"(fast path {fast_count}개)"
+            )
+        return results
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "texts": self.text_count,
+            "fast_path": self.fast_path_count,
+            "seconds": round(self.elapsed, 3),
+            "texts_per_sec": self.text_count / self.elapsed if self.elapsed else 0.0,
+        }
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "SentenceSplitter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 부모 프로세스에 TF/ORT 가 로딩되어 있을 수 있으므로 fork 대신 spawn
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
@@ -0,0 +1,279 @@
+# app/analyzer/worker.py
+#
+# 상시 분석 데몬: python -m app.analyzer.worker
+# - 크롤러가 커밋하면서 보내는 NOTIFY(app.analyzer.notify)를 LISTEN 하다가 새 미분석 행이 생기면 깨어남
+# - LISTEN 을 쓸 수 없거나 알림을 놓쳐도 poll_interval 초마다 미분석 행을 확인
+# - 행을 가져오는 즉시 전처리(정제/문장 분리/속성 필터)하고, 후보 문장이 max_sentences 개 모이거나
+#   첫 행을 가져온 뒤 max_latency 초가 지나면 감성 분류 → 저장 → is_analyzed 업데이트를 한 트랜잭션으로 커밋
+# - SIGINT/SIGTERM 을 받으면 새 행은 더 가져오지 않고, 모아둔 마이크로 배치까지 커밋한 뒤 종료
+#   (커밋 전에 프로세스가 죽어도 해당 행은 is_analyzed = false 로 남아 다음 실행 때 다시 처리)
+# - 배치 처리가 실패하면 반으로 나눠 다시 처리해서 실패하는 행만 골라내고, 나머지 행은 그대로 커밋
+#   혼자서 max_failures 번 실패한 행은 격리해 이 프로세스에서는 더 가져오지 않음 (행 하나 때문에 데몬이 멈추지 않도록)
+# - DB 연결 장애(OperationalError 등)는 행의 문제가 아니므로 배치를 나누거나 실패 횟수를 올리지 않고,
+#   대기 시간을 늘려가며 아직 커밋하지 못한 아이템을 그대로 다시 처리
+
+import signal
+import time
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.analyzer.interfaces import Analyzable
+from app.analyzer.metrics import BatchMetrics
+from app.analyzer.notify import NotificationListener
+from app.analyzer.services import AnalysisService
+from app.core.config import settings
+from app.core.db import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    행의 데이터와 무관한 DB 장애인지 판단 (연결 끊김, 서버 재시작, 커넥션 풀 고갈 등)
+    - IntegrityError/DataError 같은 나머지 DBAPIError 는 행 때문에 생긴 오류로 보고 배치를 나눠서 다시 시도
+    """
+    if isinstance(error, (OperationalError, InterfaceError, PoolTimeoutError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+class AnalysisDaemon:
+    # DB 장애가 계속될 때 재시도 간격의 상한 (poll_interval 부터 두 배씩 늘림)
+    MAX_BACKOFF = 300.0
+
+    def __init__(
+        self,
+        max_sentences: int = settings.ANALYSIS_DAEMON_MAX_SENTENCES,
+        max_latency: float = settings.ANALYSIS_DAEMON_MAX_LATENCY,
+        poll_interval: float = settings.ANALYSIS_DAEMON_POLL_INTERVAL,
+        fetch_size: int = settings.ANALYSIS_DAEMON_FETCH_SIZE,
+        max_failures: int = settings.ANALYSIS_DAEMON_MAX_ITEM_FAILURES
+    ):
+        self.max_sentences = max_sentences
+        self.max_latency = max_latency
+        self.poll_interval = poll_interval
+        self.fetch_size = fetch_size
+        self.max_failures = max_failures
+        self._stopping = False
+        # (테이블명, id) → 혼자 처리했을 때 실패한 횟수 / 격리된 행
+        self._failures: Counter = Counter()
+        self._quarantined: Set[Tuple[str, object]] = set()
+
+    def stop(self, signum=None, frame=None):
+        if not self._stopping:
+            logger.info("[DAEMON] 종료 요청 수신: 모아둔 배치를 커밋한 뒤 종료합니다")
+        self._stopping = True
+
+    def _wait(self, listener: NotificationListener, timeout: float) -> bool:
+        """
+        종료 요청에 바로 반응할 수 있도록 1초 단위로 나눠서 대기
+        """
+        deadline = time.monotonic() + timeout
+        while not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if listener.wait(min(remaining, 1.0)):
+                return True
+        return False
+
+    @staticmethod
+    def _item_key(item: Analyzable) -> Tuple[str, object]:
+        original = item.get_original()
+        return original.__table__.name, original.id
+
+    def _collect(self, service: AnalysisService, listener: NotificationListener):
+        """
+        마이크로 배치 하나를 모음: (아이템 목록, 아이템별 후보 문장, 조회/전처리 지표) 반환
+        - 같은 배치 안에서는 cursor 로 이미 가져온 행을 건너뛰고, 배치가 커밋되면 다음 배치는 처음부터 다시 조회
+          (커밋된 행은 is_analyzed = true 이므로 자연스럽게 제외되고, id 가 작은 새 행도 놓치지 않음)
+        - 격리된 행은 가져온 뒤 버림 (격리된 행만 있는 페이지면 다음 페이지 조회)
+        """
+        items: List[Analyzable] = []
+        candidates: List[List[Dict]] = []
+        sentence_count = 0
+        cursors: Dict[str, object] = {}
+        deadline = None
+        metrics = BatchMetrics()
+
+        while not self._stopping:
+            with metrics.timer("fetch"):
+                fetched = service.repo.get_unanalyzed_after(cursors, limit=self.fetch_size)
+            page = [item for item in fetched if self._item_key(item) not in self._quarantined]
+
+            if page:
+                if deadline is None:
+                    deadline = time.monotonic() + self.max_latency
+                page_candidates = service.analyzer.preprocess_many([item.content for item in page], metrics)
+                items.extend(page)
+                candidates.extend(page_candidates)
+                sentence_count += sum(len(c) for c in page_candidates)
+                if sentence_count >= self.max_sentences or time.monotonic() >= deadline:
+                    break
+                continue
+            if fetched:
+                continue
+
+            if items:
+                # 아직 채워지지 않은 배치: 지연 목표 시각까지만 새 행을 기다림
+                if not self._wait(listener, deadline - time.monotonic()):
+                    break
+            else:
+                # 처리할 행이 없음: 조회 트랜잭션을 닫고(idle in transaction 방지) 알림 또는 polling 주기까지 대기 후 처음부터 다시 조회
+                service.db.commit()
+                self._wait(listener, self.poll_interval)
+                cursors.clear()
+                metrics = BatchMetrics()
+
+        return items, candidates, metrics
+
+    def _process(
+        self,
+        service: AnalysisService,
+        log_id: int,
+        items: List[Analyzable],
+        candidates: List[List[Dict]],
+        metrics: BatchMetrics,
+        keys: List[Tuple[str, object]],
+        done: Set[Tuple[str, object]]
+    ) -> Tuple[int, int]:
+        """
+        배치를 한 트랜잭션으로 처리하고, 실패하면 반으로 나눠 각각 다시 처리 → (커밋한 아이템 수, 저장된 분석 결과 수)
+        - 커밋한 아이템의 key 는 done 에 추가
+        - 아이템 하나만 남아도 실패하면 그 행의 실패 횟수를 올리고, max_failures 번째 실패에서 격리
+          (격리된 행은 is_analyzed = false 로 남으므로 데몬을 재시작하면 다시 시도)
+        - DB 장애(_is_transient)는 나누지 않고 그대로 올려보냄 (호출한 쪽에서 대기 후 재시도)
+        """
+        try:
+            analyzed_count = service.process_chunk(log_id, items, candidates, metrics)
+            done.update(keys)
+            return len(items), analyzed_count
+        except Exception as e:
+            if _is_transient(e):
+                raise
+            if len(items) > 1:
+                logger.warning(f"[DAEMON] 배치 처리 실패 ({len(items)}개 아이템): 반으로 나눠 다시 시도")
+            else:
+                table, item_id = keys[0]
+                self._failures[keys[0]] += 1
+                logger.exception(
+                    f"[DAEMON ERROR] {table} id={item_id} 분석 실패 ({self._failures[keys[0]]}/{self.max_failures}회)"
+                )
+                if self._failures[keys[0]] >= self.max_failures:
+                    self._quarantined.add(keys[0])
+                    logger.error(f"[DAEMON] {table} id={item_id} 격리: 재시작 전까지 다시 처리하지 않음")
+                return 0, 0
+
+        mid = len(items) // 2
+        left = self._process(service, log_id, items[:mid], candidates[:mid], BatchMetrics(), keys[:mid], done)
+        right = self._process(service, log_id, items[mid:], candidates[mid:], BatchMetrics(), keys[mid:], done)
+        return left[0] + right[0], left[1] + right[1]
+
+    def _process_with_retry(
+        self,
+        service: AnalysisService,
+        listener: NotificationListener,
+        log_id: int,
+        items: List[Analyzable],
+        candidates: List[List[Dict]],
+        metrics: BatchMetrics,
+        summary: Dict[str, int]
+    ) -> Tuple[int, int]:
+        """
+        _process 를 실행하다 DB 장애가 나면 대기 간격을 늘려가며 아직 커밋하지 못한 아이템만 다시 처리
+        - 장애 중 종료 요청을 받으면 남은 아이템은 is_analyzed = false 로 두고 포기 (다음 실행 때 다시 처리)
+        """
+        keys = [self._item_key(item) for item in items]
+        done: Set[Tuple[str, object]] = set()
+        committed = analyzed_count = 0
+        backoff = max(self.poll_interval, 1.0)
+
+        while True:
+            pending = [i for i, key in enumerate(keys) if key not in done]
+            try:
+                result = self._process(
+                    service,
+                    log_id,
+                    [items[i] for i in pending],
+                    [candidates[i] for i in pending],
+                    metrics,
+                    [keys[i] for i in pending],
+                    done
+                )
+                return committed + result[0], analyzed_count + result[1]
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                # 장애 전에 나눠서 커밋된 아이템도 결과 수에 반영 (분석 결과 수는 알 수 없으므로 제외)
+                committed = len(done)
+                summary["db_errors"] += 1
+                if self._stopping:
+                    logger.error(f"[DAEMON ERROR] DB 장애 중 종료 요청: 커밋하지 못한 {len(keys) - len(done)}개 아이템은 다음 실행 때 처리 ({e})")
+                    return committed, analyzed_count
+                logger.warning(f"[DAEMON] DB 장애로 배치 처리 실패: {backoff:.0f}s 후 {len(keys) - len(done)}개 아이템 다시 시도 ({e})")
+                self._wait(listener, backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+                metrics = BatchMetrics()
+
+    def run(self):
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+
+        db = SessionLocal()
+        listener = NotificationListener()
+        service = AnalysisService(db)
+        service.analyzer  # 첫 배치가 모델 로딩을 기다리지 않도록 미리 로딩
+        log_id = service.repo.start_analysis_log()
+        logger.info(
+            f"[DAEMON] 시작 (log_id={log_id}, 배치 {self.max_sentences}문장 / {self.max_latency}s, "
+            f"{'LISTEN' if listener.available else 'polling'} {self.poll_interval}s)"
+        )
+
+        summary = {
+            "batches": 0, "source_count": 0, "analyzed_count": 0,
+            "failed_batches": 0, "failed_items": 0, "quarantined": 0, "db_errors": 0
+        }
+        try:
+            while not self._stopping:
+                items, candidates, metrics = self._collect(service, listener)
+                if not items:
+                    continue
+
+                # 종료 요청을 받은 뒤에도 이미 모은 배치는 끝까지 처리
+                # 실패한 행만 골라내고 나머지는 커밋 (실패한 행은 다음 배치에서 다시 시도하거나 격리)
+                # DB 장애는 행의 실패로 세지 않고 같은 배치를 다시 시도
+                started = time.monotonic()
+                committed, analyzed_count = self._process_with_retry(
+                    service, listener, log_id, items, candidates, metrics, summary
+                )
+                failed = len(items) - committed
+                summary["quarantined"] = len(self._quarantined)
+                if failed:
+                    summary["failed_batches"] += 1
+                    summary["failed_items"] += failed
+                    logger.error(f"[DAEMON ERROR] {len(items)}개 아이템 중 {failed}개 처리 실패, 다음 배치에서 다시 시도")
+                if committed:
+                    summary["batches"] += 1
+                    summary["source_count"] += committed
+                    summary["analyzed_count"] += analyzed_count
+                    logger.info(
+                        f"[DAEMON] 배치 커밋: {committed}개 아이템 → {analyzed_count}개 결과 "
+                        f"({time.monotonic() - started:.2f}s, 누적 {summary['source_count']}개)"
+                    )
+                if failed and not committed:
+                    self._wait(listener, self.poll_interval)
+        finally:
+            service.repo.finish_analysis_log(log_id=log_id)
+            listener.close()
+            db.close()
+            logger.info(f"[DAEMON] 종료: {summary}")
+
+        return {"log_id": log_id, **summary}
+
+
+if __name__ == "__main__":
+    AnalysisDaemon().run()
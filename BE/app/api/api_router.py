@@ -5,6 +5,8 @@ from app.modules.comments.router import router as comments_router
 from app.modules.youtube.router import router as youtube_router
 # from app.modules.user.router import router as user_router
 from app.modules.search.router import router as search_router
+from app.modules.metrics.router import router as metrics_router
+from app.modules.analyze.router import router as analyze_router
 
 router = APIRouter()
 
@@ -14,4 +16,6 @@ router.include_router(sentiment_router, prefix="/sentiment", tags=["sentiment"])
 router.include_router(comments_router, prefix="/comments", tags=["comments"])
 router.include_router(youtube_router, prefix="/youtube", tags=["youtube"])
 # router.include_router(user_router, prefix="/user", tags=["user"])
-router.include_router(search_router, prefix="/search", tags=["search"]) 
\ No newline at end of file
+router.include_router(search_router, prefix="/search", tags=["search"])
+router.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
+router.include_router(analyze_router, prefix="/analyze", tags=["analyze"]) 
\ No newline at end of file
@@ -25,9 +25,100 @@ class Settings(BaseSettings):
     # YouTube API 키
     YOUTUBE_API_KEY: str
 
+    # YouTube Data API v3 REST 엔드포인트 (테스트 시 로컬 fake 서버 주소로 변경)
+    YOUTUBE_API_BASE_URL: str = "https://www.googleapis.com/youtube/v3"
+    # 키워드 하나를 크롤링할 때 동시에 보낼 수 있는 최대 API 요청 수
+    YOUTUBE_MAX_CONCURRENCY: int = 8
+    # YouTube Data API 일일 할당량 (units, 태평양 시간 자정 초기화), QUOTA_RESERVE 는 키워드 크롤링에 쓰지 않고 남겨둘 units
+    # 사용량은 youtube_quota_usage 테이블에 날짜별로 기록 (크롤링 전 예상 비용만큼 예약, 끝나면 실제 사용량으로 정산)
+    YOUTUBE_DAILY_QUOTA: int = 10_000
+    YOUTUBE_QUOTA_RESERVE: int = 0
+
+    # 인스티즈 크롤러 (테스트 시 BASE_URL 을 로컬 fake 서버 주소로 변경)
+    # 게시글 본문은 호스트별 MAX_PER_HOST 개까지 병렬 요청, 목록은 본문 수집이 밀린 페이지가 LISTING_PREFETCH 개가 될 때까지 앞서 가져옴
+    INSTIZ_BASE_URL: str = "https://www.instiz.net"
+    INSTIZ_MAX_PER_HOST: int = 4
+    INSTIZ_LISTING_PREFETCH: int = 2
+
+    # 틱톡 댓글 API (테스트 시 BASE_URL 을 로컬 fake 서버 주소로 변경)
+    # 전체 영상 합계 동시 요청 수, 댓글 목록을 미리 요청할 페이지 수
+    TIKTOK_BASE_URL: str = "https://www.tiktok.com"
+    TIKTOK_COMMENT_MAX_CONCURRENCY: int = 8
+    TIKTOK_COMMENT_PAGE_PREFETCH: int = 2
+
+    # 크롤러 HTTP 응답 디스크 캐시 (app/crawler/cache.py)
+    # CRAWL_CACHE_MODE: off (사용 안 함) | on (TTL 안의 응답 재사용) | offline (캐시만 사용, 미스 시 오류)
+    # TTL 은 소스별 초 단위, 개발 중 같은 키워드/기간을 반복 크롤링할 때 on / offline 사용
+    CRAWL_CACHE_MODE: str = "off"
+    CRAWL_CACHE_DIR: str = "./asset/cache/http"
+    CRAWL_CACHE_TTL_YOUTUBE: float = 6 * 60 * 60
+    CRAWL_CACHE_TTL_INSTIZ: float = 24 * 60 * 60
+    CRAWL_CACHE_TTL_TIKTOK: float = 6 * 60 * 60
+
+    # 키워드 검색 크롤링: 3개 플랫폼을 동시에 크롤링한 뒤 워터마크 반영 규칙 (수집 데이터는 페이지마다 이미 커밋됨)
+    # False 면 하나라도 실패 시 어떤 플랫폼의 워터마크도 올리지 않음, True 면 성공한 플랫폼만 올림
+    CRAWL_PARTIAL_COMMIT: bool = False
+
+    # 크롤링 결과 페이지 단위 저장 (app/crawler/pipeline.py): 크롤러가 PAGE_SIZE 행 안팎의 페이지를 내보내면 바로 저장
+    # 크롤러와 저장 사이에 최대 PAGE_QUEUE_SIZE 페이지까지만 쌓이고, 저장이 밀리면 크롤러가 기다림 (메모리 상한)
+    # 페이지는 저장할 때마다 바로 커밋 (여러 키워드 크롤링이 같은 영상/댓글을 저장해도 서로의 커밋 전 행을 기다리지 않도록
+    # 트랜잭션을 짧게 유지, 중단돼도 저장한 페이지는 남고 다시 크롤링하면 저장 시 중복 제거)
+    CRAWL_PAGE_SIZE: int = 100
+    CRAWL_PAGE_QUEUE_SIZE: int = 4
+
+    # 다른 키워드로 이미 수집한 영상(app/crawler/seen.py)은 댓글을 다시 수집하지 않고 새 키워드의 수집 이력(collected_*)만 추가
+    # DELTA 가 True 면 저장된 가장 최근 댓글 이후의 새 댓글만 추가로 수집
+    # (YouTube 는 최신순 조회라 첫 페이지에서 멈추지만, TikTok 은 전체를 다시 받아 걸러내므로 기본 False)
+    CRAWL_SEEN_DELTA_YOUTUBE: bool = True
+    CRAWL_SEEN_DELTA_TIKTOK: bool = False
+
+    # 크롤링 작업 워커 (python -m app.crawler.worker): POST /search/keyword 는 crawl_jobs 에 작업만 등록
+    # 프로세스당 동시 실행 작업 수(TikTok 은 작업마다 브라우저 하나), LISTEN 알림을 놓쳤을 때의 확인 주기(초)
+    # heartbeat 가 STALE_SECONDS 넘게 멈춘 실행 중 작업은 다시 대기열로 (MAX_ATTEMPTS 회 실행 후에는 fail)
+    CRAWL_WORKER_CONCURRENCY: int = 2
+    CRAWL_WORKER_POLL_INTERVAL: float = 5.0
+    CRAWL_JOB_STALE_SECONDS: float = 600.0
+    CRAWL_JOB_MAX_ATTEMPTS: int = 3
+
     # ✅ OpenAI API 키
     OPENAI_API_KEY: str
 
+    # 분석 모델 설정 (ANALYZER_BACKEND: tf | onnx | onnx-int8)
+    ANALYZER_MODEL_DIR: str = "./asset/kcelectra-base-DC"
+    ANALYZER_BACKEND: str = "tf"
+    ANALYZER_WARMUP_SIZE: int = 32
+
+    # 문장 분리 설정 (ANALYZER_SPLIT_BACKEND: auto | mecab | pecab | punct | fast)
+    # ANALYSIS_WORKERS > 1 이면 워커마다 분리 풀이 생기므로 ANALYZER_SPLIT_WORKERS 는 1 권장
+    ANALYZER_SPLIT_BACKEND: str = "auto"
+    ANALYZER_SPLIT_WORKERS: int = 1
+
+    # 분석 배치 설정
+    ANALYSIS_BATCH_SIZE: int = 256
+    ANALYSIS_CHUNK_SIZE: int = 1000
+    ANALYSIS_WORKERS: int = 1
+
+    # 상시 분석 데몬 (python -m app.analyzer.worker)
+    # 마이크로 배치는 문장 수(MAX_SENTENCES) 또는 첫 행을 가져온 뒤 경과 시간(MAX_LATENCY 초) 중 먼저 도달한 쪽에서 처리
+    # LISTEN/NOTIFY 를 쓸 수 없거나 알림을 놓쳐도 POLL_INTERVAL 초마다 미분석 행을 확인
+    # 배치가 실패하면 반으로 나눠 실패한 행만 골라내고, 혼자서 MAX_ITEM_FAILURES 번 실패한 행은 격리 (재시작 전까지 건너뜀)
+    ANALYSIS_DAEMON_MAX_SENTENCES: int = 256
+    ANALYSIS_DAEMON_MAX_LATENCY: float = 2.0
+    ANALYSIS_DAEMON_POLL_INTERVAL: float = 15.0
+    ANALYSIS_DAEMON_FETCH_SIZE: int = 64
+    ANALYSIS_DAEMON_MAX_ITEM_FAILURES: int = 3
+
+    # 온라인 분석 API (POST /analyze): 첫 요청 후 MAX_WAIT_MS 동안 또는 MAX_TEXTS 개까지 요청을 모아 한 번에 추론
+    # 요청 하나당 텍스트 수(MAX_REQUEST_TEXTS)와 텍스트 하나의 글자 수(MAX_TEXT_LENGTH) 제한
+    ANALYZE_API_MAX_TEXTS: int = 64
+    ANALYZE_API_MAX_WAIT_MS: float = 10.0
+    ANALYZE_API_MAX_REQUEST_TEXTS: int = 50
+    ANALYZE_API_MAX_TEXT_LENGTH: int = 2000
+
+    # 감성 분류 결과 캐시 (경로를 비우면 디스크 캐시 미사용)
+    SENTIMENT_CACHE_PATH: str = "./asset/cache/sentiment_cache.sqlite3"
+    SENTIMENT_CACHE_SIZE: int = 100_000
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -0,0 +1,228 @@
+import os
+import gzip
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import uuid
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# CRAWL_CACHE_MODE
+#   off     : 캐시 사용 안 함 (항상 네트워크)
+#   on      : TTL 안의 응답은 캐시에서, 나머지는 네트워크로 받아 캐시에 저장
+#   offline : 캐시만 사용 (TTL 무시), 캐시에 없으면 네트워크로 나가지 않고 OfflineCacheMiss
+CACHE_MODES = ("off", "on", "offline")
+
+# 캐시 키에서 제외할 쿼리 파라미터 (API 키 등, 값이 달라도 같은 응답)
+IGNORED_PARAMS = {"key"}
+
+# 저장한 본문은 이미 디코딩된 상태이므로 재생할 때 빼야 하는 헤더
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+# (상태 코드, 본문) → 캐시에 저장할지 여부
+Cacheable = Callable[[int, bytes], bool]
+
+
+def success_only(status_code: int, body: bytes) -> bool:
+    return 200 <= status_code < 300
+
+
+class OfflineCacheMiss(Exception):
+    """
+    offline 모드에서 캐시에 없는 요청 (네트워크로 나가지 않음)
+    """
+
+    def __init__(self, source: str, url: str):
+        self.source = source
+        self.url = url
+        super().__init__(f"[{source}] 캐시에 없는 요청 (offline): {url}")
+
+
+class HTTPCache:
+    """
+    크롤러 공용 디스크 HTTP 응답 캐시
+    - 키: sha1(method + URL + 정렬된 쿼리 파라미터, IGNORED_PARAMS 제외)
+    - 저장: {cache_dir}/{source}/{키 앞 2자리}/{키}.gz  (메타데이터 JSON 한 줄 + 본문, gzip 압축)
+    - 소스(youtube / instiz / tiktok)마다 TTL(초)을 따로 두고, 기본은 2xx 응답만 저장
+      (다시 요청해도 같은 오류 응답은 소스별 cacheable 로 함께 저장 가능, 예: YouTube commentsDisabled)
+    httpx 클라이언트에는 transport(source) 로, 브라우저(Selenium) 결과처럼 HTTP 가 아닌 값은 load_json / store_json 으로 사용
+    """
+
+    def __init__(self, cache_dir: str, ttls: Dict[str, float], mode: str = "on"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"지원하지 않는 캐시 모드: {mode} (사용 가능: {CACHE_MODES})")
+        self.cache_dir = cache_dir
+        self.ttls = ttls
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == "offline"
+
+    # ── 키 / 경로 ──────────────────────────────────────────────
+    @staticmethod
+    def cache_key(method: str, url: str, params: Iterable[Tuple[str, str]] = ()) -> str:
+        parsed = httpx.URL(url)
+        query = sorted(
+            (k, v) for k, v in [*parsed.params.multi_items(), *params]
+            if k not in IGNORED_PARAMS
+        )
+        base = str(parsed.copy_with(query=None))
+        return hashlib.sha1(f"{method.upper()} {base}?{json.dumps(query, ensure_ascii=False)}".encode("utf-8")).hexdigest()
+
+    def _path(self, source: str, key: str) -> str:
+        return os.path.join(self.cache_dir, source, key[:2], f"{key}.gz")
+
+    # ── 읽기 / 쓰기 ────────────────────────────────────────────
+    def load(self, source: str, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """
+        (메타데이터, 본문) 반환, 없거나 TTL 이 지났으면 None (offline 모드는 TTL 무시)
+        """
+        path = self._path(source, key)
+        try:
+            if not self.offline and time.time() - os.path.getmtime(path) > self.ttls.get(source, 0):
+                return None
+            with gzip.open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None
+
+    def store(self, source: str, key: str, meta: Dict[str, Any], body: bytes):
+        path = self._path(source, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 다른 크롤링이 같은 키를 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+            f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n")
+            f.write(body)
+        os.replace(tmp_path, path)
+        self.stores += 1
+
+    def load_json(self, source: str, name: str) -> Optional[Any]:
+        """
+        HTTP 응답이 아닌 값(예: Selenium 검색 결과)을 name 기준으로 조회
+        - offline 모드에서 없으면 OfflineCacheMiss
+        """
+        cached = self.load(source, self.cache_key("JSON", name))
+        if cached is None:
+            self.misses += 1
+            if self.offline:
+                raise OfflineCacheMiss(source, name)
+            return None
+        self.hits += 1
+        return json.loads(cached[1])
+
+    def store_json(self, source: str, name: str, value: Any):
+        if self.mode == "on":
+            body = json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+            self.store(source, self.cache_key("JSON", name), {"name": name}, body)
+
+    def transport(
+        self,
+        source: str,
+        limits: Optional[httpx.Limits] = None,
+        cacheable: Cacheable = success_only
+    ) -> "CachingTransport":
+        """
+        httpx.AsyncClient(transport=...) 용 트랜스포트
+        (클라이언트에 transport 를 넘기면 limits 인자는 무시되므로 여기서 실제 연결 풀에 전달)
+        """
+        return CachingTransport(self, source, httpx.AsyncHTTPTransport(limits=limits or httpx.Limits()), cacheable)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "stores": self.stores}
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    HTTPCache 를 거치는 httpx 트랜스포트 (GET 만 캐시)
+    """
+
+    def __init__(self, cache: HTTPCache, source: str, inner: httpx.AsyncBaseTransport, cacheable: Cacheable = success_only):
+        self.cache = cache
+        self.source = source
+        self.inner = inner
+        self.cacheable = cacheable
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self.inner.handle_async_request(request)
+
+        key = self.cache.cache_key(request.method, str(request.url))
+        cached = await asyncio.to_thread(self.cache.load, self.source, key)
+        if cached is not None:
+            self.cache.hits += 1
+            meta, body = cached
+            # 캐시 적중 표시 (YouTube 할당량 계산 시 제외)
+            return httpx.Response(
+                meta["status"], headers=meta["headers"], content=body, request=request, extensions={"from_cache": True}
+            )
+
+        self.cache.misses += 1
+        if self.cache.offline:
+            logger.warning(f"[HTTP CACHE] offline 캐시 미스: {request.url}")
+            raise OfflineCacheMiss(self.source, str(request.url))
+
+        response = await self.inner.handle_async_request(request)
+        body = await response.aread()
+        await response.aclose()
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROP_HEADERS]
+
+        if self.cacheable(response.status_code, body):
+            meta = {"url": str(request.url), "status": response.status_code, "headers": headers, "fetched_at": time.time()}
+            await asyncio.to_thread(self.cache.store, self.source, key, meta, body)
+
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+_http_cache: Optional[HTTPCache] = None
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """
+    settings 기준 공용 캐시 (CRAWL_CACHE_MODE=off 이면 None)
+    """
+    global _http_cache
+    if settings.CRAWL_CACHE_MODE == "off":
+        return None
+    if _http_cache is None or _http_cache.mode != settings.CRAWL_CACHE_MODE:
+        _http_cache = HTTPCache(
+            cache_dir=settings.CRAWL_CACHE_DIR,
+            ttls={
+                "youtube": settings.CRAWL_CACHE_TTL_YOUTUBE,
+                "instiz": settings.CRAWL_CACHE_TTL_INSTIZ,
+                "tiktok": settings.CRAWL_CACHE_TTL_TIKTOK,
+            },
+            mode=settings.CRAWL_CACHE_MODE
+        )
+    return _http_cache
+
+
+def cached_transport(
+    source: str,
+    limits: Optional[httpx.Limits] = None,
+    cacheable: Cacheable = success_only
+) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    캐시가 켜져 있으면 source 용 CachingTransport, 꺼져 있으면 None (httpx 기본 트랜스포트 사용)
+    """
+    cache = get_http_cache()
+    return cache.transport(source, limits, cacheable) if cache else None
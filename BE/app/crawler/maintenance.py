@@ -0,0 +1,44 @@
+# app/crawler/maintenance.py
+#
+# 크롤링 테이블 정리: python -m app.crawler.maintenance [--dry-run]
+# - instiz_posts 의 중복 post_url 을 한 행으로 합친 뒤(CrawlingRepository.dedupe_instiz_posts)
+#   uq_instiz_posts_post_url 유니크 인덱스를 만듦 (이미 있으면 건너뜀)
+# - create_instiz_posts 의 ON CONFLICT (post_url) 대상 인덱스라서, 인덱스가 없던 기존 DB 에 크롤링 전에 한 번 실행
+# - 정리와 인덱스 생성은 한 트랜잭션, --dry-run 이면 건수만 출력하고 롤백
+
+import argparse
+
+from app.core.db import SessionLocal
+from app.crawler.repositories import CrawlingRepository
+from app.models import InstizPosts
+
+POST_URL_INDEX = "uq_instiz_posts_post_url"
+
+
+def main(dry_run: bool = False):
+    db = SessionLocal()
+    try:
+        counts = CrawlingRepository(db).dedupe_instiz_posts(commit=False)
+        print(f"[LOG] instiz_posts 중복 post_url 정리: {counts}")
+
+        index = next(index for index in InstizPosts.__table__.indexes if index.name == POST_URL_INDEX)
+        index.create(db.connection(), checkfirst=True)
+
+        if dry_run:
+            db.rollback()
+            print("[LOG] --dry-run: 롤백")
+        else:
+            db.commit()
+            print(f"[LOG] {POST_URL_INDEX} 인덱스 준비 완료")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="instiz_posts 중복 post_url 정리 및 유니크 인덱스 생성")
+    parser.add_argument("--dry-run", action="store_true", help="건수만 출력하고 롤백")
+    args = parser.parse_args()
+    main(args.dry_run)
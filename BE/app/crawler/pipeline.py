@@ -0,0 +1,103 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, TypeVar
+
+T = TypeVar("T")
+
+# 크롤러가 내보내는 페이지: {"videos": [...], "comments": [...], ...} (키는 플랫폼별 저장 대상 테이블)
+# 영상 댓글을 끝까지 수집한 경우 {"completed_videos": [video_id, ...]} (CrawlerService 가 comments_collected_at 기록)
+Page = Dict[str, List[Any]]
+
+
+async def drain(queue: asyncio.Queue, producer: asyncio.Future) -> AsyncIterator[Any]:
+    """
+    producer 태스크(또는 gather 등 Future)가 queue 에 넣는 항목을 producer 가 끝날 때까지 꺼내서 반환 (종료 표시 항목 불필요)
+    - producer 가 오류로 끝나면 남은 항목을 모두 내보낸 뒤 그 오류를 그대로 전달
+    - 소비하는 쪽이 중간에 멈추면(aclose/취소/오류) producer 를 취소 (가득 찬 queue 에 넣으려고 기다리던 producer 도 바로 깨어남)
+    """
+    try:
+        while True:
+            if producer.done():
+                while not queue.empty():
+                    yield queue.get_nowait()
+                producer.result()
+                return
+
+            getter = asyncio.ensure_future(queue.get())
+            try:
+                done, _ = await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+            except BaseException:
+                getter.cancel()
+                raise
+            if getter in done:
+                yield getter.result()
+            else:
+                # 취소된 get 은 항목을 꺼내지 않으므로 남은 항목은 다음 반복(producer 종료 처리)에서 꺼냄
+                getter.cancel()
+    finally:
+        if not producer.done():
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+
+async def write_pages(
+    pages: AsyncIterator[T],
+    write: Callable[[T], Awaitable[Any]],
+    max_pages: int
+) -> int:
+    """
+    크롤러(pages) → 최대 max_pages 페이지 크기의 queue → 저장(write) 파이프라인, 저장한 페이지 수 반환
+    - 크롤러는 저장을 기다리지 않고 다음 페이지를 수집하되, 저장이 밀려 queue 가 차면 거기서 멈춤 (backpressure)
+      → 메모리에 올라가는 페이지 수는 크롤링 규모와 상관없이 max_pages + 크롤러 내부 버퍼
+    - 저장이 실패하면 크롤러를 멈추고, 크롤러가 실패하면 이미 받은 페이지까지 저장한 뒤 오류 전달
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_pages)
+
+    async def produce():
+        try:
+            async for page in pages:
+                await queue.put(page)
+        finally:
+            await pages.aclose()
+
+    producer = asyncio.create_task(produce())
+    items = drain(queue, producer)
+    written = 0
+    try:
+        async for page in items:
+            await write(page)
+            written += 1
+    finally:
+        await items.aclose()
+    return written
+
+
+async def collect_pages(pages: AsyncIterator[Page]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    페이지를 키별로 모두 이어 붙여 반환 (기존 crawl() 반환 형식, 메모리에 전부 올라가므로 저장은 write_pages 사용)
+    """
+    collected: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    try:
+        async for page in pages:
+            for key, rows in page.items():
+                collected[key].extend(rows)
+    finally:
+        await pages.aclose()
+    return dict(collected)
+
+
+async def batched(items: AsyncIterator[T], size: int) -> AsyncIterator[List[T]]:
+    """
+    하나씩 나오는 항목을 size 개씩 묶어서 반환 (마지막 묶음은 size 보다 작을 수 있음)
+    """
+    batch: List[T] = []
+    try:
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        await items.aclose()
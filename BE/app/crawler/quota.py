@@ -0,0 +1,161 @@
+import math
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+# YouTube Data API v3 호출 1회당 할당량 비용 (units), 목록에 없는 엔드포인트는 1
+UNIT_COSTS = {"search": 100, "videos": 1, "channels": 1, "commentThreads": 1}
+
+# YouTubeCrawler.crawl 이 키워드마다 검색하는 영상 길이 (검색 1회씩)
+SEARCH_DURATIONS = ("short", "medium", "long")
+# commentThreads 한 페이지 최대 댓글 수, videos/channels 한 번에 조회 가능한 id 수
+COMMENT_PAGE_SIZE = 100
+IDS_PER_CALL = 50
+
+# 일일 할당량은 태평양 시간 자정에 초기화
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# 한 번도 크롤링하지 않은 키워드의 경과 시간 (가장 먼저 크롤링)
+NEVER_CRAWLED_HOURS = 24 * 365
+
+
+class QuotaExceeded(Exception):
+    """
+    할당량(예약한 units 또는 API 의 quotaExceeded) 부족으로 보내지 않은 요청
+    """
+
+    def __init__(self, resource: str, used: int, limit: Optional[int]):
+        self.resource = resource
+        self.used = used
+        self.limit = limit
+        super().__init__(f"YouTube 할당량 부족: {resource} (사용 {used} / 한도 {limit})")
+
+
+def quota_day(now: Optional[datetime] = None) -> date:
+    """
+    할당량 기준 날짜 (태평양 시간)
+    """
+    return (now or datetime.now(QUOTA_TIMEZONE)).astimezone(QUOTA_TIMEZONE).date()
+
+
+class QuotaMeter:
+    """
+    크롤링 한 번 동안의 YouTube API 비용 집계 (YouTubeCrawler._get 에서 요청마다 charge)
+    - limit: 이 크롤링에 예약한 units, 넘기는 요청은 보내기 전에 QuotaExceeded
+    - comment_calls: commentThreads 호출 수 상한 (할당량이 모자라면 댓글 페이지부터 줄임)
+    - 캐시에서 응답한 요청은 refund 로 되돌림
+    """
+
+    def __init__(self, limit: Optional[int] = None, comment_calls: Optional[int] = None):
+        self.limit = limit
+        self.comment_calls = comment_calls
+        self.used = 0
+        self.calls = Counter()
+        self.exhausted = False
+
+    def charge(self, resource: str):
+        cost = UNIT_COSTS.get(resource, 1)
+        if self.exhausted:
+            raise QuotaExceeded(resource, self.used, self.limit)
+        if resource == "commentThreads" and self.comment_calls is not None and self.calls[resource] >= self.comment_calls:
+            raise QuotaExceeded(resource, self.used, self.limit)
+        if self.limit is not None and self.used + cost > self.limit:
+            raise QuotaExceeded(resource, self.used, self.limit)
+        self.used += cost
+        self.calls[resource] += 1
+
+    def refund(self, resource: str):
+        self.used -= UNIT_COSTS.get(resource, 1)
+        self.calls[resource] -= 1
+
+    def exhaust(self):
+        """
+        API 가 quotaExceeded 를 반환한 경우: 이후 요청은 모두 보내지 않음
+        """
+        self.exhausted = True
+
+    def stats(self) -> Dict[str, Any]:
+        return {"used": self.used, "limit": self.limit, "calls": dict(self.calls), "exhausted": self.exhausted}
+
+
+def estimate_cost(max_videos: int, comment_pages: int) -> Dict[str, int]:
+    """
+    YouTubeCrawler.crawl 한 번의 예상 비용 (검색 결과가 max_videos 개씩 모두 찬다고 가정한 상한)
+    - search: 길이별 검색 3회
+    - lookups: videos.list + channels.list (50개씩 묶음)
+    - comments: 영상마다 comment_pages 페이지
+    """
+    videos = len(SEARCH_DURATIONS) * max_videos
+    search = len(SEARCH_DURATIONS) * UNIT_COSTS["search"]
+    lookups = math.ceil(videos / IDS_PER_CALL) * (UNIT_COSTS["videos"] + UNIT_COSTS["channels"])
+    comments = videos * comment_pages * UNIT_COSTS["commentThreads"]
+    return {"videos": videos, "search": search, "lookups": lookups, "comments": comments, "total": search + lookups + comments}
+
+
+def keyword_priority(staleness_hours: Optional[float], demand: float = 0.0) -> float:
+    """
+    크롤링 우선순위: 마지막 수집 후 경과 시간 × (1 + 수요), 한 번도 수집하지 않은 키워드는 경과 시간 1년으로 계산
+    """
+    hours = NEVER_CRAWLED_HOURS if staleness_hours is None else max(staleness_hours, 0.0)
+    return hours * (1.0 + max(demand, 0.0))
+
+
+def plan_budget(
+    candidates: List[Dict[str, Any]],
+    budget: int,
+    max_videos: int = 20,
+    max_comments: int = 100
+) -> Dict[str, Any]:
+    """
+    남은 할당량 budget 안에서 키워드별 크롤링 계획을 세움
+    candidates: [{"keyword_id", "staleness_hours", "demand"}, ...]
+    - 우선순위(keyword_priority) 순으로 검색/상세 조회 비용(댓글 제외)을 감당할 수 있는 키워드까지 포함, 나머지는 deferred
+    - 남은 units 는 댓글 페이지 단계별로 우선순위 순서대로 배분
+      (모든 키워드가 영상당 1페이지를 받은 뒤에 2페이지 배분 → 할당량이 모자라면 댓글 페이지부터 줄어듦)
+    """
+    full_pages = max(1, math.ceil(max_comments / COMMENT_PAGE_SIZE))
+    base = estimate_cost(max_videos, 0)
+    per_page = base["videos"] * UNIT_COSTS["commentThreads"]
+
+    ordered = sorted(
+        candidates,
+        key=lambda c: keyword_priority(c.get("staleness_hours"), c.get("demand", 0.0)),
+        reverse=True
+    )
+    left = max(budget, 0)
+    scheduled, deferred = [], []
+    for candidate in ordered:
+        if base["total"] <= left:
+            left -= base["total"]
+            scheduled.append({
+                "keyword_id": candidate.get("keyword_id"),
+                "priority": keyword_priority(candidate.get("staleness_hours"), candidate.get("demand", 0.0)),
+                "max_videos": max_videos,
+                "comment_pages": 0,
+                "comment_calls": 0,
+            })
+        else:
+            deferred.append(candidate.get("keyword_id"))
+
+    for page in range(1, full_pages + 1):
+        for item in scheduled:
+            grant = min(per_page, left)
+            if grant <= 0:
+                break
+            item["comment_calls"] += grant
+            item["comment_pages"] = page
+            left -= grant
+
+    for item in scheduled:
+        item["max_comments"] = min(max_comments, item["comment_pages"] * COMMENT_PAGE_SIZE)
+        item["projected_cost"] = base["total"] + item["comment_calls"]
+        item["degraded"] = item["comment_pages"] < full_pages or item["comment_calls"] < per_page * full_pages
+
+    return {
+        "budget": budget,
+        "projected_cost": sum(item["projected_cost"] for item in scheduled),
+        "full_cost": estimate_cost(max_videos, full_pages)["total"],
+        "scheduled": scheduled,
+        "deferred": deferred,
+    }
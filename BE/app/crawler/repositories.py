@@ -1,296 +1,652 @@
+import json
+from sqlalchemy import case, cast, func, literal, select, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from typing import List, Dict, Optional
+from sqlalchemy.dialects.postgresql import insert as pg_insert, JSONB
+from typing import Any, List, Dict, Optional, Set, Tuple
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, date
 
+from app.analyzer.notify import notify_unanalyzed
 from app.models import (
     InstizPosts, CollectedInstizPosts, TiktokVideos, 
     TiktokComments, CollectedTiktokComments, CollectedTiktokVideos, 
     YoutubeChannels, YoutubeVideos, CollectedYoutubeVideos,
-    YoutubeComments, CollectedYoutubeComments
+    YoutubeComments, CollectedYoutubeComments, CrawlWatermarks, YoutubeQuotaUsage,
+    CrawlJobs
 )
 
+# 새 크롤링 작업이 등록되었음을 크롤링 워커(app.crawler.worker)에 알리는 PostgreSQL 채널
+CRAWL_JOB_CHANNEL = "crawl_jobs"
+# 대기/실행 중 작업 상태 (키워드당 하나, CrawlJobs 의 부분 유니크 인덱스와 같은 조건)
+ACTIVE_JOB_STATUSES = ("queued", "running")
+# INSERT ... ON CONFLICT DO NOTHING 한 번에 넣는 행 수 (PostgreSQL 바인드 파라미터 한도 65535 이하로 유지)
+UPSERT_BATCH_SIZE = 1000
+# 다른 키워드로 이미 수집한 영상 확인용 (플랫폼 → 영상, 댓글, 댓글 수집 이력 모델)
+SEEN_VIDEO_TABLES = {
+    "youtube": (YoutubeVideos, YoutubeComments, CollectedYoutubeComments),
+    "tiktok": (TiktokVideos, TiktokComments, CollectedTiktokComments),
+}
+
 
 class CrawlingRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_instiz_posts(self, posts: List[Dict]):
+    def _insert_new(self, model, rows: List[Dict[str, Any]], conflict: List[str], returning: List[str]) -> List[Any]:
+        """
+        rows 를 UPSERT_BATCH_SIZE 개씩 INSERT ... ON CONFLICT (conflict) DO NOTHING RETURNING 으로 저장
+        → 새로 들어간 행의 returning 컬럼 목록 (이미 있던 행은 건너뜀, 같은 키가 여러 번 있으면 처음 행만 저장)
+        - 키 순서로 정렬해서 저장 (동시에 같은 행들을 저장하는 크롤링끼리 항상 같은 순서로 잠가 교착 상태 방지)
+        """
+        unique = {}
+        for row in rows:
+            unique.setdefault(tuple(row[key] for key in conflict), row)
+        rows = [unique[key] for key in sorted(unique, key=lambda key: tuple(map(str, key)))]
+
+        table = model.__table__
+        inserted = []
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = (
+                pg_insert(table)
+                .values(rows[start:start + UPSERT_BATCH_SIZE])
+                .on_conflict_do_nothing(index_elements=conflict)
+                .returning(*(table.c[column] for column in returning))
+            )
+            inserted.extend(self.db.execute(stmt).all())
+        return inserted
+
+    def create_instiz_posts(self, posts: List[Dict], commit: bool = True):
         """
         Instiz 크롤러 결과를 InstizPosts 및 CollectedInstizPosts 테이블에 저장합니다.
         - 동일한 게시글이 여러 키워드로 수집될 수 있으므로,
           InstizPosts(post_url 기준 중복 제거)와 CollectedInstizPosts(post_id + keyword_id 중복 제거)를 함께 저장합니다.
+        - 행마다 존재 여부를 조회하지 않고 ON CONFLICT DO NOTHING 으로 묶어서 저장 (테이블당 배치 수만큼 요청)
+        - commit=False 이면 flush 만 하고 커밋/롤백은 호출자에게 맡깁니다 (오류도 그대로 전달).
         """
-        saved_posts = 0
-        saved_collections = 0
-
-        for post in posts:
-            keyword_id = post["keyword_id"]
-            post_url = post["post_url"]
-            collected_at = post["collected_at"]
-
-            # 1. 이미 동일한 post_url이 InstizPosts에 있는지 확인
-            existing_post = self.db.query(InstizPosts).filter_by(post_url=post_url).first()
-
-            if existing_post:
-                post_id = existing_post.id
-            else:
-                # 새로운 게시글이면 InstizPosts에 저장
-                new_post = InstizPosts(
-                    content=post["content"],
-                    view_count=post["view_count"],
-                    like_count=post["like_count"],
-                    comment_count=post["comment_count"],
-                    post_url=post_url,
-                    created_at=post["created_at"],
-                    updated_at=post["updated_at"],
-                    collected_at=collected_at,
-                    is_analyzed=False
-                )
-                self.db.add(new_post)
-                self.db.flush()  # post_id 확보를 위해 flush
-                post_id = new_post.id
-                saved_posts += 1
-
-            # 2. CollectedInstizPosts 중복 확인
-            already_collected = self.db.query(CollectedInstizPosts).filter_by(
-                post_id=post_id, keyword_id=keyword_id
-            ).first()
-
-            if not already_collected:
-                collected = CollectedInstizPosts(
-                    post_id=post_id,
-                    keyword_id=keyword_id,
-                    collected_at=collected_at
-                )
-                self.db.add(collected)
-                saved_collections += 1
+        def save() -> Dict[str, int]:
+            if not posts:
+                return {"posts_saved": 0, "collections_saved": 0}
+
+            # 1. 새 게시글만 InstizPosts 에 저장 (post_url 유니크)
+            inserted = self._insert_new(InstizPosts, [
+                {
+                    "content": post["content"],
+                    "view_count": post["view_count"],
+                    "like_count": post["like_count"],
+                    "comment_count": post["comment_count"],
+                    "post_url": post["post_url"],
+                    "created_at": post["created_at"],
+                    "updated_at": post["updated_at"],
+                    "collected_at": post["collected_at"],
+                    "is_analyzed": False,
+                }
+                for post in posts
+            ], ["post_url"], ["id"])
+
+            # 2. 이미 있던 게시글을 포함한 post_url → id
+            urls = {post["post_url"] for post in posts}
+            post_ids = dict(
+                self.db.query(InstizPosts.post_url, InstizPosts.id).filter(InstizPosts.post_url.in_(urls)).all()
+            )
+
+            # 3. CollectedInstizPosts (post_id + keyword_id 기본 키)
+            collected = self._insert_new(CollectedInstizPosts, [
+                {"post_id": post_ids[post["post_url"]], "keyword_id": post["keyword_id"], "collected_at": post["collected_at"]}
+                for post in posts
+            ], ["post_id", "keyword_id"], ["post_id"])
+
+            notify_unanalyzed(self.db, InstizPosts.__tablename__, len(inserted))
+            return {"posts_saved": len(inserted), "collections_saved": len(collected)}
+
+        if not commit:
+            saved = save()
+            self.db.flush()
+            return saved
 
         try:
+            saved = save()
             self.db.commit()
         except IntegrityError as e:
             self.db.rollback()
+            saved = {"posts_saved": 0, "collections_saved": 0}
             print(f"[ERROR] DB 저장 중 오류 발생: {e}")
 
-        return {"posts_saved": saved_posts, "collections_saved": saved_collections}
+        return saved
+
+    def dedupe_instiz_posts(self, commit: bool = True) -> Dict[str, int]:
+        """
+        post_url 이 같은 instiz_posts 를 가장 작은 id 한 행으로 합침 (uq_instiz_posts_post_url 유니크 인덱스를 만들기 전에 필요)
+        - 지우는 게시글의 수집 이력(collected_instiz_posts)은 남길 게시글로 옮김
+        - 댓글은 남길 게시글에 같은 댓글(내용, 작성 시각)이 없을 때만 옮기고, 겹치는 댓글은 수집 이력만 옮긴 뒤 삭제
+        - 지우는 게시글/댓글의 분석 결과(content_analysis)는 남길 행의 분석 결과와 겹치므로 삭제
+        → {"posts_removed", "post_links_moved", "comments_moved", "comments_removed", "comment_links_moved", "analyses_removed"}
+        """
+        statements = {
+            # 중복 게시글 그룹의 모든 게시글 → 남길 게시글
+            "_post_map": """
+                CREATE TEMP TABLE instiz_post_dups ON COMMIT DROP AS
+                SELECT id, keep_id FROM (
+                    SELECT id, min(id) OVER w AS keep_id, count(*) OVER w AS copies
+                    FROM instiz_posts WHERE post_url IS NOT NULL
+                    WINDOW w AS (PARTITION BY post_url)
+                ) p WHERE copies > 1
+            """,
+            # 중복 게시글 그룹의 댓글 → 남길 댓글 (남길 게시글의 댓글 우선, 같은 내용/작성 시각 기준)
+            "_comment_map": """
+                CREATE TEMP TABLE instiz_comment_dups ON COMMIT DROP AS
+                SELECT id, post_id, on_keep, first_value(id) OVER w AS keep_id FROM (
+                    SELECT c.id, c.post_id, c.content, c.created_at, d.keep_id AS keep_post_id, d.id = d.keep_id AS on_keep
+                    FROM instiz_comments c JOIN instiz_post_dups d ON c.post_id = d.id
+                ) c
+                WINDOW w AS (PARTITION BY keep_post_id, content, created_at ORDER BY on_keep DESC, id)
+            """,
+            "post_links_moved": """
+                INSERT INTO collected_instiz_posts (post_id, keyword_id, collected_at)
+                SELECT d.keep_id, c.keyword_id, c.collected_at
+                FROM collected_instiz_posts c JOIN instiz_post_dups d ON c.post_id = d.id
+                WHERE d.id <> d.keep_id
+                ON CONFLICT (post_id, keyword_id) DO NOTHING
+            """,
+            "comment_links_moved": """
+                INSERT INTO collected_instiz_comments (comment_id, keyword_id, collected_at)
+                SELECT d.keep_id, c.keyword_id, c.collected_at
+                FROM collected_instiz_comments c JOIN instiz_comment_dups d ON c.comment_id = d.id
+                WHERE d.id <> d.keep_id AND NOT d.on_keep
+                ON CONFLICT (comment_id, keyword_id) DO NOTHING
+            """,
+            "comments_moved": """
+                UPDATE instiz_comments c SET post_id = p.keep_id
+                FROM instiz_comment_dups d JOIN instiz_post_dups p ON d.post_id = p.id
+                WHERE c.id = d.id AND d.id = d.keep_id AND NOT d.on_keep
+            """,
+            "analyses_removed": """
+                DELETE FROM content_analysis a
+                WHERE (a.source_type = 'instiz_posts' AND a.source_id IN (
+                        SELECT id::text FROM instiz_post_dups WHERE id <> keep_id))
+                   OR (a.source_type = 'instiz_comments' AND a.source_id IN (
+                        SELECT id::text FROM instiz_comment_dups WHERE id <> keep_id AND NOT on_keep))
+            """,
+            "comments_removed": """
+                DELETE FROM instiz_comments WHERE id IN (
+                    SELECT id FROM instiz_comment_dups WHERE id <> keep_id AND NOT on_keep)
+            """,
+            # 남은 수집 이력은 ON DELETE CASCADE 로 함께 삭제
+            "posts_removed": """
+                DELETE FROM instiz_posts WHERE id IN (SELECT id FROM instiz_post_dups WHERE id <> keep_id)
+            """,
+        }
+        counts = {}
+        try:
+            for name, sql in statements.items():
+                result = self.db.execute(text(sql))
+                if not name.startswith("_"):
+                    counts[name] = result.rowcount
+            if commit:
+                self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return counts
     
-    def create_tiktok_videos(self, videos: List[Dict]) -> Dict[str, int]:
-        saved_videos = 0
-        saved_collections = 0
-
-        for video in videos:
-            video_id = video["id"]
-            keyword_id = video["keyword_id"]
-            collected_at = video["collected_at"]
-
-            # 중복 확인
-            existing_video = self.db.query(TiktokVideos).filter_by(id=video_id).first()
-
-            if not existing_video:
-                new_video = TiktokVideos(
-                    id=video_id,
-                    title=video["title"],
-                    video_url=video["video_url"],
-                    collected_at=collected_at,
-                )
-                self.db.add(new_video)
-                self.db.flush()  # id 이미 명시되어 있어도 flush는 일관성 위해 호출
-                saved_videos += 1
-
-            # CollectedTiktokVideos 중복 확인
-            already_collected = self.db.query(CollectedTiktokVideos).filter_by(
-                comment_id=video_id, keyword_id=keyword_id
-            ).first()
-
-            if not already_collected:
-                self.db.add(CollectedTiktokVideos(
-                    comment_id=video_id,
-                    keyword_id=keyword_id,
-                    collected_at=collected_at
-                ))
-                saved_collections += 1
+    def create_tiktok_videos(self, videos: List[Dict], commit: bool = True) -> Dict[str, int]:
+        def save() -> Dict[str, int]:
+            inserted = self._insert_new(TiktokVideos, [
+                {
+                    "id": video["id"],
+                    "title": video["title"],
+                    "video_url": video["video_url"],
+                    "collected_at": video["collected_at"],
+                }
+                for video in videos
+            ], ["id"], ["id"])
+            collected = self._insert_new(CollectedTiktokVideos, [
+                {"comment_id": video["id"], "keyword_id": video["keyword_id"], "collected_at": video["collected_at"]}
+                for video in videos
+            ], ["comment_id", "keyword_id"], ["comment_id"])
+            return {"videos_saved": len(inserted), "video_collections_saved": len(collected)}
+
+        if not commit:
+            saved = save()
+            self.db.flush()
+            return saved
 
         try:
+            saved = save()
             self.db.commit()
         except IntegrityError as e:
             self.db.rollback()
+            saved = {"videos_saved": 0, "video_collections_saved": 0}
             print(f"[ERROR] TikTok Video 저장 중 오류 발생: {e}")
 
-        return {"videos_saved": saved_videos, "video_collections_saved": saved_collections}
-
-    def create_tiktok_comments(self, comments: List[Dict]) -> Dict[str, int]:
-        saved_comments = 0
-        saved_collections = 0
-
-        unique_map = {}
-        for comment in comments:
-            key = (comment["id"], comment["keyword_id"])
-            if key not in unique_map:
-                unique_map[key] = comment  # 덮어써도 무방
-
-        # ✅ 1단계: 댓글 먼저 저장
-        for (comment_id, _), comment in unique_map.items():
-            existing_comment = self.db.query(TiktokComments).filter_by(id=comment_id).first()
-            if not existing_comment:
-                new_comment = TiktokComments(
-                    id=comment_id,
-                    video_id=comment["video_id"],
-                    content=comment["content"],
-                    reply_count=comment["reply_count"],
-                    user_id=comment["user_id"],
-                    nickname=comment["nickname"],
-                    parent_comment_id=comment["parent_comment_id"],
-                    is_reply=comment["is_reply"],
-                    created_at=comment["created_at"],
-                    is_analyzed=False,
-                    collected_at=comment["collected_at"]
-                )
-                self.db.add(new_comment)
-                saved_comments += 1
-
-        # ✅ flush() 호출: 댓글 먼저 DB에 반영 (ID 존재 보장)
-        self.db.flush()
-
-        # ✅ 2단계: CollectedTiktokComments 저장
-        for (comment_id, keyword_id), comment in unique_map.items():
-            collected_at = comment["collected_at"]
-            already_collected = self.db.query(CollectedTiktokComments).filter_by(
-                comment_id=comment_id,
-                keyword_id=keyword_id
-            ).first()
-
-            if not already_collected:
-                self.db.add(CollectedTiktokComments(
-                    comment_id=comment_id,
-                    keyword_id=keyword_id,
-                    collected_at=collected_at
-                ))
-                saved_collections += 1
+        return saved
+
+    def create_tiktok_comments(self, comments: List[Dict], commit: bool = True) -> Dict[str, int]:
+        def save() -> Dict[str, int]:
+            # ✅ 1단계: 댓글 먼저 저장 (CollectedTiktokComments 의 외래 키)
+            inserted = self._insert_new(TiktokComments, [
+                {
+                    "id": comment["id"],
+                    "video_id": comment["video_id"],
+                    "content": comment["content"],
+                    "reply_count": comment["reply_count"],
+                    "user_id": comment["user_id"],
+                    "nickname": comment["nickname"],
+                    "parent_comment_id": comment["parent_comment_id"],
+                    "is_reply": comment["is_reply"],
+                    "created_at": comment["created_at"],
+                    "is_analyzed": False,
+                    "collected_at": comment["collected_at"],
+                }
+                for comment in comments
+            ], ["id"], ["id"])
+
+            # ✅ 2단계: CollectedTiktokComments 저장
+            collected = self._insert_new(CollectedTiktokComments, [
+                {"comment_id": comment["id"], "keyword_id": comment["keyword_id"], "collected_at": comment["collected_at"]}
+                for comment in comments
+            ], ["comment_id", "keyword_id"], ["comment_id"])
+
+            notify_unanalyzed(self.db, TiktokComments.__tablename__, len(inserted))
+            return {
+                "comments_saved": len(inserted),
+                "comment_collections_saved": len(collected)
+            }
+
+        if not commit:
+            saved = save()
+            self.db.flush()
+            return saved
 
         try:
+            saved = save()
             self.db.commit()
         except IntegrityError as e:
             self.db.rollback()
+            saved = {"comments_saved": 0, "comment_collections_saved": 0}
             print(f"[ERROR] TikTok Comment 저장 중 오류 발생: {e}")
 
-        return {
-            "comments_saved": saved_comments,
-            "comment_collections_saved": saved_collections
-        }
+        return saved
 
     def create_youtube_data(
         self,
         channels: List[Dict],
         videos: List[Dict],
-        comments: List[Dict]
+        comments: List[Dict],
+        commit: bool = True
     ) -> Optional[Dict[str, int]]:
-        saved_channels = 0
-        saved_videos = 0
-        saved_collected_videos = 0
-        saved_comments = 0
-        saved_collected_comments = 0
-
         try:
             # 1. 채널 저장
-            for ch in channels:
-                if not ch or not ch["id"]:
-                    continue
-                existing_channel = self.db.query(YoutubeChannels).filter_by(id=ch["id"]).first()
-                if not existing_channel:
-                    new_channel = YoutubeChannels(
-                        id=ch["id"],
-                        name=ch["name"],
-                        subscriber_count=ch["subscriber_count"],
-                        updated_at=ch["updated_at"]
-                    )
-                    self.db.add(new_channel)
-                    saved_channels += 1
+            saved_channels = self._insert_new(YoutubeChannels, [
+                {
+                    "id": ch["id"],
+                    "name": ch["name"],
+                    "subscriber_count": ch["subscriber_count"],
+                    "updated_at": ch["updated_at"],
+                }
+                for ch in channels if ch and ch["id"]
+            ], ["id"], ["id"])
 
             # 2. 영상 저장 + 수집 이력
-            for v in videos:
-                video_id = v["id"]
-                keyword_id = v["keyword_id"]
-                collected_at = v["collected_at"]
-
-                existing_video = self.db.query(YoutubeVideos).filter_by(id=video_id).first()
-                if not existing_video:
-                    new_video = YoutubeVideos(
-                        id=video_id,
-                        channel_id=v["channel_id"],
-                        created_at=v["created_at"],
-                        collected_at=collected_at,
-                        like_count=v["like_count"],
-                        comment_count=v["comment_count"],
-                        view_count=v["view_count"],
-                        updated_at=v["updated_at"],
-                        video_type=v["video_type"],
-                        title=v.get("title", ""),
-                        thumbnail_url=v.get("thumbnail_url", "")
-                    )
-                    self.db.add(new_video)
-                    self.db.flush()
-                    saved_videos += 1
-
-                already_collected_video = self.db.query(CollectedYoutubeVideos).filter_by(
-                    video_id=video_id,
-                    keyword_id=keyword_id
-                ).first()
-                if not already_collected_video:
-                    self.db.add(CollectedYoutubeVideos(
-                        video_id=video_id,
-                        keyword_id=keyword_id,
-                        collected_at=collected_at
-                    ))
-                    saved_collected_videos += 1
-
-            self.db.flush()
+            saved_videos = self._insert_new(YoutubeVideos, [
+                {
+                    "id": v["id"],
+                    "channel_id": v["channel_id"],
+                    "created_at": v["created_at"],
+                    "collected_at": v["collected_at"],
+                    "like_count": v["like_count"],
+                    "comment_count": v["comment_count"],
+                    "view_count": v["view_count"],
+                    "updated_at": v["updated_at"],
+                    "video_type": v["video_type"],
+                    "title": v.get("title", ""),
+                    "thumbnail_url": v.get("thumbnail_url", ""),
+                }
+                for v in videos
+            ], ["id"], ["id"])
+            saved_collected_videos = self._insert_new(CollectedYoutubeVideos, [
+                {"video_id": v["id"], "keyword_id": v["keyword_id"], "collected_at": v["collected_at"]}
+                for v in videos
+            ], ["video_id", "keyword_id"], ["video_id"])
 
             # 3. 댓글 저장 + 수집 이력
-            for c in comments:
-                comment_id = c["id"]
-                video_id = c["video_id"]
-                keyword_id = c["keyword_id"]
-                created_at = c["created_at"]
-                like_count = c["like_count"]
-
-                existing_comment = self.db.query(YoutubeComments).filter_by(id=comment_id).first()
-                if not existing_comment:
-                    new_comment = YoutubeComments(
-                        id=comment_id,
-                        video_id=video_id,
-                        content=c["content"],
-                        created_at=created_at,
-                        is_analyzed=False,
-                        like_count=like_count
-                    )
-                    self.db.add(new_comment)
-                    self.db.flush()
-                    saved_comments += 1
-
-                already_collected_comment = self.db.query(CollectedYoutubeComments).filter_by(
-                    comment_id=comment_id,
-                    keyword_id=keyword_id
-                ).first()
-                if not already_collected_comment:
-                    self.db.add(CollectedYoutubeComments(
-                        comment_id=comment_id,
-                        keyword_id=keyword_id,
-                        collected_at=c.get("collected_at", datetime.now())
-                    ))
-                    saved_collected_comments += 1
-
-            self.db.commit()
+            saved_comments = self._insert_new(YoutubeComments, [
+                {
+                    "id": c["id"],
+                    "video_id": c["video_id"],
+                    "content": c["content"],
+                    "created_at": c["created_at"],
+                    "is_analyzed": False,
+                    "like_count": c["like_count"],
+                }
+                for c in comments
+            ], ["id"], ["id"])
+            saved_collected_comments = self._insert_new(CollectedYoutubeComments, [
+                {"comment_id": c["id"], "keyword_id": c["keyword_id"], "collected_at": c.get("collected_at", datetime.now())}
+                for c in comments
+            ], ["comment_id", "keyword_id"], ["comment_id"])
+
+            notify_unanalyzed(self.db, YoutubeComments.__tablename__, len(saved_comments))
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
 
             return {
-                "channels_saved": saved_channels,
-                "videos_saved": saved_videos,
-                "collected_videos_saved": saved_collected_videos,
-                "comments_saved": saved_comments,
-                "collected_comments_saved": saved_collected_comments
+                "channels_saved": len(saved_channels),
+                "videos_saved": len(saved_videos),
+                "collected_videos_saved": len(saved_collected_videos),
+                "comments_saved": len(saved_comments),
+                "collected_comments_saved": len(saved_collected_comments)
             }
 
         except IntegrityError as e:
+            if not commit:
+                raise
             self.db.rollback()
             print(f"[ERROR] YouTube 데이터 저장 중 오류 발생: {e}")
             return None
+
+    def get_video_ids(self, platform: str) -> Set[str]:
+        """
+        platform(youtube | tiktok)에서 댓글 수집을 끝낸 영상 id (app.crawler.seen.SeenVideos 용)
+        - 영상 행만 있고 댓글 수집이 끝나지 않은 영상(comments_collected_at IS NULL)은 빠짐 → 다음 크롤링에서 다시 전체 수집
+        """
+        video_model = SEEN_VIDEO_TABLES[platform][0]
+        return {
+            video_id
+            for (video_id,) in self.db.query(video_model.id).filter(video_model.comments_collected_at.isnot(None)).all()
+        }
+
+    def mark_comments_collected(self, platform: str, video_ids: List[str], collected_at: datetime) -> int:
+        """
+        댓글 수집을 끝낸 영상에 comments_collected_at 기록 → 표시한 영상 수, 커밋/flush 는 호출자에게 맡김
+        (크롤러가 영상의 댓글 페이지를 모두 내보낸 뒤 {"completed_videos": [...]} 페이지로 알려줌)
+        """
+        if not video_ids:
+            return 0
+        video_model = SEEN_VIDEO_TABLES[platform][0]
+        return self.db.query(video_model).filter(video_model.id.in_(sorted(video_ids))).update(
+            {video_model.comments_collected_at: collected_at}, synchronize_session=False
+        )
+
+    def get_latest_comment_times(self, platform: str, video_ids: List[str]) -> Dict[str, datetime]:
+        """
+        영상별 저장된 가장 최근 댓글 작성 시각 (댓글이 없는 영상은 빠짐)
+        """
+        if not video_ids:
+            return {}
+        comment_model = SEEN_VIDEO_TABLES[platform][1]
+        rows = self.db.query(comment_model.video_id, func.max(comment_model.created_at)).filter(
+            comment_model.video_id.in_(video_ids)
+        ).group_by(comment_model.video_id).all()
+        return {video_id: created_at for video_id, created_at in rows if created_at is not None}
+
+    def link_seen_comments(self, platform: str, video_ids: List[str], keyword_id: int, collected_at: datetime) -> int:
+        """
+        이미 저장된 영상들의 댓글에 keyword_id 수집 이력만 추가 (INSERT ... SELECT, 댓글을 다시 수집하지 않은 영상용)
+        → 새로 추가한 수집 이력 수, 커밋/flush 는 호출자에게 맡김
+        """
+        if not video_ids:
+            return 0
+        _, comment_model, collected_model = SEEN_VIDEO_TABLES[platform]
+        stmt = (
+            pg_insert(collected_model)
+            .from_select(
+                ["comment_id", "keyword_id", "collected_at"],
+                select(comment_model.id, literal(keyword_id), literal(collected_at)).where(comment_model.video_id.in_(video_ids))
+            )
+            .on_conflict_do_nothing(index_elements=["comment_id", "keyword_id"])
+            .returning(collected_model.comment_id)
+        )
+        return len(self.db.execute(stmt).all())
+
+    def get_watermark(self, keyword_id: int, platform: str) -> Optional[datetime]:
+        """
+        (keyword_id, platform) 으로 지금까지 수집한 가장 최근 콘텐츠 작성 시각, 처음 크롤링이면 None
+        """
+        watermark = self.db.query(CrawlWatermarks).filter_by(keyword_id=keyword_id, platform=platform).first()
+        return watermark.last_created_at if watermark else None
+
+    def advance_watermark(
+        self,
+        keyword_id: int,
+        platform: str,
+        last_created_at: Optional[datetime],
+        cursor: Optional[str] = None,
+        commit: bool = True
+    ) -> bool:
+        """
+        워터마크를 last_created_at 으로 올림 (기존 값보다 최근일 때만), 갱신했으면 True
+        - 수집 데이터와 같은 세션에서 commit=False 로 호출하면 데이터와 워터마크가 한 트랜잭션으로 커밋됨
+        """
+        if last_created_at is None:
+            return False
+
+        watermark = self.db.query(CrawlWatermarks).filter_by(
+            keyword_id=keyword_id, platform=platform
+        ).with_for_update().first()
+
+        if watermark is None:
+            self.db.add(CrawlWatermarks(
+                keyword_id=keyword_id,
+                platform=platform,
+                last_created_at=last_created_at,
+                cursor=cursor,
+                updated_at=datetime.now()
+            ))
+        elif watermark.last_created_at is None or last_created_at > watermark.last_created_at:
+            watermark.last_created_at = last_created_at
+            watermark.cursor = cursor
+            watermark.updated_at = datetime.now()
+        else:
+            return False
+
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return True
+
+    def mark_crawled(self, keyword_id: int, platform: str, crawled_at: Optional[datetime] = None, commit: bool = True):
+        """
+        (keyword_id, platform) 의 마지막 크롤링 시각 기록 (새 콘텐츠가 없어도 실행마다, 워터마크 행이 없으면 만듦)
+        """
+        crawled_at = crawled_at or datetime.now()
+        self.db.execute(
+            pg_insert(CrawlWatermarks)
+            .values(keyword_id=keyword_id, platform=platform, crawled_at=crawled_at)
+            .on_conflict_do_update(index_elements=["keyword_id", "platform"], set_={"crawled_at": crawled_at})
+        )
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+
+    def get_crawled_times(self, keyword_ids: List[int], platform: str) -> Dict[int, datetime]:
+        """
+        키워드별 마지막 크롤링 시각 (crawled_at 이 없는 예전 워터마크는 updated_at), 크롤링한 적 없는 키워드는 빠짐
+        """
+        rows = self.db.query(
+            CrawlWatermarks.keyword_id,
+            func.coalesce(CrawlWatermarks.crawled_at, CrawlWatermarks.updated_at)
+        ).filter(
+            CrawlWatermarks.keyword_id.in_(keyword_ids),
+            CrawlWatermarks.platform == platform
+        ).all()
+        return {keyword_id: crawled_at for keyword_id, crawled_at in rows if crawled_at is not None}
+
+    def get_youtube_quota_used(self, usage_date: date) -> int:
+        usage = self.db.query(YoutubeQuotaUsage).filter_by(usage_date=usage_date).first()
+        return usage.used_units if usage else 0
+
+    def _lock_youtube_quota(self, usage_date: date) -> YoutubeQuotaUsage:
+        # 그날 첫 예약이면 행을 만들고 (동시에 만들어도 하나만 남음), 행 잠금으로 다른 프로세스의 예약과 직렬화
+        self.db.execute(
+            pg_insert(YoutubeQuotaUsage)
+            .values(usage_date=usage_date, used_units=0, updated_at=datetime.now())
+            .on_conflict_do_nothing(index_elements=["usage_date"])
+        )
+        return self.db.query(YoutubeQuotaUsage).filter_by(usage_date=usage_date).with_for_update().one()
+
+    def reserve_youtube_quota(self, usage_date: date, units: int, daily_budget: int) -> int:
+        """
+        usage_date 의 YouTube 할당량에서 최대 units 만큼 예약하고 바로 커밋 (남은 양이 적으면 남은 만큼만)
+        실제로 예약한 units 반환, 크롤링이 끝나면 settle_youtube_quota 로 실제 사용량과 차이를 정산
+        """
+        usage = self._lock_youtube_quota(usage_date)
+        granted = max(0, min(units, daily_budget - usage.used_units))
+        usage.used_units += granted
+        usage.updated_at = datetime.now()
+        self.db.commit()
+        return granted
+
+    def settle_youtube_quota(self, usage_date: date, reserved: int, used: int, exhausted: bool = False, daily_budget: Optional[int] = None):
+        """
+        예약량(reserved)과 실제 사용량(used)의 차이를 되돌리고 커밋 (데이터 저장 성공 여부와 무관하게 호출)
+        exhausted: API 가 quotaExceeded 를 반환한 경우 그날 할당량을 모두 쓴 것으로 기록
+        """
+        usage = self._lock_youtube_quota(usage_date)
+        usage.used_units = max(0, usage.used_units + used - reserved)
+        if exhausted and daily_budget is not None:
+            usage.used_units = max(usage.used_units, daily_budget)
+        usage.updated_at = datetime.now()
+        self.db.commit()
+
+
+class CrawlJobRepository:
+    """
+    crawl_jobs 작업 큐 (POST /search/keyword 가 등록, app.crawler.worker 가 실행)
+    모든 메서드는 바로 커밋 (작업 상태는 크롤링 데이터 트랜잭션과 별개로 보여야 함)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _active_job(self, keyword_id: int) -> Optional[CrawlJobs]:
+        return self.db.query(CrawlJobs).filter(
+            CrawlJobs.keyword_id == keyword_id,
+            CrawlJobs.status.in_(ACTIVE_JOB_STATUSES)
+        ).with_for_update().first()
+
+    def enqueue(self, keyword_id: int, periods: Dict[str, Dict[str, str]]) -> Tuple[CrawlJobs, bool]:
+        """
+        키워드 크롤링 작업 등록 → (작업, 새로 만들었는지)
+        - 같은 키워드의 대기/실행 중 작업이 있으면 새로 만들지 않고 그 작업에 합침 (requests + 1)
+        - 동시에 등록해도 부분 유니크 인덱스(uq_crawl_jobs_active_keyword) 때문에 하나만 남고, 나머지는 그 작업에 합침
+        """
+        for _ in range(3):
+            job = self._active_job(keyword_id)
+            if job is not None:
+                job.requests += 1
+                self.db.commit()
+                return job, False
+
+            job = CrawlJobs(
+                keyword_id=keyword_id,
+                status="queued",
+                periods=periods,
+                progress={},
+                requests=1,
+                attempts=0,
+                created_at=datetime.now()
+            )
+            self.db.add(job)
+            try:
+                self.db.flush()
+            except IntegrityError:
+                # 다른 요청이 먼저 등록함 → 그 작업을 다시 조회해서 합침
+                self.db.rollback()
+                continue
+            self.db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CRAWL_JOB_CHANNEL, "payload": str(job.id)})
+            self.db.commit()
+            return job, True
+        raise RuntimeError(f"크롤링 작업 등록 실패 (keyword_id={keyword_id})")
+
+    def queued_requests(self) -> Dict[int, int]:
+        """
+        대기 중인 작업의 키워드 id → 합쳐진 요청 수 (등록 순)
+        """
+        rows = self.db.query(CrawlJobs.keyword_id, CrawlJobs.requests).filter(
+            CrawlJobs.status == "queued"
+        ).order_by(CrawlJobs.created_at, CrawlJobs.id).all()
+        self.db.commit()
+        return {keyword_id: requests for keyword_id, requests in rows}
+
+    def claim(self, worker: str, keyword_ids: Optional[List[int]] = None) -> Optional[Dict[str, Any]]:
+        """
+        대기 작업 하나를 가져와 running 으로 바꾸고 커밋
+        - keyword_ids 가 있으면 그 키워드들의 작업만 목록 순서대로 시도 (크롤링 워커가 YouTube 할당량 계획 순서로 넘김),
+          없으면 가장 오래된 작업
+        - FOR UPDATE SKIP LOCKED: 다른 워커가 가져가는 중인 작업은 건너뜀 (여러 워커 프로세스가 같은 작업을 실행하지 않음)
+        - 세션 밖(다른 스레드/코루틴)에서 쓰도록 필요한 값만 dict 로 반환, 대기 작업이 없으면 None
+        """
+        query = self.db.query(CrawlJobs).filter(CrawlJobs.status == "queued")
+        if keyword_ids is not None:
+            if not keyword_ids:
+                self.db.commit()
+                return None
+            rank = {keyword_id: i for i, keyword_id in enumerate(keyword_ids)}
+            query = query.filter(CrawlJobs.keyword_id.in_(keyword_ids)).order_by(case(rank, value=CrawlJobs.keyword_id))
+        job = query.order_by(CrawlJobs.created_at, CrawlJobs.id).with_for_update(skip_locked=True).first()
+        if job is None:
+            self.db.commit()
+            return None
+
+        now = datetime.now()
+        job.status = "running"
+        job.worker = worker
+        job.attempts += 1
+        job.started_at = now
+        job.heartbeat_at = now
+        claimed = {"id": job.id, "keyword_id": job.keyword_id, "periods": job.periods, "attempts": job.attempts}
+        self.db.commit()
+        return claimed
+
+    def update_progress(self, job_id: int, platform: str, outcome: Dict[str, Any]):
+        """
+        플랫폼 하나의 진행 상황만 갱신 (jsonb || 연산이라 여러 플랫폼이 동시에 갱신해도 서로 덮어쓰지 않음)
+        """
+        self.db.query(CrawlJobs).filter(CrawlJobs.id == job_id).update({
+            CrawlJobs.progress: CrawlJobs.progress.op("||")(cast(json.dumps({platform: outcome}, default=str), JSONB)),
+            CrawlJobs.heartbeat_at: datetime.now(),
+        }, synchronize_session=False)
+        self.db.commit()
+
+    def heartbeat(self, job_id: int):
+        self.db.query(CrawlJobs).filter(CrawlJobs.id == job_id).update(
+            {CrawlJobs.heartbeat_at: datetime.now()}, synchronize_session=False
+        )
+        self.db.commit()
+
+    def finish(self, job_id: int, status: str, message: str, platforms: Optional[Dict[str, Any]] = None):
+        job = self.db.query(CrawlJobs).filter(CrawlJobs.id == job_id).with_for_update().one()
+        job.status = status
+        job.message = message
+        if platforms is not None:
+            job.progress = json.loads(json.dumps({**(job.progress or {}), **platforms}, default=str))
+        job.finished_at = datetime.now()
+        self.db.commit()
+
+    def requeue_stale(self, stale_before: datetime, max_attempts: int) -> int:
+        """
+        heartbeat 가 stale_before 이전에 멈춘 실행 중 작업(워커 비정상 종료)을 다시 대기열로
+        max_attempts 번 실행한 작업은 fail 로 종료, 처리한 작업 수 반환
+        """
+        jobs = self.db.query(CrawlJobs).filter(
+            CrawlJobs.status == "running",
+            CrawlJobs.heartbeat_at < stale_before
+        ).with_for_update(skip_locked=True).all()
+        for job in jobs:
+            if job.attempts >= max_attempts:
+                job.status = "fail"
+                job.message = f"워커 응답 없음 ({job.attempts}회 시도)"
+                job.finished_at = datetime.now()
+            else:
+                job.status = "queued"
+                job.worker = None
+        self.db.commit()
+        return len(jobs)
+
+    def get(self, job_id: int) -> Optional[CrawlJobs]:
+        return self.db.query(CrawlJobs).filter(CrawlJobs.id == job_id).first()
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class SeenVideos:
+    """
+    이미 수집한 영상 id 집합 (키워드와 상관없이 플랫폼별, CrawlerService 가 크롤링 시작 시 DB 에서 한 번 읽음)
+    - 댓글 수집을 끝낸 영상(comments_collected_at 기록)만 포함, 영상 행만 저장되고 댓글 수집이 중단된 영상은 처음 보는 영상으로 취급
+    - 크롤러는 영상 댓글을 요청하기 전에 확인하고, 이미 있는 영상의 댓글은 다시 수집하지 않음
+      (CrawlerService 가 저장할 때 그 영상에 저장된 댓글에 새 키워드 수집 이력(collected_*)만 추가)
+    - delta=True 면 이미 있는 영상도 저장된 가장 최근 댓글 이후의 댓글만 수집 (latest_comments 로 영상별 시각 조회)
+    - 댓글 id 는 메모리에 올리지 않음 (저장 시 기본 키 + ON CONFLICT DO NOTHING 으로 중복 제거)
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[str],
+        delta: bool = False,
+        latest_comments: Optional[Callable[[List[str]], Awaitable[Dict[str, datetime]]]] = None
+    ):
+        self.ids = set(ids)
+        self.delta = delta and latest_comments is not None
+        self.latest_comments = latest_comments
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def split(self, video_ids: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        (처음 보는 영상 id, 이미 수집한 영상 id)
+        """
+        new, known = [], []
+        for video_id in video_ids:
+            (known if video_id in self.ids else new).append(video_id)
+        return new, known
+
+    async def comment_since(self, video_ids: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        이미 수집한 영상 중 댓글을 다시 요청할 영상 → 그 영상에서 수집할 댓글의 기준 시각 (이 시각 이후 댓글만)
+        - delta=False 면 빈 dict (모두 건너뜀)
+        - 기준 시각은 그 영상에 저장된 가장 최근 댓글 작성 시각 (저장된 댓글이 없으면 None → 전체 수집)
+        """
+        known = [video_id for video_id in video_ids if video_id in self.ids]
+        if not self.delta or not known:
+            return {}
+        latest = await self.latest_comments(known)
+        return {video_id: latest.get(video_id) for video_id in known}
@@ -1,11 +1,50 @@
-from typing import List, Dict, Any
+import time
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, date
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Coroutine, Callable, Optional, Sequence, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
 from .sources.youtube import YouTubeCrawler
 from .sources.instiz import InstizCrawler
 from .sources.tiktok import TikTokCrawler
+from app.crawler.pipeline import Page, write_pages
 from app.crawler.repositories import CrawlingRepository
+from app.crawler.quota import QuotaExceeded, QuotaMeter, plan_budget, quota_day
+from app.crawler.seen import SeenVideos
 from app.core.db import SessionLocal
 from app.models.Keywords import Keywords
-from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+PLATFORMS = ("instiz", "tiktok", "youtube")
+
+# 플랫폼 크롤링이 끝난 뒤 올릴 워터마크: (가장 최근 작성 시각, cursor)
+Watermark = Tuple[Optional[datetime], Optional[str]]
+
+# 키워드 하나당 YouTube 길이별 검색 결과 수, 영상당 최대 댓글 수
+YOUTUBE_MAX_VIDEOS = 20
+YOUTUBE_MAX_COMMENTS = 100
+
+
+def newest(
+    items: List[Dict[str, Any]],
+    cursor_key: str,
+    to_datetime: Callable[[Any], Optional[datetime]] = lambda value: value
+) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    수집한 항목 중 가장 최근 작성 시각과 그 항목의 cursor_key 값 (워터마크 갱신용), 없으면 (None, None)
+    """
+    newest_at, cursor = None, None
+    for item in items:
+        created_at = to_datetime(item.get("created_at"))
+        if hasattr(created_at, "to_pydatetime"):  # pandas Timestamp (인스티즈 목록 시각)
+            created_at = created_at.to_pydatetime()
+        if created_at is not None and (newest_at is None or created_at > newest_at):
+            newest_at, cursor = created_at, item.get(cursor_key)
+    return newest_at, cursor
+
 
 class CrawlerService:
     def __init__(self):
@@ -13,77 +52,376 @@ class CrawlerService:
         self.instiz_crawler = InstizCrawler()
         self.tiktok_crawler = TikTokCrawler()
 
+    @staticmethod
+    def youtube_budget() -> int:
+        # 하루 할당량 중 키워드 크롤링에 쓸 수 있는 units
+        return settings.YOUTUBE_DAILY_QUOTA - settings.YOUTUBE_QUOTA_RESERVE
+
+    def plan_youtube(
+        self,
+        keyword_ids: List[Optional[int]],
+        demand: Optional[Dict[int, float]] = None,
+        usage_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        오늘 남은 YouTube 할당량으로 키워드들을 크롤링할 계획과 예상 비용 (예약하지 않음)
+        - 우선순위: 마지막 크롤링 후 경과 시간(CrawlWatermarks.crawled_at, YouTube 크롤링마다 갱신) × (1 + demand[keyword_id])
+          demand 는 호출자가 정하는 수요 가중치 (예: 크롤링 워커는 작업에 합쳐진 추가 요청 수)
+        - 할당량이 모자라면 댓글 페이지부터 줄이고, 그래도 모자란 키워드는 deferred (다음 날로)
+        """
+        usage_date = usage_date or quota_day()
+        demand = demand or {}
+        db = SessionLocal()
+        try:
+            repo = CrawlingRepository(db)
+            remaining = self.youtube_budget() - repo.get_youtube_quota_used(usage_date)
+            crawled_at = repo.get_crawled_times([kid for kid in keyword_ids if kid is not None], "youtube")
+        finally:
+            db.close()
+
+        now = datetime.now()
+        candidates = [
+            {
+                "keyword_id": kid,
+                "staleness_hours": (now - crawled_at[kid]).total_seconds() / 3600 if kid in crawled_at else None,
+                "demand": demand.get(kid, 0.0),
+            }
+            for kid in keyword_ids
+        ]
+        plan = plan_budget(candidates, remaining, YOUTUBE_MAX_VIDEOS, YOUTUBE_MAX_COMMENTS)
+        plan["usage_date"] = usage_date.isoformat()
+        return plan
+
+    def _reserve_youtube(self, keyword_id: int, usage_date: date) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        키워드 하나의 계획을 세우고 예상 비용만큼 할당량을 예약 → (계획, 예약한 units)
+        다른 크롤링이 먼저 예약해 남은 양이 줄었으면 예약된 만큼으로 다시 계획
+        검색 비용도 안 되면 (None, 남은 units)
+        """
+        plan = self.plan_youtube([keyword_id], usage_date=usage_date)
+        item = (plan["scheduled"] or [None])[0]
+        if item is None:
+            return None, plan["budget"]
+
+        db = SessionLocal()
+        try:
+            repo = CrawlingRepository(db)
+            granted = repo.reserve_youtube_quota(usage_date, item["projected_cost"], self.youtube_budget())
+            if granted < item["projected_cost"]:
+                item = (plan_budget([item], granted, YOUTUBE_MAX_VIDEOS, YOUTUBE_MAX_COMMENTS)["scheduled"] or [None])[0]
+                if item is None:
+                    repo.settle_youtube_quota(usage_date, granted, 0)
+                    return None, granted
+            return item, granted
+        finally:
+            db.close()
+
+    def _settle_youtube(self, keyword_id: int, usage_date: date, reserved: int, meter: QuotaMeter):
+        # 크롤링 성공/실패와 상관없이 실제 사용량 정산 + 마지막 크롤링 시각 기록 (크롤링 데이터와 별도 트랜잭션)
+        db = SessionLocal()
+        try:
+            repo = CrawlingRepository(db)
+            repo.settle_youtube_quota(
+                usage_date, reserved, meter.used, exhausted=meter.exhausted, daily_budget=settings.YOUTUBE_DAILY_QUOTA
+            )
+            repo.mark_crawled(keyword_id, "youtube")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _latest_comment_times(platform: str, video_ids: List[str]) -> Dict[str, datetime]:
+        # 크롤링 중 저장과 동시에 호출되므로 저장 세션과 따로 세션을 열고 닫음
+        db = SessionLocal()
+        try:
+            return CrawlingRepository(db).get_latest_comment_times(platform, video_ids)
+        finally:
+            db.close()
+
+    async def _seen_videos(self, repo: CrawlingRepository, platform: str, delta: bool) -> SeenVideos:
+        """
+        크롤링 시작 시점까지 저장된 platform 영상 id (app.crawler.seen), 크롤러가 댓글 요청 전에 확인
+        """
+        ids = await asyncio.to_thread(repo.get_video_ids, platform)
+
+        async def latest_comments(video_ids: List[str]) -> Dict[str, datetime]:
+            return await asyncio.to_thread(self._latest_comment_times, platform, video_ids)
+
+        return SeenVideos(ids, delta=delta, latest_comments=latest_comments)
+
     async def crawl_instiz(self, keyword_obj: Keywords, starttime: str, endtime: str) -> List[Dict[str, Any]]:
         return await self.instiz_crawler.crawl(keyword=keyword_obj, starttime=starttime, endtime=endtime)
 
     async def crawl_tiktok(self, keyword_obj: Keywords, start_date: str, end_date: str) -> Dict[str, Any]:
         return await self.tiktok_crawler.crawl(keyword=keyword_obj, start_date=start_date, end_date=end_date)
 
-    async def crawl_all(self, keyword_obj: Keywords, youtube_period: Dict[str, str], instiz_period: Dict[str, str], tiktok_period: Dict[str, str]) -> Dict[str, Any]:
+    async def _stream_save(
+        self,
+        db: Session,
+        pages: AsyncIterator[Page],
+        save_page: Callable[[Page], Dict[str, int]],
+        newest_of: Callable[[Page], Tuple[Optional[datetime], Optional[str]]]
+    ) -> Tuple[Dict[str, int], Tuple[Optional[datetime], Optional[str]]]:
         """
-        3개 플랫폼(YouTube, Instiz, TikTok) 크롤링 및 저장을 한 번에 수행.
-        하나라도 실패하면 전체 롤백. 성공 시 완료 로그 반환.
+        크롤러가 내보내는 페이지를 받는 대로 저장 (app.crawler.pipeline.write_pages, 쌓이는 페이지는 CRAWL_PAGE_QUEUE_SIZE 까지)
+        - 페이지마다 save_page 를 스레드에서 실행하고 바로 커밋 (실패하면 그 페이지만 롤백하고 예외 전파)
+          다른 키워드 크롤링이 같은 영상/채널/댓글을 저장할 때 이 크롤링이 끝날 때까지 기다리지 않도록 트랜잭션을 페이지 단위로 유지
+        - 반환: (저장 건수 합계, 저장한 페이지 중 가장 최근 작성 시각과 cursor)
         """
-        db = SessionLocal()
-        repo = CrawlingRepository(db)
-        try:
-            # 1. Instiz
+        saved = Counter()
+        latest: Tuple[Optional[datetime], Optional[str]] = (None, None)
+
+        def save(page: Page) -> Dict[str, int]:
             try:
-                instiz_data = await self.instiz_crawler.crawl(
-                    keyword=keyword_obj,
-                    starttime=instiz_period["starttime"],
-                    endtime=instiz_period["endtime"]
-                )
-                if not repo.create_instiz_posts(instiz_data):
-                    raise Exception("Instiz 저장 실패")
-            except Exception as e:
+                counts = save_page(page)
+                db.commit()
+            except Exception:
                 db.rollback()
-                return {"status": "fail", "message": f"[Instiz] 저장 실패: {str(e)}"}
+                raise
+            return counts
 
-            # 2. TikTok
-            try:
-                tiktok_data = await self.tiktok_crawler.crawl(
-                    keyword=keyword_obj,
-                    start_date=tiktok_period["start_date"],
-                    end_date=tiktok_period["end_date"]
-                )
+        async def write(page: Page):
+            nonlocal latest
+            saved.update(await asyncio.to_thread(save, page))
+            created_at, cursor = newest_of(page)
+            if created_at is not None and (latest[0] is None or created_at > latest[0]):
+                latest = (created_at, cursor)
 
-                tiktok_videos = tiktok_data["videos"]
-                tiktok_comments = tiktok_data["comments"]
+        await write_pages(pages, write, settings.CRAWL_PAGE_QUEUE_SIZE)
+        return dict(saved), latest
 
-                if tiktok_videos and not repo.create_tiktok_videos(tiktok_videos):
-                    raise Exception("TikTok 영상 저장 실패")
+    async def _save_instiz(
+        self,
+        db: Session,
+        keyword_obj: Keywords,
+        period: Dict[str, str],
+        watermarks: Dict[str, Watermark]
+    ) -> Dict[str, int]:
+        # InstizCrawler 는 httpx 기반 네이티브 async 라서 현재 이벤트 루프에서 바로 실행
+        repo = CrawlingRepository(db)
+        since = await asyncio.to_thread(repo.get_watermark, keyword_obj.id, "instiz")
+        saved, (last_created_at, cursor) = await self._stream_save(
+            db,
+            self.instiz_crawler.pages(
+                keyword=keyword_obj,
+                starttime=period["starttime"],
+                endtime=period["endtime"],
+                since=since
+            ),
+            lambda page: repo.create_instiz_posts(page["posts"], commit=False),
+            lambda page: newest(page["posts"], "post_url")
+        )
+        watermarks["instiz"] = (last_created_at, cursor)
+        return saved
 
-                if tiktok_comments and not repo.create_tiktok_comments(tiktok_comments):
-                    raise Exception("TikTok 댓글 저장 실패")
+    async def _save_tiktok(
+        self,
+        db: Session,
+        keyword_obj: Keywords,
+        period: Dict[str, str],
+        watermarks: Dict[str, Watermark]
+    ) -> Dict[str, int]:
+        # TikTokCrawler 는 Selenium 검색 결과 스크롤만 스레드에서 돌리고 댓글은 현재 이벤트 루프에서 비동기 수집
+        # 워터마크는 기록만 하고 검색 기간은 좁히지 않음 (이미 수집한 영상은 seen 으로 댓글 요청 생략)
+        repo = CrawlingRepository(db)
+        seen = await self._seen_videos(repo, "tiktok", settings.CRAWL_SEEN_DELTA_TIKTOK)
 
-            except Exception as e:
-                db.rollback()
-                return {"status": "fail", "message": f"[TikTok] 저장 실패: {str(e)}"}
+        def save_page(page: Page) -> Dict[str, int]:
+            saved = {}
+            if page.get("videos"):
+                saved.update(repo.create_tiktok_videos(page["videos"], commit=False))
+                # 이미 수집한 영상은 댓글을 다시 받지 않으므로 저장된 댓글에 수집 이력만 추가
+                _, known = seen.split(video["id"] for video in page["videos"])
+                saved["comments_linked"] = repo.link_seen_comments("tiktok", known, keyword_obj.id, datetime.now())
+            if page.get("comments"):
+                saved.update(repo.create_tiktok_comments(page["comments"], commit=False))
+            if page.get("completed_videos"):
+                # 댓글을 끝까지 수집한 영상만 다음 크롤링부터 이미 수집한 영상으로 취급
+                saved["videos_completed"] = repo.mark_comments_collected("tiktok", page["completed_videos"], datetime.now())
+            return saved
 
-            # 3. YouTube
-            try:
-                yt_result = await self.youtube_crawler.crawl(
-                    keyword=keyword_obj,
-                    max_videos=20,
-                    max_comments=100,
-                    published_after=youtube_period["starttime"],
-                    published_before=youtube_period["endtime"]
+        saved, (last_created_at, cursor) = await self._stream_save(
+            db,
+            self.tiktok_crawler.pages(
+                keyword=keyword_obj,
+                start_date=period["start_date"],
+                end_date=period["end_date"],
+                seen=seen
+            ),
+            save_page,
+            lambda page: newest(page.get("comments", []), "id")
+        )
+        watermarks["tiktok"] = (last_created_at, cursor)
+        return saved
+
+    async def _save_youtube(
+        self,
+        db: Session,
+        keyword_obj: Keywords,
+        period: Dict[str, str],
+        watermarks: Dict[str, Watermark]
+    ) -> Dict[str, int]:
+        # YouTubeCrawler 는 httpx 기반 네이티브 async 라서 현재 이벤트 루프에서 바로 실행
+        # 예상 비용만큼 오늘 할당량을 먼저 예약하고, 끝나면 (실패해도) 실제 사용량으로 정산
+        usage_date = quota_day()
+        item, reserved = await asyncio.to_thread(self._reserve_youtube, keyword_obj.id, usage_date)
+        if item is None:
+            raise QuotaExceeded("search", 0, reserved)
+        meter = QuotaMeter(limit=reserved, comment_calls=item["comment_calls"])
+
+        repo = CrawlingRepository(db)
+        try:
+            # 댓글 기준 시각은 키워드 워터마크가 아니라 영상별로 저장된 최신 댓글 (seen, 처음 보는 영상은 전체 수집)
+            seen = await self._seen_videos(repo, "youtube", settings.CRAWL_SEEN_DELTA_YOUTUBE)
+
+            def save_page(page: Page) -> Dict[str, int]:
+                saved = repo.create_youtube_data(
+                    channels=page.get("channels", []),
+                    videos=page.get("videos", []),
+                    comments=page.get("comments", []),
+                    commit=False
                 )
-                if not repo.create_youtube_data(
-                    channels=yt_result["channels"],
-                    videos=yt_result["videos"],
-                    comments=yt_result["comments"]
-                ):
-                    raise Exception("YouTube 저장 실패")
-            except Exception as e:
-                db.rollback()
-                return {"status": "fail", "message": f"[YouTube] 저장 실패: {str(e)}"}
+                # 이미 수집한 영상은 댓글을 다시 받지 않으므로 저장된 댓글에 수집 이력만 추가
+                _, known = seen.split(video["id"] for video in page.get("videos", []))
+                saved["comments_linked"] = repo.link_seen_comments("youtube", known, keyword_obj.id, datetime.now())
+                # 댓글을 끝까지 수집한 영상만 다음 크롤링부터 이미 수집한 영상으로 취급
+                saved["videos_completed"] = repo.mark_comments_collected("youtube", page.get("completed_videos", []), datetime.now())
+                return saved
+
+            saved, (last_created_at, cursor) = await self._stream_save(
+                db,
+                self.youtube_crawler.pages(
+                    keyword=keyword_obj,
+                    max_videos=item["max_videos"],
+                    max_comments=item["max_comments"],
+                    published_after=period["starttime"],
+                    published_before=period["endtime"],
+                    quota=meter,
+                    seen=seen
+                ),
+                # 첫 페이지(채널/영상)가 저장된 뒤에 댓글 페이지가 옴
+                save_page,
+                lambda page: newest(page.get("comments", []), "id", YouTubeCrawler.parse_time)
+            )
+        finally:
+            await asyncio.to_thread(self._settle_youtube, keyword_obj.id, usage_date, reserved, meter)
+        print(f"[LOG] YouTube 할당량: 예상 {item['projected_cost']} / 사용 {meter.used} units (댓글 {item['comment_pages']}페이지)")
+
+        watermarks["youtube"] = (last_created_at, cursor)
+        return {**saved, "quota_projected": item["projected_cost"], "quota_used": meter.used}
 
+    @staticmethod
+    def _advance_watermarks(keyword_id: int, watermarks: Dict[str, Watermark]):
+        # 여러 플랫폼의 워터마크를 한 세션, 한 트랜잭션으로 커밋 (하나라도 실패하면 모두 롤백)
+        db = SessionLocal()
+        try:
+            repo = CrawlingRepository(db)
+            for platform, (last_created_at, cursor) in watermarks.items():
+                repo.advance_watermark(keyword_id, platform, last_created_at, cursor, commit=False)
             db.commit()
-            return {"status": "success", "message": "✅ 모든 플랫폼 크롤링 및 저장이 성공적으로 완료되었습니다."}
-        except Exception as e:
+        except Exception:
             db.rollback()
-            return {"status": "fail", "message": f"[전체 실패] {str(e)}"}
+            raise
         finally:
             db.close()
+
+    async def _timed(self, name: str, job: Coroutine) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            saved = await job
+            outcome = {"status": "success", "saved": saved}
+        except Exception as e:
+            logger.exception(f"[CRAWL ERROR] {name} 크롤링/저장 실패")
+            outcome = {"status": "fail", "message": str(e)}
+        outcome["elapsed"] = round(time.perf_counter() - start, 2)
+        print(f"[LOG] {name} {outcome['status']} ({outcome['elapsed']:.2f}초)")
+        return outcome
+
+    async def crawl_all(
+        self,
+        keyword_obj: Keywords,
+        youtube_period: Dict[str, str],
+        instiz_period: Dict[str, str],
+        tiktok_period: Dict[str, str],
+        partial: bool = False,
+        progress: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+        deferred: Sequence[str] = ()
+    ) -> Dict[str, Any]:
+        """
+        3개 플랫폼(YouTube, Instiz, TikTok) 크롤링 및 저장을 동시에 수행.
+        - 플랫폼마다 자기 DB 세션에 크롤러가 내보내는 페이지 단위로 저장하고 페이지마다 커밋 (수집이 끝나기를 기다리지 않음,
+          동시에 실행 중인 다른 키워드 크롤링이 같은 영상/채널/댓글을 저장해도 긴 트랜잭션의 잠금을 기다리지 않음)
+        - 세 작업이 모두 끝난 뒤 아래 규칙으로 워터마크(CrawlWatermarks)를 한 트랜잭션으로 커밋
+          (이미 커밋된 수집 데이터는 되돌리지 않음, all-or-nothing 은 워터마크와 작업 상태에만 적용)
+        - partial=False (기본): 하나라도 실패하면 어떤 플랫폼의 워터마크도 올리지 않음
+        - partial=True: 성공한 플랫폼의 워터마크만 올리고 플랫폼별 결과를 함께 반환 (일부만 성공하면 status="partial")
+        - 워터마크 커밋이 실패하면 그 트랜잭션에 포함된 플랫폼 모두 실패로 보고
+          (Instiz 는 워터마크 이후 게시글만 수집, 중간에 실패한 크롤링은 다음 실행에서 같은 구간부터 다시 수집,
+          이미 저장한 행은 저장 시 중복 제거)
+        - 다른 키워드로 이미 수집한 YouTube/TikTok 영상(SeenVideos)은 댓글을 다시 수집하지 않고 수집 이력만 추가
+          (CRAWL_SEEN_DELTA_* 면 저장된 최신 댓글 이후의 댓글만 추가 수집)
+        - YouTube 는 오늘 남은 API 할당량으로 세운 계획(plan_youtube)만큼 예약 후 크롤링, 남은 양이 검색 비용도 안 되면 실패
+        - deferred 에 넣은 플랫폼은 이번에 크롤링하지 않고 {"status": "deferred"} 로 보고 (워터마크도 그대로)
+          실패로 세지 않으며, 나머지가 모두 성공하면 status="partial"
+          (크롤링 작업 워커가 할당량 계획에서 보류된 키워드의 YouTube 를 빼고 실행할 때 사용)
+        - progress(platform, outcome): 플랫폼마다 시작할 때 {"status": "running"}, 크롤링/저장(커밋 전)이 끝나면
+          {"status": "crawled" 또는 "fail", ...} 으로 호출 (크롤링 작업 워커의 진행 상황 기록용)
+        전체 소요 시간은 세 플랫폼의 합이 아니라 가장 느린 플랫폼 기준.
+        """
+        sessions = {name: SessionLocal() for name in PLATFORMS if name not in deferred}
+        watermarks: Dict[str, Watermark] = {}
+        savers = {"instiz": self._save_instiz, "tiktok": self._save_tiktok, "youtube": self._save_youtube}
+        periods = {"instiz": instiz_period, "tiktok": tiktok_period, "youtube": youtube_period}
+        jobs = {name: savers[name](db, keyword_obj, periods[name], watermarks) for name, db in sessions.items()}
+        labels = {"instiz": "Instiz", "tiktok": "TikTok", "youtube": "YouTube"}
+        skipped = {
+            name: {"status": "deferred", "message": "할당량 부족으로 이번 작업에서 제외 (다음 요청 때 크롤링)"}
+            for name in PLATFORMS if name in deferred
+        }
+
+        async def run(name: str, job: Coroutine) -> Dict[str, Any]:
+            if progress is not None:
+                await progress(name, {"status": "running"})
+            outcome = await self._timed(labels[name], job)
+            if progress is not None:
+                await progress(name, {**outcome, "status": "crawled" if outcome["status"] == "success" else "fail"})
+            return outcome
+
+        try:
+            for name, outcome in skipped.items():
+                if progress is not None:
+                    await progress(name, outcome)
+            outcomes = await asyncio.gather(*(run(name, job) for name, job in jobs.items()))
+            platforms = {**skipped, **dict(zip(jobs, outcomes))}
+            failed = [name for name, outcome in platforms.items() if outcome["status"] == "fail"]
+
+            # 워터마크는 크롤링이 모두 끝난 뒤 한 트랜잭션으로 커밋
+            # (all-or-nothing 이면 실패가 하나라도 있을 때 커밋하지 않음)
+            advance = [] if failed and not partial else [name for name in jobs if name not in failed]
+            if advance:
+                try:
+                    await asyncio.to_thread(
+                        self._advance_watermarks, keyword_obj.id, {name: watermarks[name] for name in advance}
+                    )
+                except Exception as e:
+                    logger.exception("[CRAWL ERROR] 워터마크 커밋 실패")
+                    for name in advance:
+                        platforms[name] = {**platforms[name], "status": "fail", "message": f"워터마크 커밋 실패: {e}"}
+                    failed.extend(advance)
+
+            if not failed and skipped:
+                messages = ", ".join(f"[{labels[name]}] {outcome['message']}" for name, outcome in skipped.items())
+                return {"status": "partial", "message": f"일부 플랫폼 보류: {messages}", "platforms": platforms}
+            if not failed:
+                return {"status": "success", "message": "✅ 모든 플랫폼 크롤링 및 저장이 성공적으로 완료되었습니다.", "platforms": platforms}
+
+            messages = ", ".join(f"[{labels[name]}] {platforms[name]['message']}" for name in failed)
+            if partial and len(failed) < len(jobs):
+                return {"status": "partial", "message": f"일부 플랫폼 저장 실패: {messages}", "platforms": platforms}
+            return {"status": "fail", "message": f"저장 실패: {messages}", "platforms": platforms}
+        except Exception as e:
+            for db in sessions.values():
+                db.rollback()
+            return {"status": "fail", "message": f"[전체 실패] {str(e)}"}
+        finally:
+            for db in sessions.values():
+                db.close()
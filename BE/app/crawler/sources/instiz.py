@@ -1,19 +1,315 @@
-import urllib.request
-import datetime
-from bs4 import BeautifulSoup
-from lxml import html
 import re
+import asyncio
+import datetime
 import urllib.parse
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+
+import httpx
 import pandas as pd
+from bs4 import BeautifulSoup
+from lxml import html
 
+from app.core.config import settings
+from app.crawler.cache import OfflineCacheMiss, cached_transport
+from app.crawler.pipeline import Page, batched, drain
 from app.models import Keywords
 
+
 class InstizCrawler:
-    def __init__(self):
-        # 현재는 초기화할 값이 없으나, 확장성을 위해 남겨둡니다.
-        pass
+    """
+    인스티즈 '익명잡담' 게시판 비동기 크롤러 (httpx.AsyncClient)
+    - 목록 페이지는 본문 수집을 기다리지 않고 listing_prefetch 페이지까지 앞서 가져옴
+    - 게시글 본문은 호스트별 max_per_host 개까지 keep-alive 연결로 병렬 요청
+    - stream() 은 본문 수집이 끝나는 순서대로 게시글을 하나씩 내보냄 (crawl() 은 전부 모아서 반환)
+    - pages() 는 page_size 개씩 묶어서 내보내고, 소비가 밀리면 본문/목록 수집도 멈춤 (버퍼는 page_size 개)
+    """
+
+    MAX_PAGES = 99
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+    MAX_RETRIES = 2
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_per_host: Optional[int] = None,
+        listing_prefetch: Optional[int] = None,
+        page_size: Optional[int] = None,
+        timeout: float = 15.0
+    ):
+        self.base_url = (base_url or settings.INSTIZ_BASE_URL).rstrip("/")
+        self.max_per_host = max_per_host or settings.INSTIZ_MAX_PER_HOST
+        self.listing_prefetch = listing_prefetch or settings.INSTIZ_LISTING_PREFETCH
+        self.page_size = page_size or settings.CRAWL_PAGE_SIZE
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        # 호스트 → 동시 요청 제한 세마포어
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["InstizCrawler"]:
+        """
+        keep-alive 커넥션 풀을 공유하는 AsyncClient 를 열고 닫음 (이미 열려 있으면 그대로 재사용)
+        """
+        if self._client is not None:
+            yield self
+            return
+
+        limits = httpx.Limits(max_keepalive_connections=self.max_per_host)
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=limits,
+            transport=cached_transport("instiz", limits)
+        )
+        self._host_limits = {}
+        try:
+            yield self
+        finally:
+            await self._client.aclose()
+            self._client = None
+            self._host_limits = {}
+
+    async def _fetch(self, url: str) -> bytes:
+        """
+        GET url 후 본문 bytes 반환 (session() 안에서 호출, 호스트별 동시 요청 수 제한)
+        """
+        host = httpx.URL(url).host
+        limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.max_per_host))
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with limit:
+                    response = await self._client.get(url)
+            except httpx.TransportError:
+                if attempt == self.MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUS or attempt == self.MAX_RETRIES:
+                    response.raise_for_status()
+                    return response.content
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+    def listing_url(self, keyword: str, page: int, starttime: str, endtime: str) -> str:
+        encoded_keyword = urllib.parse.quote(keyword, safe='')
+        return (
+            f'{self.base_url}/name?page={page}&category=1'
+            f'&k={encoded_keyword}&stype=9&starttime={starttime}&endtime={endtime}'
+        )
+
+    @staticmethod
+    def _parse_regdate(timestr: str, start_date: datetime.datetime) -> datetime.datetime:
+        """
+        목록의 작성 시각("10.30 23:58" 또는 "10.30")에 start_date 기준으로 가장 가까운 연도를 붙임
+        """
+        try:
+            # 일단 현재 연도 기준으로 파싱
+            tmp_datetime = pd.to_datetime(f"{start_date.year}.{timestr}", format="%Y.%m.%d %H:%M", errors="coerce")
+            if tmp_datetime is None or pd.isna(tmp_datetime):
+                tmp_datetime = pd.to_datetime(f"{start_date.year}.{timestr}", format="%Y.%m.%d", errors="coerce")
+        except:
+            tmp_datetime = None
+
+        if tmp_datetime is None or pd.isna(tmp_datetime):
+            return start_date  # fallback
+
+        # 연도 보정: start_date 기준으로 가장 가까운 연도 선택
+        candidates = [
+            tmp_datetime.replace(year=start_date.year - 1),
+            tmp_datetime.replace(year=start_date.year),
+            tmp_datetime.replace(year=start_date.year + 1),
+        ]
+        return min(candidates, key=lambda d: abs((d - start_date).days))
+
+    def parse_listing(self, page_html: str, start_date: datetime.datetime) -> Tuple[bool, List[Dict[str, Any]]]:
+        """
+        목록 페이지에서 게시글 행 정보를 추출
+        (목록 행이 있었는지 여부, 본문을 가져올 게시글 목록) 반환
+        """
+        soup = BeautifulSoup(page_html, 'html.parser')
+        rows = soup.select('tr#detour')
+        posts = []
+        for row in rows:
+            title_cell = row.select_one('td.listsubject a')
+            if not title_cell or not title_cell.has_attr('href'):
+                continue
+            post_url = self.base_url + title_cell['href'].replace('..', '')
+
+            # green이 url에 포함된 경우 건너뜀
+            if 'green' in post_url:
+                continue
+
+            # 날짜 파싱
+            time_cell = row.select_one('td.listno.regdate')
+            parsed_time = self._parse_regdate(time_cell.get_text(strip=True), start_date) if time_cell else start_date
+
+            # 조회수, 추천수
+            listnos = row.select('td.listno')
+            view = int(listnos[-2].get_text(strip=True).replace(',', '') if len(listnos) >= 3 else 0)
+            like = int(listnos[-1].get_text(strip=True).replace(',', '') if len(listnos) >= 3 else 0)
+
+            # 댓글 수
+            comment_span = row.select_one('span.cmt2')
+            comment = int(comment_span.get_text(strip=True) if comment_span else 0)
+
+            posts.append({
+                "title": title_cell.get_text(strip=True),
+                "post_url": post_url,
+                "view_count": view,
+                "like_count": like,
+                "comment_count": comment,
+                "created_at": parsed_time,
+            })
+        return bool(rows), posts
 
-    async def crawl(self, keyword: Keywords, starttime: str, endtime: str):
+    @staticmethod
+    def parse_post_body(post_html: bytes) -> str:
+        doc = html.fromstring(post_html)
+        content_div = doc.get_element_by_id('memo_content_1')
+        for tag in content_div.xpath('.//script | .//style | .//img'):
+            tag.getparent().remove(tag)
+        return re.sub(r'\s+', ' ', content_div.text_content()).strip()
+
+    async def _fetch_post(self, keyword_id: int, post: Dict[str, Any], collected_time: datetime.datetime) -> Optional[Dict[str, Any]]:
+        # 본문 크롤링
+        try:
+            clean_body = self.parse_post_body(await self._fetch(post["post_url"]))
+        except OfflineCacheMiss:
+            raise
+        except Exception:
+            clean_body = ''
+
+        # ✅ '죄송해요,' 안내글 거르기
+        if clean_body.startswith("죄송해요,"):
+            return None
+
+        # ✅ 제목 + 본문 조합
+        return {
+            "keyword_id": keyword_id,
+            "content": f"{post['title']} {clean_body}".strip(),
+            "view_count": post["view_count"],
+            "like_count": post["like_count"],
+            "comment_count": post["comment_count"],
+            "post_url": post["post_url"],
+            "created_at": post["created_at"],
+            "updated_at": post["created_at"],
+            "collected_at": collected_time,
+        }
+
+    async def _fetch_page_posts(
+        self,
+        keyword_id: int,
+        posts: List[Dict[str, Any]],
+        collected_time: datetime.datetime,
+        out: asyncio.Queue,
+        window: asyncio.Semaphore
+    ):
+        async def fetch_one(post):
+            result = await self._fetch_post(keyword_id, post, collected_time)
+            if result is not None:
+                await out.put(result)
+
+        try:
+            await asyncio.gather(*(fetch_one(post) for post in posts))
+        finally:
+            window.release()
+
+    async def _walk_listings(
+        self,
+        keyword: Keywords,
+        starttime: str,
+        endtime: str,
+        out: asyncio.Queue,
+        since: Optional[datetime.datetime] = None
+    ):
+        """
+        목록 페이지를 순서대로 가져오면서 페이지마다 본문 수집 태스크를 띄움
+        - 본문 수집이 끝나지 않은 페이지가 listing_prefetch 개면 다음 목록 요청을 기다림
+        - 목록 행이 없거나 유효한 게시글이 없는 페이지에서 종료
+        - out 이 가득 차면(소비가 밀리면) 본문 수집 태스크가 기다리고, 그만큼 window 가 풀리지 않아 목록 요청도 멈춤
+        - since 가 있으면 검색 시작일을 since 날짜로 좁히고, since 보다 오래된 게시글(이미 수집)은 본문을 가져오지 않으며
+          한 페이지가 전부 이미 수집한 게시글이면 (목록은 최신순) 더 이상 다음 페이지를 요청하지 않음
+        """
+        start_date = datetime.datetime.strptime(starttime, "%Y%m%d")
+        if since is not None:
+            starttime = max(starttime, since.strftime("%Y%m%d"))
+        collected_time = datetime.datetime.utcnow()
+        window = asyncio.Semaphore(self.listing_prefetch)
+        pending = set()
+
+        try:
+            for page in range(1, self.MAX_PAGES + 1):
+                await window.acquire()
+                try:
+                    page_html = (await self._fetch(self.listing_url(keyword.keyword, page, starttime, endtime))).decode('utf-8')
+                    has_rows, posts = self.parse_listing(page_html, start_date)
+                except OfflineCacheMiss:
+                    raise
+                except Exception:
+                    window.release()
+                    continue
+
+                if not has_rows or not posts:
+                    window.release()
+                    break
+
+                reached_known = False
+                if since is not None:
+                    # 목록 시각은 분 단위라 since 와 같은 시각의 글은 다시 가져옴 (저장 시 post_url 로 중복 제거)
+                    fresh = [post for post in posts if post["created_at"] >= since]
+                    reached_known = len(fresh) < len(posts)
+                    posts = fresh
+                    if not posts:
+                        window.release()
+                        break
+
+                task = asyncio.create_task(self._fetch_page_posts(keyword.id, posts, collected_time, out, window))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+                # 이미 수집한 글이 나온 페이지 이후는 모두 더 오래된 글
+                if reached_known:
+                    break
+
+            await asyncio.gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def stream(
+        self,
+        keyword: Keywords,
+        starttime: str,
+        endtime: str,
+        since: Optional[datetime.datetime] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        검색된 게시글을 본문 수집이 끝나는 순서대로 하나씩 반환 (InstizPosts 저장용 dict)
+        """
+        async with self.session():
+            out: asyncio.Queue = asyncio.Queue(maxsize=self.page_size)
+            walker = asyncio.create_task(self._walk_listings(keyword, starttime, endtime, out, since))
+            posts = drain(out, walker)
+            try:
+                async for post in posts:
+                    yield post
+            finally:
+                await posts.aclose()
+
+    async def pages(
+        self,
+        keyword: Keywords,
+        starttime: str,
+        endtime: str,
+        since: Optional[datetime.datetime] = None
+    ) -> AsyncIterator[Page]:
+        """
+        stream() 결과를 page_size 개씩 묶어 {"posts": [...]} 로 반환 (CrawlerService 가 페이지마다 저장)
+        """
+        async for posts in batched(self.stream(keyword, starttime, endtime, since), self.page_size):
+            yield {"posts": posts}
+
+    async def crawl(self, keyword: Keywords, starttime: str, endtime: str, since: Optional[datetime.datetime] = None):
         """
         인스티즈 '익명잡담' 게시판에서 특정 키워드로 검색된 글들을 크롤링하여
         InstizPosts 모델에 저장하기 적합한 dict 리스트로 반환합니다.
@@ -22,114 +318,9 @@ class InstizCrawler:
             keyword (Keywords): 키워드 모델 인스턴스 (keyword.id, keyword.keyword 사용)
             starttime (str): 검색 시작 날짜 (형식: YYYYMMDD)
             endtime (str): 검색 종료 날짜 (형식: YYYYMMDD)
+            since (datetime): 이 키워드로 이전에 수집한 가장 최근 게시글 작성 시각 (CrawlWatermarks), 이보다 새 글만 수집
 
         Returns:
             List[dict]: InstizPosts 테이블 저장용 데이터 리스트
         """
-        results = []
-        base_url = "https://www.instiz.net"
-        encoded_keyword = urllib.parse.quote(keyword.keyword, safe='')
-        start_date = datetime.datetime.strptime(starttime, "%Y%m%d")
-        collected_time = datetime.datetime.utcnow()
-
-        for page in range(1, 100):
-            try:
-                full_url = (
-                    f'{base_url}/name?page={page}&category=1'
-                    f'&k={encoded_keyword}&stype=9&starttime={starttime}&endtime={endtime}'
-                )
-                response = urllib.request.urlopen(full_url)
-                soup = BeautifulSoup(response.read().decode('utf-8'), 'html.parser')
-                rows = soup.select('tr#detour')
-                if not rows:
-                    break
-
-                valid_post_found = False
-                for row in rows:
-                    title_cell = row.select_one('td.listsubject a')
-                    if not title_cell or not title_cell.has_attr('href'):
-                        continue
-                    post_href = title_cell['href']
-                    post_url = base_url + post_href.replace('..', '')
-
-                    # green이 url에 포함된 경우 건너뜀
-                    if 'green' in post_url:
-                        continue
-
-                    valid_post_found = True
-
-                    # 날짜 파싱
-                    time_cell = row.select_one('td.listno.regdate')
-                    if time_cell:
-                        timestr = time_cell.get_text(strip=True)  # 예: "10.30 23:58" 또는 "10.30"
-                        try:
-                            # 일단 현재 연도 기준으로 파싱
-                            tmp_datetime = pd.to_datetime(f"{start_date.year}.{timestr}", format="%Y.%m.%d %H:%M", errors="coerce")
-                            if tmp_datetime is None or pd.isna(tmp_datetime):
-                                tmp_datetime = pd.to_datetime(f"{start_date.year}.{timestr}", format="%Y.%m.%d", errors="coerce")
-                        except:
-                            tmp_datetime = None
-
-                        if tmp_datetime:
-                            # 연도 보정: start_date 기준으로 가장 가까운 연도 선택
-                            candidates = [
-                                tmp_datetime.replace(year=start_date.year - 1),
-                                tmp_datetime.replace(year=start_date.year),
-                                tmp_datetime.replace(year=start_date.year + 1),
-                            ]
-                            parsed_time = min(candidates, key=lambda d: abs((d - start_date).days))
-                        else:
-                            parsed_time = start_date  # fallback
-                    else:
-                        parsed_time = start_date  # fallback
-
-                    # 조회수, 추천수
-                    listnos = row.select('td.listno')
-                    view = int(listnos[-2].get_text(strip=True).replace(',', '') if len(listnos) >= 3 else 0)
-                    like = int(listnos[-1].get_text(strip=True).replace(',', '') if len(listnos) >= 3 else 0)
-
-                    # 댓글 수
-                    comment_span = row.select_one('span.cmt2')
-                    comment = int(comment_span.get_text(strip=True) if comment_span else 0)
-
-                    # 본문 크롤링
-                    try:
-                        post_resp = urllib.request.urlopen(post_url)
-                        post_html = post_resp.read()
-                        doc = html.fromstring(post_html)
-                        content_div = doc.get_element_by_id('memo_content_1')
-                        for tag in content_div.xpath('.//script | .//style | .//img'):
-                            tag.getparent().remove(tag)
-                        text = content_div.text_content()
-                        clean_body = re.sub(r'\s+', ' ', text).strip()
-                    except Exception:
-                        clean_body = ''
-
-                    # ✅ '죄송해요,' 안내글 거르기
-                    if clean_body.startswith("죄송해요,"):
-                        continue
-
-                    # ✅ 제목 + 본문 조합
-                    title_text = title_cell.get_text(strip=True)
-                    full_content = f"{title_text} {clean_body}".strip()
-
-
-
-                    results.append({
-                        "keyword_id": keyword.id,
-                        "content": full_content,
-                        "view_count": view,
-                        "like_count": like,
-                        "comment_count": comment,
-                        "post_url": post_url,
-                        "created_at": parsed_time,
-                        "updated_at": parsed_time,
-                        "collected_at": collected_time,
-                    })
-
-                if not valid_post_found:
-                    break
-            except Exception:
-                continue
-
-        return results
+        return [post async for post in self.stream(keyword, starttime, endtime, since)]
@@ -2,14 +2,21 @@
 
 import time
 import re
+import asyncio
+import threading
 import emoji
+import httpx
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from .tiktokcomment import TiktokComment
+from .tiktokcomment import AsyncTiktokComment
 from .tiktokcomment.typing import Comments, Comment
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator
+from app.core.config import settings
+from app.crawler.cache import OfflineCacheMiss, cached_transport, get_http_cache
+from app.crawler.pipeline import Page, collect_pages, drain
+from app.crawler.seen import SeenVideos
 from app.models import Keywords
 
 class TikTokCrawler:
@@ -28,14 +35,170 @@ class TikTokCrawler:
             return False
         return True
 
-    async def crawl(self, keyword: Keywords, start_date: str, end_date: str) -> Dict[str, List[Dict[str, Any]]]:
+    async def crawl(
+        self,
+        keyword: Keywords,
+        start_date: str,
+        end_date: str,
+        seen: Optional[SeenVideos] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        TikTok 영상 및 댓글을 함께 크롤링합니다.
+        TikTok 영상 및 댓글을 함께 크롤링합니다. (pages() 결과를 모두 모아서 반환, 저장하면서 수집할 때는 pages() 사용)
         :return: {
             "videos": [video_dict, ...],
             "comments": [comment_dict, ...]
         }
         """
+        collected = await collect_pages(self.pages(keyword, start_date, end_date, seen))
+        return {
+            "videos": collected.get("videos", []),
+            "comments": collected.get("comments", [])
+        }
+
+    async def pages(
+        self,
+        keyword: Keywords,
+        start_date: str,
+        end_date: str,
+        seen: Optional[SeenVideos] = None
+    ) -> AsyncIterator[Page]:
+        """
+        TikTok 영상과 댓글을 페이지 단위로 반환
+        - 영상이 발견되면 {"videos": [video]}, 이어서 그 영상의 댓글 목록 한 페이지마다 {"comments": [...]},
+          댓글을 끝까지 수집하면 {"completed_videos": [video_id]}
+          (영상 페이지가 항상 그 영상의 댓글 페이지보다 먼저 나옴)
+        - 검색 기간(start_date ~ end_date)은 항상 그대로 검색 (다시 크롤링해도 이전에 본 영상이 다시 나옴)
+        - 구글 검색 결과 스크롤(Selenium)은 별도 스레드에서 실행하고, 영상이 발견되는 즉시
+          이벤트 루프에서 해당 영상의 댓글 수집을 시작 (스크롤이 댓글 수집을 기다리지 않음)
+        - 댓글 요청은 모든 영상이 하나의 AsyncTiktokComment(동시 요청 수 제한)를 공유
+        - seen(이미 수집한 영상, app.crawler.seen)에 있는 영상은 댓글을 요청하지 않음
+          (seen.delta 면 전체를 다시 받되 저장된 최신 댓글 이후 댓글만 내보냄, 댓글 목록이 시간순이 아니라 중간에 멈출 수 없음)
+        - 소비가 밀려 CRAWL_PAGE_QUEUE_SIZE 페이지가 쌓이면 댓글 수집도 멈춤
+        """
+        loop = asyncio.get_running_loop()
+        discovered: asyncio.Queue = asyncio.Queue()
+        out: asyncio.Queue = asyncio.Queue(maxsize=settings.CRAWL_PAGE_QUEUE_SIZE)
+        stop = threading.Event()
+
+        def on_video(video: Dict[str, Any]):
+            loop.call_soon_threadsafe(discovered.put_nowait, video)
+
+        serp = asyncio.create_task(asyncio.to_thread(self._search_videos_cached, keyword, start_date, end_date, on_video, stop))
+        # 스레드 쪽 on_video 호출이 모두 큐에 들어간 뒤에 종료 표시가 들어감 (call_soon_threadsafe 순서 보장)
+        serp.add_done_callback(lambda _: discovered.put_nowait(None))
+
+        async def dispatch():
+            comment_tasks = []
+            try:
+                async with self.comment_client() as scraper:
+                    while (video := await discovered.get()) is not None:
+                        await out.put({"videos": [video]})
+                        newer_than = None
+                        if seen is not None and video["id"] in seen:
+                            delta = await seen.comment_since([video["id"]])
+                            if video["id"] not in delta:
+                                print(f"[SKIP] 이미 수집한 영상: {video['id']}")
+                                continue
+                            newer_than = delta[video["id"]]
+                        # ✅ 댓글 수집
+                        print(f"[LOG] 댓글 수집 중: {video['id']}")
+                        comment_tasks.append(asyncio.create_task(self._put_comments(video["id"], keyword.id, scraper, out, newer_than)))
+
+                    await serp
+                    await asyncio.gather(*comment_tasks)
+            finally:
+                stop.set()
+                for task in comment_tasks:
+                    task.cancel()
+                await asyncio.gather(*comment_tasks, return_exceptions=True)
+
+        items = drain(out, asyncio.create_task(dispatch()))
+        try:
+            async for page in items:
+                yield page
+        finally:
+            await items.aclose()
+            stop.set()
+
+    async def _put_comments(
+        self,
+        video_id: str,
+        keyword_id: int,
+        scraper: AsyncTiktokComment,
+        out: asyncio.Queue,
+        newer_than: Optional[datetime] = None
+    ):
+        # 영상 하나의 댓글을 목록 페이지마다 out 에 넣음 (오류가 나면 그때까지 넣은 페이지만 남김, crawl_comments 와 같은 처리)
+        # newer_than 이 있으면 그보다 나중에 작성된 댓글/답글만
+        # 끝까지 수집했으면 마지막에 {"completed_videos": [video_id]} (오류로 멈춘 영상은 다음 크롤링에서 다시 수집)
+        try:
+            async for comments in scraper.iter_comment_pages(video_id):
+                rows = self._comment_rows(video_id, keyword_id, comments)
+                if newer_than is not None:
+                    rows = [row for row in rows if row["created_at"] is not None and row["created_at"] > newer_than]
+                if rows:
+                    await out.put({"comments": rows})
+        except OfflineCacheMiss:
+            raise
+        except Exception:
+            return
+        await out.put({"completed_videos": [video_id]})
+
+    def comment_client(self) -> AsyncTiktokComment:
+        """
+        settings 기준 댓글 API 클라이언트 (async with 로 사용, 크롤링 캐시가 켜져 있으면 캐시 트랜스포트 사용)
+        """
+        limits = httpx.Limits(
+            max_connections=settings.TIKTOK_COMMENT_MAX_CONCURRENCY,
+            max_keepalive_connections=settings.TIKTOK_COMMENT_MAX_CONCURRENCY
+        )
+        return AsyncTiktokComment(
+            base_url=settings.TIKTOK_BASE_URL,
+            max_concurrency=settings.TIKTOK_COMMENT_MAX_CONCURRENCY,
+            page_prefetch=settings.TIKTOK_COMMENT_PAGE_PREFETCH,
+            transport=cached_transport("tiktok", limits)
+        )
+
+    def _search_videos_cached(
+        self,
+        keyword: Keywords,
+        start_date: str,
+        end_date: str,
+        on_video: Optional[Callable[[Dict[str, Any]], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        search_videos 결과를 HTTP 캐시(app.crawler.cache)에 키워드/기간 단위로 저장하고 재사용
+        (브라우저 검색은 HTTP 트랜스포트를 거치지 않으므로 결과 목록 자체를 캐시)
+        """
+        cache = get_http_cache()
+        name = f"serp:{keyword.keyword}:{start_date}:{end_date}"
+        cached = cache.load_json("tiktok", name) if cache else None
+        if cached is None:
+            videos = self.search_videos(keyword, start_date, end_date, on_video, stop)
+            if cache:
+                cache.store_json("tiktok", name, videos)
+            return videos
+
+        collected_time = datetime.now()
+        for video in cached:
+            video.update(keyword_id=keyword.id, collected_at=collected_time)
+            if on_video:
+                on_video(video)
+        return cached
+
+    def search_videos(
+        self,
+        keyword: Keywords,
+        start_date: str,
+        end_date: str,
+        on_video: Optional[Callable[[Dict[str, Any]], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        구글 검색 결과(udm=39)를 스크롤하며 TikTok 영상 링크를 수집 (블로킹, Selenium)
+        - 새 영상을 찾을 때마다 on_video(video) 호출, stop 이 설정되면 중단
+        """
         query = f'{keyword.keyword}+tiktok+after%3A{start_date}+before%3A{end_date}'
         target_url = f"https://www.google.com/search?q={query}&num=12&udm=39"
 
@@ -49,7 +212,6 @@ class TikTokCrawler:
         time.sleep(2)
 
         videos = []
-        all_comments = []
 
         scroll_count = 0
         MAX_ITEMS = 50
@@ -65,66 +227,77 @@ class TikTokCrawler:
             except:
                 return False
 
-        while len(videos) < MAX_ITEMS and scroll_count < 30:
-            link_elements = driver.find_elements(By.XPATH, '//a[contains(@href, "tiktok.com/") and contains(@href, "/video/")]')
-            for link_el in link_elements:
-                try:
-                    url = link_el.get_attribute("href")
-                    match = re.search(r'/video/(\d+)', url)
-                    if not match:
-                        continue
-                    video_id = match.group(1)
+        try:
+            while len(videos) < MAX_ITEMS and scroll_count < 30 and not (stop and stop.is_set()):
+                link_elements = driver.find_elements(By.XPATH, '//a[contains(@href, "tiktok.com/") and contains(@href, "/video/")]')
+                for link_el in link_elements:
                     try:
-                        heading_div = link_el.find_element(By.XPATH, '..')
-                        title = heading_div.get_attribute("aria-label") or heading_div.text.strip()
-                    except:
-                        title = ""
-                    if not title or not self._is_valid_korean_content(title):
-                        continue
+                        url = link_el.get_attribute("href")
+                        match = re.search(r'/video/(\d+)', url)
+                        if not match:
+                            continue
+                        video_id = match.group(1)
+                        try:
+                            heading_div = link_el.find_element(By.XPATH, '..')
+                            title = heading_div.get_attribute("aria-label") or heading_div.text.strip()
+                        except:
+                            title = ""
+                        if not title or not self._is_valid_korean_content(title):
+                            continue
 
-                    if not any(item['id'] == video_id for item in videos):
-                        collected_time = datetime.now()
+                        if not any(item['id'] == video_id for item in videos):
+                            collected_time = datetime.now()
 
-                        video = {
-                            'id': video_id,
-                            'title': title,
-                            'video_url': url,
-                            'keyword_id': keyword.id,
-                            'collected_at': collected_time
-                        }
-                        videos.append(video)
+                            video = {
+                                'id': video_id,
+                                'title': title,
+                                'video_url': url,
+                                'keyword_id': keyword.id,
+                                'collected_at': collected_time
+                            }
+                            videos.append(video)
+                            if on_video:
+                                on_video(video)
 
-                        # ✅ 댓글 수집
-                        print(f"[LOG] 댓글 수집 중: {video_id}")
-                        comments = await self.crawl_comments(video_id, keyword.id)
-                        all_comments.extend(comments)
-
-                    if len(videos) >= MAX_ITEMS:
-                        break
-                except Exception:
-                    continue
-            if not click_more_results_if_available():
-                driver.execute_script("window.scrollBy(0, 1000)")
+                        if len(videos) >= MAX_ITEMS:
+                            break
+                    except Exception:
+                        continue
+                if not click_more_results_if_available():
+                    driver.execute_script("window.scrollBy(0, 1000)")
+                    time.sleep(WAIT)
+                scroll_count += 1
                 time.sleep(WAIT)
-            scroll_count += 1
-            time.sleep(WAIT)
+        finally:
+            driver.quit()
 
-        driver.quit()
-
-        return {
-            "videos": videos,
-            "comments": all_comments
-        }
+        return videos
 
 
-    async def crawl_comments(self, video_id: str, keyword_id: int) -> List[Dict[str, Any]]:
+    async def crawl_comments(self, video_id: str, keyword_id: int, scraper: Optional[AsyncTiktokComment] = None) -> List[Dict[str, Any]]:
         """
         특정 TikTok 비디오의 댓글 및 답글을 크롤링하여 TiktokComments 모델에 맞는 dict 리스트로 반환합니다.
         :param video_id: TikTok 비디오 ID
+        :param scraper: 열려 있는 AsyncTiktokComment (없으면 이 영상만을 위해 새로 열고 닫음)
         :return: 각 댓글/답글에 대해 TiktokComments 모델 dict의 리스트
         (id, video_id, text, reply_count, user_id, nickname, parent_comment_id, is_reply, created_at)
         """
-        scraper = TiktokComment()
+        if scraper is None:
+            async with self.comment_client() as scraper:
+                return await self.crawl_comments(video_id, keyword_id, scraper)
+
+        try:
+            comments_obj: Comments = await scraper(aweme_id=video_id)
+            return self._comment_rows(video_id, keyword_id, comments_obj.comments)
+        except OfflineCacheMiss:
+            raise
+        except Exception:
+            return []
+
+    def _comment_rows(self, video_id: str, keyword_id: int, comments: List[Comment]) -> List[Dict[str, Any]]:
+        """
+        댓글(+답글)을 TiktokComments 저장용 dict 리스트로 변환 (한국어 내용이 아닌 댓글은 제외, 답글은 부모 댓글 바로 뒤)
+        """
         results = []
 
         def format_time(ts) -> Optional[datetime]:
@@ -136,39 +309,35 @@ class TikTokCrawler:
             except Exception:
                 return None
 
-        try:
-            comments_obj: Comments = scraper(aweme_id=video_id)
-            for comment in comments_obj.comments:
-                if not self._is_valid_korean_content(comment.comment):
-                    continue
+        for comment in comments:
+            if not self._is_valid_korean_content(comment.comment):
+                continue
+            results.append({
+                "id": comment.comment_id,
+                "video_id": video_id,
+                "keyword_id": keyword_id, 
+                "content": comment.comment,
+                "reply_count": comment.total_reply,
+                "user_id": comment.username,
+                "nickname": comment.nickname,
+                "parent_comment_id": None,
+                "is_reply": False,
+                "created_at": format_time(comment.create_time),
+                "collected_at": datetime.now()
+            })
+            for reply in comment.replies:
                 results.append({
-                    "id": comment.comment_id,
+                    "id": reply.comment_id,
                     "video_id": video_id,
-                    "keyword_id": keyword_id, 
-                    "content": comment.comment,
-                    "reply_count": comment.total_reply,
-                    "user_id": comment.username,
-                    "nickname": comment.nickname,
-                    "parent_comment_id": None,
-                    "is_reply": False,
-                    "created_at": format_time(comment.create_time),
+                    "keyword_id": keyword_id,
+                    "content": reply.comment,
+                    "reply_count": reply.total_reply,
+                    "user_id": reply.username,
+                    "nickname": reply.nickname,
+                    "parent_comment_id": comment.comment_id,
+                    "is_reply": True,
+                    "created_at": format_time(reply.create_time),
                     "collected_at": datetime.now()
                 })
-                for reply in comment.replies:
-                    results.append({
-                        "id": reply.comment_id,
-                        "video_id": video_id,
-                        "keyword_id": keyword_id,
-                        "content": reply.comment,
-                        "reply_count": reply.total_reply,
-                        "user_id": reply.username,
-                        "nickname": reply.nickname,
-                        "parent_comment_id": comment.comment_id,
-                        "is_reply": True,
-                        "created_at": format_time(reply.create_time),
-                        "collected_at": datetime.now()
-                    })
-        except Exception:
-            pass
 
         return results
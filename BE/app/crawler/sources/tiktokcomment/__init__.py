@@ -1 +1 @@
-from .tiktokcomment import TiktokComment
\ No newline at end of file
+from .tiktokcomment import TiktokComment, AsyncTiktokComment
\ No newline at end of file
@@ -1,12 +1,42 @@
+import asyncio
 import jmespath
+import httpx
 
-from typing import Any, Dict, Iterator
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List
 from requests import Session, Response
 from loguru import logger
 from typing import Optional
 from datetime import datetime
 from .typing import Comments, Comment
 
+# 댓글/답글 한 건에서 Comment 생성에 필요한 필드
+COMMENT_FIELDS = jmespath.compile(
+    """
+    {
+        comment_id: cid,
+        username: user.unique_id,
+        nickname: user.nickname,
+        comment: text,
+        create_time: create_time,
+        avatar: user.avatar_thumb.url_list[0],
+        total_reply: reply_comment_total
+    }
+    """
+)
+
+# 댓글 목록 페이지 응답에서 Comments 생성에 필요한 필드
+PAGE_FIELDS = jmespath.compile(
+    """
+    {
+        caption: comments[0].share_info.title,
+        video_url: comments[0].share_info.url,
+        comments: comments,
+        has_more: has_more
+    }
+    """
+)
+
 class TiktokComment:
     BASE_URL: str = 'https://www.tiktok.com'
     API_URL: str = '%s/api' % BASE_URL
@@ -20,20 +50,7 @@ class TiktokComment:
         self: 'TiktokComment',
         data: Dict[str, Any]
     ) -> Comment:
-        data: Dict[str, Any] = jmespath.search(
-            """
-            {
-                comment_id: cid,
-                username: user.unique_id,
-                nickname: user.nickname,
-                comment: text,
-                create_time: create_time,
-                avatar: user.avatar_thumb.url_list[0],
-                total_reply: reply_comment_total
-            }
-            """ ,
-            data
-        )
+        data: Dict[str, Any] = COMMENT_FIELDS.search(data)
     
         comment: Comment = Comment(
             **data,
@@ -146,17 +163,7 @@ class TiktokComment:
             raise e  # 강제 예외 발생
 
         # JSONPath로 필요한 데이터 추출
-        data: Dict[str, Any] = jmespath.search(
-            """
-            {
-                caption: comments[0].share_info.title,
-                video_url: comments[0].share_info.url,
-                comments: comments,
-                has_more: has_more
-            }
-            """,
-            data
-        )
+        data: Dict[str, Any] = PAGE_FIELDS.search(data)
 
         return Comments(
             comments=[
@@ -175,3 +182,234 @@ class TiktokComment:
         return self.get_all_comments(
             aweme_id=aweme_id
         )
+
+
+
+class AsyncTiktokComment:
+    """
+    TiktokComment 의 비동기 버전 (httpx.AsyncClient, async with 로 열고 닫음)
+    - 댓글 목록은 cursor 순서대로 요청하되, 응답을 기다리는 동안 다음 page_prefetch 페이지를 미리 요청
+    - 받은 페이지의 답글 스레드는 다음 페이지를 기다리는 동안 동시에 수집
+    - 동시 요청 수는 max_concurrency 로 제한 (인스턴스 하나를 여러 영상에 공유하면 전체 합계 기준)
+    """
+
+    def __init__(
+        self: 'AsyncTiktokComment',
+        base_url: Optional[str] = None,
+        max_concurrency: int = 8,
+        page_prefetch: int = 2,
+        size: int = 50,
+        timeout: float = 15.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> None:
+        self.api_url: str = '%s/api' % (base_url or TiktokComment.BASE_URL).rstrip('/')
+        self.max_concurrency: int = max_concurrency
+        self.page_prefetch: int = page_prefetch
+        self.size: int = size
+        self.timeout: float = timeout
+        self.transport: Optional[httpx.AsyncBaseTransport] = transport
+        self.__client: Optional[httpx.AsyncClient] = None
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(
+        self: 'AsyncTiktokComment'
+    ) -> 'AsyncTiktokComment':
+        self.__client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+            transport=self.transport
+        )
+        self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(
+        self: 'AsyncTiktokComment',
+        *exc_info
+    ) -> None:
+        await self.__client.aclose()
+        self.__client = None
+        self.__semaphore = None
+
+    async def __get(
+        self: 'AsyncTiktokComment',
+        path: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        async with self.__semaphore:
+            response: httpx.Response = await self.__client.get(
+                '%s/%s' % (self.api_url, path),
+                params=params
+            )
+
+        # **예외 처리 (응답이 JSON이 아닐 수도 있음)**
+        try:
+            return response.json()
+        except Exception as e:
+            logger.error(f"JSON 파싱 실패! 응답 내용: {response.text[:500]}")
+            raise e
+
+    async def __parse_comment(
+        self: 'AsyncTiktokComment',
+        aweme_id: str,
+        data: Dict[str, Any]
+    ) -> Comment:
+        data: Dict[str, Any] = COMMENT_FIELDS.search(data)
+        return Comment(
+            **data,
+            replies=await self.get_all_replies(
+                aweme_id=aweme_id,
+                comment_id=data.get('comment_id')
+            ) if data.get('total_reply') else []
+        )
+
+    async def parse_comments(
+        self: 'AsyncTiktokComment',
+        aweme_id: str,
+        items: Optional[List[Dict[str, Any]]]
+    ) -> List[Comment]:
+        """
+        댓글 목록을 Comment 로 변환 (답글이 있는 댓글들의 답글 스레드는 동시에 수집)
+        """
+        return list(await asyncio.gather(*(
+            self.__parse_comment(aweme_id, item) for item in items or []
+        )))
+
+    async def get_replies(
+        self: 'AsyncTiktokComment',
+        aweme_id: str,
+        comment_id: str,
+        page: Optional[int] = 1
+    ) -> Dict[str, Any]:
+        return await self.__get(
+            'comment/list/reply/',
+            params={
+                'aid': 1988,
+                'comment_id': comment_id,
+                'item_id': aweme_id,
+                'count': self.size,
+                'cursor': (page - 1) * self.size
+            }
+        )
+
+    async def get_all_replies(
+        self: 'AsyncTiktokComment',
+        aweme_id: str,
+        comment_id: str
+    ) -> List[Comment]:
+        replies: List[Comment] = []
+        page: int = 1
+        while True:
+            data: Dict[str, Any] = await self.get_replies(aweme_id, comment_id, page)
+            if not (items := data.get('comments')):
+                break
+            replies.extend(await self.parse_comments(aweme_id, items))
+            if data.get('has_more') == 0:
+                break
+            page += 1
+        return replies
+
+    async def get_comments(
+        self: 'AsyncTiktokComment',
+        aweme_id: str,
+        page: Optional[int] = 1
+    ) -> Dict[str, Any]:
+        return await self.__get(
+            'comment/list/',
+            params={
+                'aid': 1988,
+                'aweme_id': aweme_id,
+                'count': self.size,
+                'cursor': (page - 1) * self.size
+            }
+        )
+
+    async def get_all_comments(
+        self: 'AsyncTiktokComment',
+        aweme_id: str
+    ) -> Comments:
+        """
+        영상의 모든 댓글(+답글)을 수집
+        - has_more 가 0 인 마지막 페이지의 댓글까지 포함하고, 그 뒤로 미리 요청한 페이지는 취소
+        """
+        next_page: int = 1
+        pages: Deque[asyncio.Task] = deque()
+        parsing: List[asyncio.Task] = []
+
+        def request_next_page() -> None:
+            nonlocal next_page
+            pages.append(asyncio.create_task(self.get_comments(aweme_id, next_page)))
+            next_page += 1
+
+        for _ in range(1 + self.page_prefetch):
+            request_next_page()
+
+        data: Dict[str, Any] = {}
+        first: Optional[Dict[str, Any]] = None
+        try:
+            while pages:
+                data = PAGE_FIELDS.search(await pages.popleft())
+                first = first or data
+                parsing.append(asyncio.create_task(self.parse_comments(aweme_id, data.get('comments'))))
+                if not data.get('has_more') or not data.get('comments'):
+                    break
+                request_next_page()
+            parsed: List[List[Comment]] = await asyncio.gather(*parsing)
+        finally:
+            for task in [*pages, *parsing]:
+                task.cancel()
+            await asyncio.gather(*pages, *parsing, return_exceptions=True)
+
+        return Comments(
+            caption=first.get('caption'),
+            video_url=first.get('video_url'),
+            comments=[comment for page in parsed for comment in page],
+            has_more=data.get('has_more') or 0
+        )
+
+    async def iter_comment_pages(
+        self: 'AsyncTiktokComment',
+        aweme_id: str
+    ) -> AsyncIterator[List[Comment]]:
+        """
+        영상의 댓글(+답글)을 댓글 목록 페이지 순서대로 한 페이지씩 반환
+        - get_all_comments 와 같이 다음 page_prefetch 페이지를 미리 요청하고, 답글 수집은 다음 페이지 요청과 겹쳐서 진행
+        - 답글 수집이 끝나지 않은 페이지는 최대 page_prefetch 개까지만 쌓아 둠
+        """
+        next_page: int = 1
+        pages: Deque[asyncio.Task] = deque()
+        parsing: Deque[asyncio.Task] = deque()
+
+        def request_next_page() -> None:
+            nonlocal next_page
+            pages.append(asyncio.create_task(self.get_comments(aweme_id, next_page)))
+            next_page += 1
+
+        for _ in range(1 + self.page_prefetch):
+            request_next_page()
+
+        try:
+            while pages:
+                data: Dict[str, Any] = PAGE_FIELDS.search(await pages.popleft())
+                parsing.append(asyncio.create_task(self.parse_comments(aweme_id, data.get('comments'))))
+                last: bool = not data.get('has_more') or not data.get('comments')
+                if not last:
+                    request_next_page()
+                while parsing and (last or parsing[0].done() or len(parsing) > self.page_prefetch):
+                    yield await parsing.popleft()
+                if last:
+                    break
+        finally:
+            for task in [*pages, *parsing]:
+                task.cancel()
+            await asyncio.gather(*pages, *parsing, return_exceptions=True)
+
+    async def __call__(
+        self: 'AsyncTiktokComment',
+        aweme_id: str
+    ) -> Comments:
+        return await self.get_all_comments(
+            aweme_id=aweme_id
+        )
@@ -1,21 +1,68 @@
-import os
 import re
-from typing import List, Dict, Any, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
-import googleapiclient.discovery
-from dotenv import load_dotenv
 
+import httpx
+
+from app.core.config import settings
+from app.crawler.cache import OfflineCacheMiss, cached_transport
+from app.crawler.pipeline import Page, collect_pages, drain
+from app.crawler.quota import QuotaExceeded, QuotaMeter
+from app.crawler.seen import SeenVideos
 from app.models import Keywords
 
 
+class YouTubeAPIError(Exception):
+    """
+    YouTube Data API 오류 응답 (reason 예: commentsDisabled, quotaExceeded)
+    """
+
+    def __init__(self, status_code: int, reason: str, message: str = ""):
+        self.status_code = status_code
+        self.reason = reason
+        super().__init__(f"{status_code} {reason}: {message}")
+
+
 class YouTubeCrawler:
-    def __init__(self, api_key: Optional[str] = None):
-        dotenv_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), '.env'
-        )
-        load_dotenv(dotenv_path)
-        self.api_key = os.getenv('YOUTUBE_API_KEY')
-        self.youtube = self.get_youtube_client(self.api_key)
+    """
+    YouTube Data API v3 REST 엔드포인트를 httpx.AsyncClient 로 호출하는 비동기 크롤러
+    - crawl() 한 번 동안 커넥션 풀을 공유하는 클라이언트 하나를 사용 (session() 참고)
+    - 동시에 보내는 요청 수는 max_concurrency 로 제한하고, 영상별 댓글은 병렬로 수집
+    - 영상 통계/채널 정보는 검색 결과 id 를 모아 50개씩 묶어서 조회
+    - crawl(quota=QuotaMeter) 로 호출하면 요청마다 할당량 비용을 집계하고, 한도를 넘는 댓글 페이지는 요청하지 않음
+    - pages() 는 같은 수집을 페이지 단위로 내보냄 (댓글은 API 한 페이지씩, 소비가 밀리면 page_buffer 페이지에서 멈춤)
+    """
+
+    # 일시적인 오류(429/5xx, 네트워크 오류)는 재시도
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+    MAX_RETRIES = 3
+    # videos.list / channels.list 는 한 번에 최대 50개 id 조회 가능
+    MAX_IDS_PER_CALL = 50
+    # 일일 할당량 소진 (다시 요청해도 같은 날에는 실패)
+    QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        page_buffer: Optional[int] = None,
+        timeout: float = 15.0
+    ):
+        self.api_key = api_key or settings.YOUTUBE_API_KEY
+        if not self.api_key:
+            raise ValueError("YouTube API 키가 필요합니다.")
+        self.base_url = (base_url or settings.YOUTUBE_API_BASE_URL).rstrip("/")
+        self.max_concurrency = max_concurrency or settings.YOUTUBE_MAX_CONCURRENCY
+        self.page_buffer = page_buffer or settings.CRAWL_PAGE_QUEUE_SIZE
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._quota: Optional[QuotaMeter] = None
+        # 채널 id → 채널 정보 (같은 인스턴스로 여러 번 크롤링해도 채널은 한 번만 조회)
+        self._channel_cache: Dict[str, Dict[str, Any]] = {}
 
     def _is_valid_korean_content(self, text: str) -> bool:
 
@@ -27,10 +74,74 @@ class YouTubeCrawler:
             return False
         return True
 
-    def get_youtube_client(self, api_key: str):
-        if not api_key:
-            raise ValueError("YouTube API 키가 필요합니다.")
-        return googleapiclient.discovery.build("youtube", "v3", developerKey=api_key)
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["YouTubeCrawler"]:
+        """
+        커넥션 풀을 공유하는 AsyncClient 와 동시 요청 제한 세마포어를 열고 닫음
+        (이미 열려 있으면 그대로 재사용)
+        """
+        if self._client is not None:
+            yield self
+            return
+
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=limits,
+            transport=cached_transport("youtube", limits, self._cacheable)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            yield self
+        finally:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+
+    async def _get(self, resource: str, **params) -> Dict[str, Any]:
+        """
+        GET {base_url}/{resource} 호출 후 JSON 반환 (session() 안에서 호출)
+        - 할당량 집계 중이면 재시도를 포함한 요청마다 비용을 먼저 차감 (캐시 적중은 되돌림)
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+        params["key"] = self.api_key
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self._semaphore:
+                    if self._quota is not None:
+                        self._quota.charge(resource)
+                    response = await self._client.get(f"/{resource}", params=params)
+            except httpx.TransportError:
+                if attempt == self.MAX_RETRIES:
+                    raise
+            else:
+                if self._quota is not None and response.extensions.get("from_cache"):
+                    self._quota.refund(resource)
+                if response.status_code < 400:
+                    return response.json()
+                error = self._api_error(response)
+                if error.reason in self.QUOTA_REASONS and self._quota is not None:
+                    self._quota.exhaust()
+                    raise QuotaExceeded(resource, self._quota.used, self._quota.limit)
+                if response.status_code not in self.RETRY_STATUS or attempt == self.MAX_RETRIES:
+                    raise error
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+    @staticmethod
+    def _cacheable(status_code: int, body: bytes) -> bool:
+        # 댓글 비활성화(403 commentsDisabled)는 다시 요청해도 같으므로 캐시, 할당량 초과 등 다른 오류는 캐시하지 않음
+        return 200 <= status_code < 300 or (status_code == 403 and b"commentsDisabled" in body)
+
+    @staticmethod
+    def _api_error(response: httpx.Response) -> YouTubeAPIError:
+        try:
+            error = response.json().get("error", {})
+        except ValueError:
+            error = {}
+        errors = error.get("errors") or [{}]
+        return YouTubeAPIError(response.status_code, errors[0].get("reason", "unknown"), error.get("message", ""))
 
     def yyyymmdd_to_rfc3339(self, yyyymmdd: str, end: bool = False) -> str:
         dt = datetime.strptime(yyyymmdd, "%Y%m%d")
@@ -40,7 +151,7 @@ class YouTubeCrawler:
             dt = dt.replace(hour=0, minute=0, second=0)
         return dt.isoformat("T") + "Z"
 
-    def search_videos(
+    async def search_videos(
         self,
         keyword: Keywords,
         max_results: int,
@@ -48,6 +159,20 @@ class YouTubeCrawler:
         published_before: Optional[str],
         video_duration: Optional[str],  # "short", "medium", "long"
     ) -> List[Dict[str, Any]]:
+        videos = await self._search_hits(keyword, max_results, published_after, published_before, video_duration)
+        return await self.attach_video_details(videos)
+
+    async def _search_hits(
+        self,
+        keyword: Keywords,
+        max_results: int,
+        published_after: Optional[str],
+        published_before: Optional[str],
+        video_duration: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        search 결과만으로 영상 dict 생성 (통계/수정 시각은 attach_video_details 에서 채움)
+        """
         params = {
             "part": "snippet",
             "q": keyword.keyword,
@@ -62,14 +187,12 @@ class YouTubeCrawler:
         if published_before:
             params["publishedBefore"] = self.yyyymmdd_to_rfc3339(published_before, end=True)
 
-        response = self.youtube.search().list(**params).execute()
+        response = await self._get("search", **params)
         videos = []
 
         for item in response.get("items", []):
             video_id = item["id"]["videoId"]
             snippet = item["snippet"]
-            channel_id = snippet["channelId"]
-            published_at = snippet["publishedAt"]
             title = snippet.get("title", "").strip()
             thumbnails = snippet.get("thumbnails", {})
             thumbnail_url = (
@@ -84,23 +207,16 @@ class YouTubeCrawler:
             if not self._is_valid_korean_content(title):
                 continue
 
-            # 상세 정보 요청
-            video_detail = self.youtube.videos().list(part="statistics,snippet", id=video_id).execute()
-            video_info = video_detail["items"][0] if video_detail["items"] else {}
-
-            stats = video_info.get("statistics", {})
-            snippet_detail = video_info.get("snippet", {})
-
             videos.append({
                 "id": video_id,
-                "channel_id": channel_id,
-                "created_at": published_at,
+                "channel_id": snippet["channelId"],
+                "created_at": snippet["publishedAt"],
                 "keyword_id": keyword.id,
                 "collected_at": datetime.now(),
-                "like_count": int(stats.get("likeCount", 0)) if "likeCount" in stats else None,
-                "comment_count": int(stats.get("commentCount", 0)) if "commentCount" in stats else None,
-                "view_count": int(stats.get("viewCount", 0)) if "viewCount" in stats else None,
-                "updated_at": snippet_detail.get("publishedAt"),
+                "like_count": None,
+                "comment_count": None,
+                "view_count": None,
+                "updated_at": None,
                 "video_type": "short" if video_duration == "short" else "long",
                 "title": title,
                 "thumbnail_url": thumbnail_url,
@@ -108,24 +224,93 @@ class YouTubeCrawler:
 
         return videos
 
-    def get_video_comments(self, keyword: Keywords, video_id: str, max_comments: int = 100) -> List[Dict[str, Any]]:
-        comments = []
+    async def get_videos_details(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        videos.list 를 최대 50개 id 씩 묶어 호출 → {video_id: item}
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        responses = await asyncio.gather(*[
+            self._get("videos", part="statistics,snippet", id=",".join(batch))
+            for batch in self._batches(video_ids)
+        ])
+        return {item["id"]: item for response in responses for item in response.get("items", [])}
+
+    async def attach_video_details(self, videos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        영상 dict 목록에 좋아요/댓글/조회수와 수정 시각을 채움 (여러 검색 결과를 모아서 한 번에 호출)
+        """
+        details = await self.get_videos_details([video["id"] for video in videos])
+        for video in videos:
+            video_info = details.get(video["id"], {})
+            stats = video_info.get("statistics", {})
+            snippet_detail = video_info.get("snippet", {})
+
+            video["like_count"] = int(stats.get("likeCount", 0)) if "likeCount" in stats else None
+            video["comment_count"] = int(stats.get("commentCount", 0)) if "commentCount" in stats else None
+            video["view_count"] = int(stats.get("viewCount", 0)) if "viewCount" in stats else None
+            video["updated_at"] = snippet_detail.get("publishedAt")
+        return videos
+
+    @staticmethod
+    def parse_time(value: Optional[str]) -> Optional[datetime]:
+        """
+        API 의 RFC 3339 시각("2024-10-01T00:00:00Z")을 naive UTC datetime 으로 변환
+        """
+        if not value:
+            return None
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+
+    async def get_video_comments(
+        self,
+        keyword: Keywords,
+        video_id: str,
+        max_comments: int = 100,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        # 할당량이 모자라면 그때까지 수집한 댓글만 반환
+        collected = []
+        try:
+            async for comments in self.iter_video_comments(keyword, video_id, max_comments, since):
+                collected.extend(comments)
+        except QuotaExceeded:
+            pass
+        return collected
+
+    async def iter_video_comments(
+        self,
+        keyword: Keywords,
+        video_id: str,
+        max_comments: int = 100,
+        since: Optional[datetime] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        최신 댓글부터 API 한 페이지씩 반환 (order=time)
+        - since 가 있으면 작성 시각이 since 이하인 댓글(이전 크롤링에서 이미 수집)을 만나는 즉시 페이지 요청 중단
+        - 할당량이 모자라 다음 페이지를 요청할 수 없으면 그때까지의 페이지를 반환한 뒤 QuotaExceeded
+        """
         next_page_token = None
         fetched = 0
+        reached_known = False
 
-        while fetched < max_comments:
+        while fetched < max_comments and not reached_known:
             max_batch = min(100, max_comments - fetched)
-            response = self.youtube.commentThreads().list(
+            response = await self._get(
+                "commentThreads",
                 part="snippet",
                 videoId=video_id,
                 maxResults=max_batch,
                 pageToken=next_page_token,
+                order="time",
                 textFormat="plainText"
-            ).execute()
+            )
 
+            comments = []
             for item in response.get("items", []):
                 snippet = item["snippet"]["topLevelComment"]["snippet"]
                 comment_id = item["snippet"]["topLevelComment"]["id"]
+                if since is not None and self.parse_time(snippet.get("publishedAt")) <= since:
+                    reached_known = True
+                    break
                 comments.append({
                     "id": comment_id,
                     "video_id": video_id,
@@ -138,23 +323,68 @@ class YouTubeCrawler:
                 if fetched >= max_comments:
                     break
 
+            if comments:
+                yield comments
             next_page_token = response.get("nextPageToken")
             if not next_page_token:
                 break
 
-        return comments
+    async def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
+        channels = await self.get_channels_info([channel_id])
+        return channels[0] if channels else {}
 
-    def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
-        response = self.youtube.channels().list(part="snippet,statistics", id=channel_id).execute()
-        if not response["items"]:
-            return {}
-        item = response["items"][0]
-        return {
-            "id": channel_id,
-            "name": item["snippet"]["title"],
-            "subscriber_count": int(item["statistics"].get("subscriberCount", 0)),
-            "updated_at": item["snippet"]["publishedAt"],
-        }
+    async def get_channels_info(self, channel_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        channels.list 를 최대 50개 id 씩 묶어 호출 (이 크롤러 인스턴스에서 이미 가져온 채널은 캐시 사용)
+        없는 채널은 결과에서 제외
+        """
+        channel_ids = list(dict.fromkeys(channel_ids))
+        missing = [cid for cid in channel_ids if cid not in self._channel_cache]
+        responses = await asyncio.gather(*[
+            self._get("channels", part="snippet,statistics", id=",".join(batch))
+            for batch in self._batches(missing)
+        ])
+        for response in responses:
+            for item in response.get("items", []):
+                self._channel_cache[item["id"]] = {
+                    "id": item["id"],
+                    "name": item["snippet"]["title"],
+                    "subscriber_count": int(item["statistics"].get("subscriberCount", 0)),
+                    "updated_at": item["snippet"]["publishedAt"],
+                }
+        return [self._channel_cache[cid] for cid in channel_ids if cid in self._channel_cache]
+
+    @classmethod
+    def _batches(cls, ids: List[str]) -> List[List[str]]:
+        return [ids[i:i + cls.MAX_IDS_PER_CALL] for i in range(0, len(ids), cls.MAX_IDS_PER_CALL)]
+
+    async def _put_video_comments(
+        self,
+        keyword: Keywords,
+        video_id: str,
+        max_comments: int,
+        since: Optional[datetime],
+        out: asyncio.Queue
+    ):
+        # 영상 하나의 댓글 페이지를 out 에 넣음 (오류가 난 영상은 그때까지 넣은 페이지만 남기고 건너뜀)
+        # 끝까지 수집했으면 마지막에 {"completed_videos": [video_id]} (댓글 비활성화 영상 포함)
+        # 할당량 부족/오류로 중간에 멈췄거나 댓글을 요청하지 않았으면(max_comments=0) 완료로 표시하지 않음
+        if max_comments <= 0:
+            return
+        try:
+            async for comments in self.iter_video_comments(keyword, video_id, max_comments, since):
+                await out.put({"comments": comments})
+        except QuotaExceeded:
+            print(f"[QUOTA] 할당량 부족으로 댓글 일부만 수집: {video_id}")
+            return
+        except OfflineCacheMiss:
+            raise
+        except Exception as e:
+            if 'commentsDisabled' not in str(e):
+                print(f"[ERROR] 댓글 수집 중 오류 발생 (video_id={video_id}): {e}")
+                return
+            print(f"[SKIP] 댓글이 비활성화된 영상: {video_id}")
+        await out.put({"completed_videos": [video_id]})
 
     async def crawl(
         self,
@@ -163,39 +393,88 @@ class YouTubeCrawler:
         max_comments: int = 100,
         published_after: Optional[str] = None,
         published_before: Optional[str] = None,
+        quota: Optional[QuotaMeter] = None,
+        seen: Optional[SeenVideos] = None,
     ) -> Dict[str, List[Dict[str, Any]]]:
-        all_videos = []
-        all_comments = []
-        channel_ids = set()
-
-        for duration in ["short", "medium", "long"]:
-            videos = self.search_videos(
-                keyword=keyword,
-                max_results=max_videos,
-                published_after=published_after,
-                published_before=published_before,
-                video_duration=duration,  # ✅ 문자열 전달
-            )
-            for video in videos:
-                video["keyword_id"] = keyword.id
-                all_videos.append(video)
-                channel_ids.add(video["channel_id"])
-
-                try:
-                    comments = self.get_video_comments(keyword, video["id"], max_comments=max_comments)
-                    all_comments.extend(comments)
-                except Exception as e:
-                    if 'commentsDisabled' in str(e):
-                        print(f"[SKIP] 댓글이 비활성화된 영상: {video['id']}")
-                        continue  # 건너뛰기
-                    else:
-                        print(f"[ERROR] 댓글 수집 중 오류 발생 (video_id={video['id']}): {e}")
-                        continue
-
-        channels = [self.get_channel_info(cid) for cid in channel_ids]
-
+        """
+        quota: 이 크롤링에 예약한 할당량 (app.crawler.quota), 호출 후 quota.used 가 실제 사용량
+               검색/상세 조회가 한도를 넘으면 QuotaExceeded, 댓글은 한도까지만 수집
+        seen: 이미 수집한 영상 (app.crawler.seen), 해당 영상은 댓글을 수집하지 않거나 저장된 최신 댓글 이후만 수집
+              처음 보는 영상은 항상 댓글 전체(max_comments 까지) 수집
+        pages() 결과를 모두 모아서 반환 (저장하면서 수집할 때는 pages() 사용)
+        """
+        collected = await collect_pages(self.pages(
+            keyword, max_videos, max_comments, published_after, published_before, quota, seen
+        ))
         return {
-            "videos": all_videos,
-            "comments": all_comments,
-            "channels": channels,
+            "videos": collected.get("videos", []),
+            "comments": collected.get("comments", []),
+            "channels": collected.get("channels", []),
         }
+
+    async def pages(
+        self,
+        keyword: Keywords,
+        max_videos: int = 20,
+        max_comments: int = 100,
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None,
+        quota: Optional[QuotaMeter] = None,
+        seen: Optional[SeenVideos] = None,
+    ) -> AsyncIterator[Page]:
+        """
+        crawl() 과 같은 수집을 페이지 단위로 반환 (인자는 crawl() 과 같음)
+        - 첫 페이지: {"channels": [...], "videos": [...]} (세 번의 검색 결과 전체, 최대 3 × max_videos 개)
+        - 이후: 영상별 댓글 API 한 페이지마다 {"comments": [...]}, 영상의 댓글을 끝까지 수집하면 {"completed_videos": [video_id]}
+          (댓글 수집은 영상 상세 조회와 동시에 시작하고, 소비가 밀리면 page_buffer 페이지가 쌓인 곳에서 멈춤)
+        """
+        self._quota = quota
+        try:
+            async with self.session():
+                # 1. 길이별(short/medium/long) 검색을 동시에 요청
+                searched = await asyncio.gather(*[
+                    self._search_hits(
+                        keyword=keyword,
+                        max_results=max_videos,
+                        published_after=published_after,
+                        published_before=published_before,
+                        video_duration=duration,  # ✅ 문자열 전달
+                    )
+                    for duration in ["short", "medium", "long"]
+                ])
+                all_videos = [video for videos in searched for video in videos]
+
+                # 이미 수집한 영상은 댓글 요청 생략 (seen.delta 면 저장된 최신 댓글 이후만 요청)
+                # 처음 보는 영상은 기준 시각 없이 전체 수집
+                comment_since: Dict[str, Optional[datetime]] = {video["id"]: None for video in all_videos}
+                if seen is not None:
+                    _, known = seen.split(comment_since)
+                    delta = await seen.comment_since(known)
+                    for video_id in known:
+                        if video_id in delta:
+                            comment_since[video_id] = delta[video_id]
+                        else:
+                            del comment_since[video_id]
+                    if known:
+                        print(f"[SKIP] 이미 수집한 영상 {len(known)}개: 댓글 {'새 댓글만 수집' if delta else '수집 생략'}")
+
+                # 2. 세 번의 검색에서 모은 영상/채널 id 를 50개씩 묶어 상세 정보 조회,
+                #    영상별 댓글은 동시에 수집 (동시 요청 수는 세마포어로 제한)
+                out: asyncio.Queue = asyncio.Queue(maxsize=self.page_buffer)
+                comment_pages = drain(out, asyncio.gather(*[
+                    self._put_video_comments(keyword, video_id, max_comments, video_since, out)
+                    for video_id, video_since in comment_since.items()
+                ]))
+                try:
+                    _, channels = await asyncio.gather(
+                        self.attach_video_details(all_videos),
+                        self.get_channels_info([video["channel_id"] for video in all_videos])
+                    )
+                    # 영상/채널을 먼저 내보내야 댓글을 저장할 수 있음
+                    yield {"channels": list(channels), "videos": all_videos}
+                    async for page in comment_pages:
+                        yield page
+                finally:
+                    await comment_pages.aclose()
+        finally:
+            self._quota = None
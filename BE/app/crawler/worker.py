@@ -0,0 +1,211 @@
+# app/crawler/worker.py
+#
+# 크롤링 작업 워커: python -m app.crawler.worker [--concurrency N]
+# - POST /search/keyword 가 crawl_jobs 에 등록한 작업을 SELECT ... FOR UPDATE SKIP LOCKED 로 하나씩 가져와 실행
+#   (워커 프로세스를 여러 개 띄워도 같은 작업을 두 번 실행하지 않음)
+# - 대기 작업은 YouTube 할당량 계획(CrawlerService.plan_youtube)의 우선순위 순으로 가져오고,
+#   오늘 남은 할당량으로 검색도 못 하는 키워드(deferred)의 작업은 그 뒤에 YouTube 만 빼고 실행
+#   (Instiz/TikTok 은 할당량과 무관하므로 기다리게 하지 않음, 진행 상황에 YouTube 는 deferred 로 기록)
+# - 한 프로세스에서 동시에 실행하는 작업 수는 concurrency (CRAWL_WORKER_CONCURRENCY), 작업마다 CrawlerService 를 새로 만듦
+# - 작업 등록 시 보내는 NOTIFY(crawl_jobs)로 깨어나고, LISTEN 을 쓸 수 없거나 알림을 놓쳐도 poll_interval 초마다 확인
+# - 실행 중 작업은 플랫폼별 진행 상황과 heartbeat 를 갱신하고, heartbeat 가 stale_seconds 넘게 멈춘 작업
+#   (워커 비정상 종료)은 다른 워커가 다시 대기열에 넣음 (max_attempts 회까지)
+# - SIGINT/SIGTERM 을 받으면 새 작업은 가져오지 않고 실행 중인 작업이 끝난 뒤 종료
+
+import os
+import time
+import signal
+import socket
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+
+from app.analyzer.notify import NotificationListener
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.crawler.repositories import CRAWL_JOB_CHANNEL, CrawlJobRepository
+from app.crawler.service import CrawlerService
+from app.models import Keywords
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlWorker:
+    HEARTBEAT_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        concurrency: int = settings.CRAWL_WORKER_CONCURRENCY,
+        poll_interval: float = settings.CRAWL_WORKER_POLL_INTERVAL,
+        stale_seconds: float = settings.CRAWL_JOB_STALE_SECONDS,
+        max_attempts: int = settings.CRAWL_JOB_MAX_ATTEMPTS
+    ):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stale_seconds = stale_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = False
+        self._deferred: Set[int] = set()
+
+    def stop(self, signum=None, frame=None):
+        if not self._stopping:
+            logger.info("[CRAWL WORKER] 종료 요청 수신: 실행 중인 작업이 끝나면 종료합니다")
+        self._stopping = True
+
+    # ── DB (스레드에서 실행, 호출마다 세션을 열고 닫음) ──────────────────
+    @staticmethod
+    def _with_repo(method: str, *args):
+        db = SessionLocal()
+        try:
+            return getattr(CrawlJobRepository(db), method)(*args)
+        finally:
+            db.close()
+
+    async def _db(self, method: str, *args):
+        return await asyncio.to_thread(self._with_repo, method, *args)
+
+    @staticmethod
+    def _load_keyword(keyword_id: int) -> Optional[Keywords]:
+        db = SessionLocal()
+        try:
+            return db.query(Keywords).filter_by(id=keyword_id).first()
+        finally:
+            db.close()
+
+    async def _claim(self) -> Optional[Dict[str, Any]]:
+        """
+        대기 작업 중 하나를 YouTube 할당량 계획 순서로 가져옴, 가져올 작업이 없으면 None
+        - 우선순위: 마지막 크롤링 후 경과 시간 × (1 + 작업에 합쳐진 추가 요청 수)
+        - 계획에서 deferred 된 키워드의 작업은 계획된 작업 뒤에 가져오고, 작업의 "deferred" 에 youtube 를 넣음
+        """
+        queued = await self._db("queued_requests")
+        if not queued:
+            return None
+        demand = {keyword_id: requests - 1 for keyword_id, requests in queued.items()}
+        plan = await asyncio.to_thread(CrawlerService().plan_youtube, list(queued), demand)
+
+        deferred = set(plan["deferred"])
+        if deferred - self._deferred:
+            logger.info(f"[CRAWL WORKER] YouTube 할당량 부족으로 보류한 키워드: {sorted(deferred)} (YouTube 를 빼고 실행)")
+        self._deferred = deferred
+        keyword_ids = [item["keyword_id"] for item in plan["scheduled"]] + [kid for kid in queued if kid in deferred]
+        job = await self._db("claim", self.worker_id, keyword_ids)
+        if job is not None:
+            job["deferred"] = ["youtube"] if job["keyword_id"] in deferred else []
+        return job
+
+    # ── 작업 실행 ─────────────────────────────────────────────────
+    async def _heartbeat(self, job_id: int):
+        while True:
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+            try:
+                await self._db("heartbeat", job_id)
+            except Exception as e:
+                logger.warning(f"[CRAWL WORKER] heartbeat 실패 (job={job_id}): {e}")
+
+    async def _run_job(self, job: Dict[str, Any]):
+        job_id = job["id"]
+
+        async def progress(platform: str, outcome: Dict[str, Any]):
+            # 진행 상황 기록 실패가 크롤링을 멈추지 않도록 로그만 남김
+            try:
+                await self._db("update_progress", job_id, platform, outcome)
+            except Exception as e:
+                logger.warning(f"[CRAWL WORKER] 진행 상황 기록 실패 (job={job_id}, {platform}): {e}")
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        started = time.monotonic()
+        try:
+            keyword_obj = await asyncio.to_thread(self._load_keyword, job["keyword_id"])
+            if keyword_obj is None:
+                raise ValueError(f"키워드가 없습니다 (keyword_id={job['keyword_id']})")
+
+            logger.info(f"[CRAWL WORKER] 작업 시작 job={job_id} keyword={keyword_obj.keyword} (시도 {job['attempts']})")
+            periods = job["periods"]
+            result = await CrawlerService().crawl_all(
+                keyword_obj=keyword_obj,
+                youtube_period=periods["youtube"],
+                instiz_period=periods["instiz"],
+                tiktok_period=periods["tiktok"],
+                partial=settings.CRAWL_PARTIAL_COMMIT,
+                progress=progress,
+                deferred=job.get("deferred", [])
+            )
+            await self._db("finish", job_id, result["status"], result.get("message", ""), result.get("platforms"))
+            logger.info(f"[CRAWL WORKER] 작업 종료 job={job_id} {result['status']} ({time.monotonic() - started:.2f}s)")
+        except Exception as e:
+            logger.exception(f"[CRAWL WORKER ERROR] 작업 실패 job={job_id}")
+            try:
+                await self._db("finish", job_id, "fail", str(e), None)
+            except Exception:
+                logger.exception(f"[CRAWL WORKER ERROR] 작업 상태 기록 실패 job={job_id}")
+        finally:
+            heartbeat.cancel()
+
+    async def _wait(self, listener: NotificationListener, timeout: float) -> bool:
+        """
+        새 작업 알림 또는 timeout 까지 대기 (종료 요청에 바로 반응하도록 1초 단위, 대기 중에도 실행 중인 작업은 계속 진행)
+        """
+        deadline = time.monotonic() + timeout
+        while not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if await asyncio.to_thread(listener.wait, min(remaining, 1.0)):
+                return True
+        return False
+
+    async def run_async(self) -> Dict[str, int]:
+        listener = NotificationListener(CRAWL_JOB_CHANNEL)
+        running: Set[asyncio.Task] = set()
+        summary = {"jobs": 0, "requeued": 0}
+        next_stale_check = 0.0
+        logger.info(
+            f"[CRAWL WORKER] 시작 ({self.worker_id}, 동시 작업 {self.concurrency}, "
+            f"{'LISTEN' if listener.available else 'polling'} {self.poll_interval}s)"
+        )
+
+        try:
+            while not self._stopping:
+                if time.monotonic() >= next_stale_check:
+                    stale_before = datetime.now() - timedelta(seconds=self.stale_seconds)
+                    summary["requeued"] += await self._db("requeue_stale", stale_before, self.max_attempts)
+                    next_stale_check = time.monotonic() + self.stale_seconds / 2
+
+                if len(running) < self.concurrency:
+                    job = await self._claim()
+                    if job is not None:
+                        task = asyncio.create_task(self._run_job(job))
+                        running.add(task)
+                        task.add_done_callback(running.discard)
+                        summary["jobs"] += 1
+                        continue
+                    await self._wait(listener, self.poll_interval)
+                else:
+                    # 빈 자리가 생길 때까지 대기
+                    await asyncio.wait(running, timeout=1.0, return_when=asyncio.FIRST_COMPLETED)
+
+            if running:
+                logger.info(f"[CRAWL WORKER] 실행 중인 작업 {len(running)}개 종료 대기")
+                await asyncio.gather(*running, return_exceptions=True)
+        finally:
+            listener.close()
+            logger.info(f"[CRAWL WORKER] 종료: {summary}")
+
+        return summary
+
+    def run(self) -> Dict[str, int]:
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        return asyncio.run(self.run_async())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤링 작업 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.CRAWL_WORKER_CONCURRENCY, help="동시에 실행할 작업 수")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    CrawlWorker(concurrency=args.concurrency).run()
@@ -1,11 +1,22 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.api_router import router as api_router
+from app.modules.analyze.router import close_batcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 온라인 분석 API 배치 큐 종료
+    await close_batcher()
+
 
 app = FastAPI(
     title="Analysis Backend API",
     description="분석 백엔드 API 서버",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
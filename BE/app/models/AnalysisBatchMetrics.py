@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, Float, TIMESTAMP, ForeignKey, Index
+from app.core.db import Base
+
+class AnalysisBatchMetrics(Base):
+    __tablename__ = "analysis_batch_metrics"
+    id = Column(Integer, primary_key=True, autoincrement=True, comment="배치 지표 고유 ID")
+    analysis_log_id = Column(Integer, ForeignKey("analysis_logs.id", ondelete="CASCADE"), comment="분석 로그 ID")
+    items_fetched = Column(Integer, comment="조회한 원본 아이템 수")
+    texts_cleaned = Column(Integer, comment="정제 후 남은 텍스트 수")
+    texts_rejected = Column(Integer, comment="정제 단계에서 제외된 텍스트 수")
+    sentences_split = Column(Integer, comment="분리된 문장 수")
+    aspect_hits = Column(Integer, comment="속성 키워드가 매칭된 문장 수 (감성 분류 대상)")
+    sentences_classified = Column(Integer, comment="감성 분류에 성공한 문장 수")
+    cache_hits = Column(Integer, comment="감성 캐시 적중 문장 수")
+    results_saved = Column(Integer, comment="저장된 ContentAnalysis 행 수")
+    fetch_seconds = Column(Float, comment="원본 조회 시간")
+    clean_seconds = Column(Float, comment="텍스트 정제 시간")
+    split_seconds = Column(Float, comment="문장 분리 시간")
+    aspect_seconds = Column(Float, comment="속성 매칭 시간")
+    inference_seconds = Column(Float, comment="감성 분류(캐시 조회 포함) 시간")
+    write_seconds = Column(Float, comment="분석 결과 저장 + is_analyzed 업데이트 시간")
+    total_seconds = Column(Float, comment="배치 전체 처리 시간")
+    sentences_per_second = Column(Float, comment="배치 처리량 (분류 대상 문장 수 / 전체 처리 시간)")
+    created_at = Column(TIMESTAMP, comment="배치 커밋 시각")
+
+    __table_args__ = (
+        Index("idx_analysis_batch_metrics_log_id", "analysis_log_id"),
+        Index("idx_analysis_batch_metrics_created_at", "created_at"),
+    )
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, Text, TIMESTAMP, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.db import Base
+
+class CrawlJobs(Base):
+    __tablename__ = "crawl_jobs"
+    id = Column(Integer, primary_key=True, autoincrement=True, comment="크롤링 작업 고유 ID")
+    keyword_id = Column(Integer, ForeignKey("keywords.id", ondelete="CASCADE"), nullable=False, comment="Keywords의 키워드 ID")
+    status = Column(Text, nullable=False, default="queued", comment="queued / running / success / partial / fail")
+    periods = Column(JSONB, comment="플랫폼별 수집 기간 (CrawlerService.crawl_all 인자)")
+    progress = Column(JSONB, comment="플랫폼별 진행 상황 {platform: {status, saved, message, elapsed}}")
+    message = Column(Text, comment="작업 결과 메시지")
+    requests = Column(Integer, nullable=False, default=1, comment="이 작업으로 합쳐진 요청 수")
+    attempts = Column(Integer, nullable=False, default=0, comment="실행 시도 횟수")
+    worker = Column(Text, comment="작업을 가져간 워커 (호스트:pid)")
+    created_at = Column(TIMESTAMP, comment="작업 등록 시각")
+    started_at = Column(TIMESTAMP, comment="실행 시작 시각")
+    heartbeat_at = Column(TIMESTAMP, comment="실행 중 워커가 마지막으로 갱신한 시각")
+    finished_at = Column(TIMESTAMP, comment="실행 종료 시각")
+
+    __table_args__ = (
+        # 키워드당 대기/실행 중인 작업은 하나 (같은 키워드 요청은 이 작업으로 합침)
+        Index("uq_crawl_jobs_active_keyword", "keyword_id", unique=True, postgresql_where=text("status IN ('queued', 'running')")),
+        Index("idx_crawl_jobs_status_created_at", "status", "created_at"),
+    )
\ No newline at end of file
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Text, Integer, TIMESTAMP, ForeignKey
+from app.core.db import Base
+
+class CrawlWatermarks(Base):
+    __tablename__ = "crawl_watermarks"
+    keyword_id = Column(Integer, ForeignKey("keywords.id", ondelete="CASCADE"), primary_key=True, comment="Keywords의 키워드 ID")
+    platform = Column(Text, primary_key=True, comment="플랫폼 (youtube / instiz / tiktok)")
+    last_created_at = Column(TIMESTAMP, comment="지금까지 수집한 콘텐츠 중 가장 최근 작성 시각 (UTC)")
+    cursor = Column(Text, comment="가장 최근 콘텐츠 식별자 (댓글 ID 또는 게시글 URL)")
+    updated_at = Column(TIMESTAMP, comment="워터마크 갱신 시각")
+    crawled_at = Column(TIMESTAMP, comment="마지막 크롤링 시각 (새 콘텐츠가 없어도 실행마다 갱신, 크롤링 우선순위용)")
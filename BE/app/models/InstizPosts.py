@@ -17,4 +17,6 @@ class InstizPosts(Base):
     __table_args__ = (
         Index("idx_instiz_posts_created_at", "created_at"),
         Index("idx_instiz_posts_collected_at", "collected_at"),
+        # 크롤링 저장 시 INSERT ... ON CONFLICT (post_url) DO NOTHING 대상
+        Index("uq_instiz_posts_post_url", "post_url", unique=True),
     ) 
\ No newline at end of file
@@ -7,6 +7,7 @@ class TiktokVideos(Base):
     title = Column(Text, comment="영상 제목")
     video_url = Column(Text, comment="비디오 URL")
     collected_at = Column(TIMESTAMP, comment="영상 수집 시각")
+    comments_collected_at = Column(TIMESTAMP, nullable=True, comment="댓글 수집을 끝낸 시각 (중단/실패면 NULL)")
 
     __table_args__ = (
         Index("idx_tiktok_videos_collected_at", "collected_at"),
@@ -0,0 +1,8 @@
+from sqlalchemy import Column, Integer, Date, TIMESTAMP
+from app.core.db import Base
+
+class YoutubeQuotaUsage(Base):
+    __tablename__ = "youtube_quota_usage"
+    usage_date = Column(Date, primary_key=True, comment="할당량 기준 날짜 (태평양 시간, YouTube 할당량 초기화 기준)")
+    used_units = Column(Integer, nullable=False, default=0, comment="예약 후 정산된 사용 units")
+    updated_at = Column(TIMESTAMP, comment="마지막 예약/정산 시각")
\ No newline at end of file
@@ -17,6 +17,7 @@ class YoutubeVideos(Base):
     # ✅ 추가된 필드
     title = Column(Text, nullable=True, comment="영상 제목")
     thumbnail_url = Column(Text, nullable=True, comment="썸네일 이미지 URL")
+    comments_collected_at = Column(TIMESTAMP, nullable=True, comment="댓글 수집을 끝낸 시각 (중단/실패/할당량 부족이면 NULL)")
 
     __table_args__ = (
         Index("idx_youtube_videos_created_at", "created_at"),
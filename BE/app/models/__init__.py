@@ -9,6 +9,7 @@ from .TiktokComments import *
 from .Sentiments import *
 from .Aspects import *
 from .AnalysisLogs import *
+from .AnalysisBatchMetrics import *
 from .ContentAnalysis import *
 from .Users import *
 from .CollectedYoutubeComments import *
@@ -16,4 +17,7 @@ from .CollectedInstizPosts import *
 from .CollectedInstizComments import *
 from .CollectedTiktokComments import *
 from .CollectedYoutubeVideos import *
-from .CollectedTiktokVideos import *
\ No newline at end of file
+from .CollectedTiktokVideos import *
+from .CrawlWatermarks import *
+from .YoutubeQuotaUsage import *
+from .CrawlJobs import *
\ No newline at end of file
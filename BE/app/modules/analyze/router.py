@@ -0,0 +1,79 @@
+import time
+import logging
+from fastapi import APIRouter, HTTPException
+
+from app.analyzer.batcher import DynamicBatcher
+from app.analyzer.matcher import ASPECT_KEYWORDS
+from app.analyzer.services import build_analyzer
+from app.core.config import settings
+from . import schemas
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+ASPECT_NAMES = list(ASPECT_KEYWORDS)  # aspect_id - 1 → 속성명
+SENTIMENT_LABELS = {0: "negative", 1: "positive"}
+
+# 프로세스당 하나의 배치 큐 (동시에 들어온 요청을 모아 한 번에 추론)
+batcher = DynamicBatcher(
+    build_analyzer,
+    max_texts=settings.ANALYZE_API_MAX_TEXTS,
+    max_wait_ms=settings.ANALYZE_API_MAX_WAIT_MS,
+    batch_size=settings.ANALYSIS_BATCH_SIZE
+)
+
+
+async def close_batcher():
+    # 앱 종료 시 app.main 의 lifespan 에서 호출
+    await batcher.close()
+
+
+@router.post("", response_model=schemas.AnalyzeResponse)
+async def analyze_texts(request: schemas.AnalyzeRequest):
+    """
+    붙여넣은 리뷰 텍스트를 바로 분석 (정제 → 문장 분리 → 속성 필터 → 감성 분류)
+    - 속성 키워드가 없는 문장은 결과에서 제외됨 (배치 분석과 동일)
+    """
+    if not request.texts:
+        raise HTTPException(status_code=400, detail="분석할 텍스트가 없습니다.")
+    if len(request.texts) > settings.ANALYZE_API_MAX_REQUEST_TEXTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.ANALYZE_API_MAX_REQUEST_TEXTS}개 텍스트까지 분석할 수 있습니다."
+        )
+    if any(len(text) > settings.ANALYZE_API_MAX_TEXT_LENGTH for text in request.texts):
+        raise HTTPException(
+            status_code=400,
+            detail=f"텍스트 하나는 최대 {settings.ANALYZE_API_MAX_TEXT_LENGTH}자까지 분석할 수 있습니다."
+        )
+
+    start = time.perf_counter()
+    try:
+        results, batch_text_count = await batcher.submit(request.texts)
+    except Exception:
+        # 내부 오류 내용은 로그에만 남기고 클라이언트에는 일반 메시지만 반환
+        logger.exception("[ANALYZE API ERROR] 분석 실패")
+        raise HTTPException(status_code=500, detail="분석 중 오류가 발생했습니다.")
+
+    return schemas.AnalyzeResponse(
+        results=[
+            schemas.AnalyzeResult(
+                text=text,
+                sentences=[
+                    schemas.AnalyzedSentence(
+                        sentence=r["content"],
+                        aspect_id=r["aspect_id"],
+                        aspect=ASPECT_NAMES[r["aspect_id"] - 1],
+                        sentiment_id=r["sentiment_id"],
+                        sentiment=SENTIMENT_LABELS.get(r["sentiment_id"], "unknown"),
+                        evidence_keywords=r["evidence_keywords"]
+                    )
+                    for r in text_results
+                ]
+            )
+            for text, text_results in zip(request.texts, results)
+        ],
+        batch_text_count=batch_text_count,
+        elapsed=round(time.perf_counter() - start, 4)
+    )
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class AnalyzeRequest(BaseModel):
+    texts: List[str]
+
+
+class AnalyzedSentence(BaseModel):
+    sentence: str
+    aspect_id: int
+    aspect: str          # 예: "맛", "가격"
+    sentiment_id: int    # 0: 부정, 1: 긍정
+    sentiment: str       # "positive" or "negative"
+    evidence_keywords: List[str]
+
+
+class AnalyzeResult(BaseModel):
+    text: str
+    sentences: List[AnalyzedSentence]
+
+
+class AnalyzeResponse(BaseModel):
+    results: List[AnalyzeResult]
+    batch_text_count: int  # 이 요청과 함께 한 번에 추론된 전체 텍스트 수
+    elapsed: float
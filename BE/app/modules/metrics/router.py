@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.analyzer.metrics import render_prometheus, render_registry_prometheus
+from app.analyzer.registry import registry
+from app.analyzer.repositories import AnalysisRepository
+
+router = APIRouter()
+
+# Prometheus text exposition format 0.0.4
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("", response_class=PlainTextResponse)
+def analysis_metrics(db: Session = Depends(get_db)):
+    """
+    분석 배치 단계별 지표 (analysis_batch_metrics 집계)
+    - 분석은 별도 프로세스(데몬/워커 풀)에서 돌기 때문에 메모리가 아닌 DB 에 쌓인 값을 집계해서 노출
+    - 이 API 프로세스(/analyze)에 로딩된 모델의 로딩/워밍업 시간과 메모리 사용량(ModelRegistry.stats())도 함께 노출
+    """
+    batch_count, totals, last = AnalysisRepository(db).get_batch_metrics_summary()
+    body = render_prometheus(totals, last, batch_count) + render_registry_prometheus(registry.stats())
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,66 +1,49 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.core.db import get_db, SessionLocal
 from app.models import Keywords
 from . import schemas
-from app.crawler.service import CrawlerService
-import time
+from app.crawler.repositories import CrawlJobRepository
+from app.crawler.service import CrawlerService, PLATFORMS
+import asyncio
 from typing import List
 from datetime import datetime
 
 router = APIRouter()
 
-@router.post("/keyword", response_model=schemas.SearchResult)
+@router.post("/keyword", response_model=schemas.CrawlJobAccepted, status_code=202)
 async def search_keyword(query: schemas.SearchQuery):
+    """
+    키워드 크롤링 작업을 등록하고 바로 작업 ID 반환 (크롤링은 python -m app.crawler.worker 가 실행)
+    같은 키워드의 작업이 대기/실행 중이면 새로 만들지 않고 그 작업 ID 를 반환
+    진행 상황은 GET /search/jobs/{job_id}
+    """
     db = SessionLocal()
     try:
         print(f"[LOG] 키워드 검색 요청: {query.keyword}")
-        # 1. 키워드 존재 여부 확인
+        # 1. 키워드 조회, 없으면 새로 추가
         keyword_obj = db.query(Keywords).filter_by(keyword=query.keyword).first()
-        if keyword_obj:
-            print(f"[LOG] 이미 존재하는 키워드: {query.keyword}")
-            return schemas.SearchResult(
-                keyword=query.keyword,
-                results=[],
-                total_count=0,
-                search_time=0.0
-            )
+        if keyword_obj is None:
+            print(f"[LOG] 신규 키워드 추가: {query.keyword}")
+            keyword_obj = Keywords(keyword=query.keyword, searched_at=datetime.now())
+            db.add(keyword_obj)
+            db.commit()
+            db.refresh(keyword_obj)
 
-        # 2. 키워드 새로 추가
-        print(f"[LOG] 신규 키워드 추가: {query.keyword}")
-        new_keyword = Keywords(keyword=query.keyword, searched_at = datetime.now())
-        db.add(new_keyword)
-        db.commit()
-        db.refresh(new_keyword)
-
-        # 3. 크롤링 서비스 실행
-        print(f"[LOG] 크롤링 서비스 시작: {query.keyword}")
-        service = CrawlerService()
-        start = time.time()
-        # 기간 예시 (최근 한 달)
-        youtube_period = {"starttime": "20241001", "endtime": "20241031"}
-        instiz_period = {"starttime": "20241001", "endtime": "20241031"}
-        tiktok_period = {"start_date": "2024-10-01", "end_date": "2024-10-31"}
-        result = await service.crawl_all(
-            keyword_obj=new_keyword,
-            youtube_period=youtube_period,
-            instiz_period=instiz_period,
-            tiktok_period=tiktok_period
-        )
-        elapsed = time.time() - start
-        print(f"[LOG] 크롤링 서비스 완료: {query.keyword} (소요 시간: {elapsed:.2f}초)")
-
-        # 크롤링 실패 시
-        if result.get("status") == "fail":
-            print(f"[ERROR] 크롤링 실패: {result.get('message', '크롤링 실패')}")
-            raise HTTPException(status_code=500, detail=result.get("message", "크롤링 실패"))
-
-        print(f"[LOG] 전체 완료: {query.keyword}")
-        return schemas.SearchResult(
+        # 2. 크롤링 작업 등록 (기간 예시: 최근 한 달)
+        periods = {
+            "youtube": {"starttime": "20241001", "endtime": "20241031"},
+            "instiz": {"starttime": "20241001", "endtime": "20241031"},
+            "tiktok": {"start_date": "2024-10-01", "end_date": "2024-10-31"},
+        }
+        job, created = CrawlJobRepository(db).enqueue(keyword_obj.id, periods)
+        print(f"[LOG] 크롤링 작업 {'등록' if created else '합침'}: {query.keyword} (job_id={job.id})")
+        return schemas.CrawlJobAccepted(
+            job_id=job.id,
             keyword=query.keyword,
-            results=[result],
-            total_count=1,
-            search_time=elapsed
+            status=job.status,
+            coalesced=not created
         )
     except Exception as e:
         print(f"[ERROR] 예외 발생: {str(e)}")
@@ -68,6 +51,58 @@ async def search_keyword(query: schemas.SearchQuery):
     finally:
         db.close()
 
+@router.get("/jobs/{job_id}", response_model=schemas.CrawlJobStatus)
+async def get_crawl_job(job_id: int):
+    """
+    크롤링 작업 상태와 플랫폼별 진행 상황
+    """
+    db = SessionLocal()
+    try:
+        job = CrawlJobRepository(db).get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="크롤링 작업을 찾을 수 없습니다.")
+        keyword_obj = db.query(Keywords).filter_by(id=job.keyword_id).first()
+        progress = job.progress or {}
+        return schemas.CrawlJobStatus(
+            job_id=job.id,
+            keyword=keyword_obj.keyword if keyword_obj else "",
+            status=job.status,
+            platforms={name: progress.get(name, {"status": "queued"}) for name in PLATFORMS},
+            message=job.message,
+            requests=job.requests,
+            attempts=job.attempts,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at
+        )
+    finally:
+        db.close()
+
+@router.post("/keyword/estimate", response_model=schemas.CrawlEstimate)
+async def estimate_keyword(query: schemas.SearchQuery):
+    """
+    크롤링 전 YouTube API 예상 비용 (오늘 남은 할당량 기준, 예약하지 않음)
+    """
+    db = SessionLocal()
+    try:
+        keyword_obj = db.query(Keywords).filter_by(keyword=query.keyword).first()
+    finally:
+        db.close()
+
+    service = CrawlerService()
+    plan = await asyncio.to_thread(service.plan_youtube, [keyword_obj.id if keyword_obj else None])
+    item = plan["scheduled"][0] if plan["scheduled"] else None
+    return schemas.CrawlEstimate(
+        keyword=query.keyword,
+        usage_date=plan["usage_date"],
+        remaining=plan["budget"],
+        projected_cost=item["projected_cost"] if item else 0,
+        full_cost=plan["full_cost"],
+        comment_pages=item["comment_pages"] if item else 0,
+        degraded=item["degraded"] if item else True,
+        affordable=item is not None
+    )
+
 @router.get("/history", response_model=List[schemas.SearchHistory])
 async def get_search_history():
     # TODO: Implement search history retrieval
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 class SearchQuery(BaseModel):
@@ -11,6 +11,34 @@ class SearchResult(BaseModel):
     total_count: int
     search_time: float
 
+class CrawlJobAccepted(BaseModel):
+    job_id: int
+    keyword: str
+    status: str            # queued / running (이미 있던 작업에 합쳐진 경우 그 작업의 상태)
+    coalesced: bool        # 같은 키워드의 대기/실행 중 작업에 합쳐졌는지
+
+class CrawlJobStatus(BaseModel):
+    job_id: int
+    keyword: str
+    status: str                         # queued / running / success / partial / fail
+    platforms: Dict[str, Dict[str, Any]]  # 플랫폼별 {status: queued / running / crawled / success / fail / deferred, saved, message, elapsed}
+    message: Optional[str] = None
+    requests: int
+    attempts: int
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class CrawlEstimate(BaseModel):
+    keyword: str
+    usage_date: str        # YouTube 할당량 기준 날짜 (태평양 시간)
+    remaining: int         # 오늘 남은 YouTube 할당량 (units)
+    projected_cost: int    # 지금 크롤링하면 예약할 units (할당량이 모자라면 줄인 계획 기준)
+    full_cost: int         # 댓글을 모두 수집하는 계획의 units
+    comment_pages: int     # 영상당 댓글 페이지 수
+    degraded: bool         # 할당량 때문에 댓글을 줄였는지
+    affordable: bool       # 검색 비용도 안 되면 False (크롤링 시 YouTube 는 실패)
+
 class SearchHistory(BaseModel):
     keyword: str
     timestamp: datetime
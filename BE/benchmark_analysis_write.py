@@ -0,0 +1,101 @@
+# benchmark_analysis_write.py
+#
+# ContentAnalysis 저장 + is_analyzed 업데이트 경로 성능 비교
+#   - ORM 경로 : create_content_analysis_results / mark_as_analyzed (db.add 반복 + 객체별 플래그)
+#   - bulk 경로: bulk_create_content_analysis_results / bulk_mark_as_analyzed (multi-row INSERT + UPDATE ... ANY)
+#
+# 모든 작업은 외부 트랜잭션 안의 SAVEPOINT에서 수행되고 마지막에 롤백되므로 DB에 데이터가 남지 않습니다.
+#
+# 사용법: python benchmark_analysis_write.py --sizes 10000 100000
+
+import argparse
+import time
+import uuid
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.db import engine
+from app.models import YoutubeComments, Aspects, Sentiments
+from app.analyzer.repositories import AnalysisRepository
+
+
+def _seed_comments(db: Session, size: int) -> list:
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    ids = [f"{prefix}-{i}" for i in range(size)]
+    db.execute(
+        insert(YoutubeComments),
+        [{"id": cid, "content": "벤치마크 댓글", "is_analyzed": False} for cid in ids]
+    )
+    db.flush()
+    return ids
+
+
+def _make_results(ids: list, aspect_id: int, sentiment_id: int) -> list:
+    return [
+        {
+            "source_type": YoutubeComments.__tablename__,
+            "source_id": cid,
+            "sentence": "맛있어요 재구매 의사 있음",
+            "aspect_id": aspect_id,
+            "sentiment_id": sentiment_id,
+            "evidence_keywords": ["맛있", "재구매"]
+        }
+        for cid in ids
+    ]
+
+
+def run_orm(db: Session, size: int, aspect_id: int, sentiment_id: int) -> float:
+    ids = _seed_comments(db, size)
+    repo = AnalysisRepository(db)
+    log_id = repo.start_analysis_log()
+    originals = db.execute(select(YoutubeComments).where(YoutubeComments.id.in_(ids))).scalars().all()
+    results = _make_results(ids, aspect_id, sentiment_id)
+
+    start = time.perf_counter()
+    repo.create_content_analysis_results(log_id, results, commit=False)
+    repo.mark_as_analyzed(originals, commit=False)
+    db.commit()
+    return time.perf_counter() - start
+
+
+def run_bulk(db: Session, size: int, aspect_id: int, sentiment_id: int) -> float:
+    ids = _seed_comments(db, size)
+    repo = AnalysisRepository(db)
+    log_id = repo.start_analysis_log()
+    results = _make_results(ids, aspect_id, sentiment_id)
+
+    start = time.perf_counter()
+    repo.bulk_create_content_analysis_results(log_id, results)
+    repo.bulk_mark_as_analyzed({YoutubeComments.__tablename__: ids})
+    db.commit()
+    return time.perf_counter() - start
+
+
+def main(sizes: list):
+    with engine.connect() as conn:
+        outer = conn.begin()
+        try:
+            with Session(bind=conn, join_transaction_mode="create_savepoint") as db:
+                aspect_id = db.execute(select(Aspects.id)).scalars().first()
+                sentiment_id = db.execute(select(Sentiments.id)).scalars().first()
+                if aspect_id is None or sentiment_id is None:
+                    print("❌ aspects / sentiments 기준 테이블에 데이터가 없습니다.")
+                    return
+
+                print(f"{'rows':>8} | {'ORM (s)':>9} | {'bulk (s)':>9} | {'speedup':>7}")
+                for size in sizes:
+                    orm_elapsed = run_orm(db, size, aspect_id, sentiment_id)
+                    db.expunge_all()
+                    bulk_elapsed = run_bulk(db, size, aspect_id, sentiment_id)
+                    db.expunge_all()
+                    print(f"{size:>8} | {orm_elapsed:>9.2f} | {bulk_elapsed:>9.2f} | {orm_elapsed / bulk_elapsed:>6.1f}x")
+        finally:
+            outer.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ContentAnalysis 저장 경로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="비교할 행 수")
+    args = parser.parse_args()
+    main(args.sizes)
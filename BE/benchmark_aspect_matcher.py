@@ -0,0 +1,98 @@
+# benchmark_aspect_matcher.py
+#
+# 속성 키워드 매칭 마이크로 벤치마크
+#   - regex loop : 라벨별 정규식 5개를 차례로 findall (기존 Analyzer / keyword_classifier 방식)
+#   - matcher    : AspectMatcher 단일 Aho-Corasick 스캔
+#
+# 사용법: python benchmark_aspect_matcher.py --repeat 20
+
+import argparse
+import csv
+import re
+import time
+from pathlib import Path
+
+from app.analyzer import matcher as matcher_module
+from app.analyzer.matcher import AspectMatcher, ASPECT_KEYWORDS
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "NLP" / "Data"
+
+# (이름, CSV 파일, 텍스트 컬럼)
+WORKLOADS = [
+    ("분리된 문장", DATA_DIR / "test_data_final_processed.csv", "divided_comment"),
+    ("원본 댓글", DATA_DIR / "test_data_final.csv", "comment"),
+]
+
+
+def load_texts(path: Path, column: str) -> list:
+    with open(path, encoding="utf-8-sig") as f:
+        return [row[column] for row in csv.DictReader(f) if row[column]]
+
+
+def regex_all(patterns: dict, sentence: str) -> dict:
+    result = {}
+    for label, pattern in patterns.items():
+        matches = pattern.findall(sentence)
+        if matches:
+            result[label] = list(dict.fromkeys(matches))
+    return result
+
+
+def regex_first(patterns: dict, sentence: str) -> dict:
+    for label, pattern in patterns.items():
+        matches = pattern.findall(sentence)
+        if matches:
+            return {label: list(dict.fromkeys(matches))}
+    return {}
+
+
+def bench(name: str, fn, sentences: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sentence in sentences:
+            fn(sentence)
+    elapsed = time.perf_counter() - start
+    per_sec = len(sentences) * repeat / elapsed
+    print(f"{name:<28} {elapsed:>8.3f}s  {per_sec:>12,.0f} sentences/s")
+    return elapsed
+
+
+def run_workload(name: str, sentences: list, patterns: dict, matcher: AspectMatcher, repeat: int):
+    # 결과 동일성 확인
+    mismatches = sum(1 for s in sentences if matcher.match(s) != regex_all(patterns, s))
+    print(f"=== {name}: {len(sentences)}건, regex 결과와 불일치 {mismatches}건")
+
+    base_all = bench("regex loop (all aspects)", lambda s: regex_all(patterns, s), sentences, repeat)
+    fast_all = bench("matcher (all aspects)", matcher.match, sentences, repeat)
+    base_first = bench("regex loop (first match)", lambda s: regex_first(patterns, s), sentences, repeat)
+    fast_first = bench("matcher (first match)", lambda s: matcher.match(s, first_only=True), sentences, repeat)
+
+    print(f"speedup (all)  : {base_all / fast_all:.2f}x")
+    print(f"speedup (first): {base_first / fast_first:.2f}x")
+
+
+def main(repeat: int):
+    patterns = {
+        label: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+        for label, keywords in ASPECT_KEYWORDS.items()
+    }
+    matcher = AspectMatcher()
+
+    for name, path, column in WORKLOADS:
+        run_workload(name, load_texts(path, column), patterns, matcher, repeat)
+        print()
+
+    if matcher_module.ahocorasick is not None:
+        matcher_module.ahocorasick, backup = None, matcher_module.ahocorasick
+        try:
+            name, path, column = WORKLOADS[0]
+            bench(f"matcher (pure python, {name})", AspectMatcher().match, load_texts(path, column), repeat)
+        finally:
+            matcher_module.ahocorasick = backup
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="속성 키워드 매칭 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="샘플 반복 횟수")
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,90 @@
+# benchmark_dynamic_padding.py
+#
+# 감성 분류 배치 padding 방식 벤치마크
+#   - max_length : 모든 문장을 max_length(64) 토큰까지 padding (기존 방식)
+#   - bucketed   : 토큰 길이 순 정렬 후 배치마다 가장 긴 문장 길이까지만 padding (Analyzer._predict)
+# NLP/Data/test_data_final_processed.csv 의 분리된 문장(divided_comment)으로 처리량과 라벨 일치 여부를 비교
+#
+# 사용법: python benchmark_dynamic_padding.py --backend onnx --batch-size 64 --repeat 3
+
+import argparse
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.analyzer.analyzer import Analyzer, length_buckets
+
+SAMPLE_CSV = Path(__file__).resolve().parent.parent / "NLP" / "Data" / "test_data_final_processed.csv"
+
+
+def load_sentences() -> list:
+    with open(SAMPLE_CSV, encoding="utf-8-sig") as f:
+        return [row["divided_comment"] for row in csv.DictReader(f) if row["divided_comment"]]
+
+
+def predict_max_length(analyzer: Analyzer, sentences: list, batch_size: int) -> list:
+    labels = []
+    for start in range(0, len(sentences), batch_size):
+        enc = analyzer.tokenizer(
+            sentences[start:start + batch_size],
+            return_tensors="np",
+            truncation=True,
+            padding="max_length",
+            max_length=analyzer.max_length
+        )
+        labels.extend(int(label) for label in np.argmax(analyzer.backend.predict_logits(enc), axis=1))
+    return labels
+
+
+def padded_tokens(analyzer: Analyzer, sentences: list, batch_size: int) -> tuple:
+    """
+    (실제 토큰 수, bucketed 방식 padding 후 토큰 수)
+    """
+    input_ids = analyzer.tokenizer(sentences, truncation=True, max_length=analyzer.max_length)["input_ids"]
+    multiple = analyzer.pad_multiple
+    padded = 0
+    for batch_idx in length_buckets(input_ids, batch_size):
+        longest = max(len(input_ids[i]) for i in batch_idx)
+        padded += len(batch_idx) * (-(-longest // multiple) * multiple)
+    return sum(len(ids) for ids in input_ids), padded
+
+
+def timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(model_dir: str, backend: str, batch_size: int, repeat: int):
+    analyzer = Analyzer(model_dir=model_dir, backend=backend)
+    sentences = load_sentences()
+    analyzer.warmup(batch_size=batch_size)
+
+    real, bucketed = padded_tokens(analyzer, sentences, batch_size)
+    fixed = len(sentences) * analyzer.max_length
+    print(f"🔍 문장 수: {len(sentences)} / 평균 토큰 길이: {real / len(sentences):.1f}")
+    print(f"   입력 토큰 수: max_length {fixed:,} → bucketed {bucketed:,} ({bucketed / fixed:.1%})")
+
+    baseline, base_elapsed = timed(lambda: predict_max_length(analyzer, sentences, batch_size), repeat)
+    labels, elapsed = timed(lambda: analyzer._predict(sentences, batch_size), repeat)
+    agreement = float(np.mean(np.array(labels) == np.array(baseline)))
+
+    print(f"\n{'padding':<10} | {'time (s)':>8} | {'sentences/s':>11}")
+    print(f"{'max_length':<10} | {base_elapsed:>8.2f} | {len(sentences) / base_elapsed:>11.1f}")
+    print(f"{'bucketed':<10} | {elapsed:>8.2f} | {len(sentences) / elapsed:>11.1f}")
+    print(f"\n⚡ 속도 향상: x{base_elapsed / elapsed:.2f} / 라벨 일치율: {agreement:.2%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="max_length padding vs 길이 버킷 padding 처리량 비교")
+    parser.add_argument("--model-dir", default="./asset/kcelectra-base-DC", help="모델 디렉토리")
+    parser.add_argument("--backend", default="tf", help="추론 백엔드 (tf, onnx, onnx-int8)")
+    parser.add_argument("--batch-size", type=int, default=64, help="배치 크기")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (가장 빠른 결과 사용)")
+    args = parser.parse_args()
+    main(args.model_dir, args.backend, args.batch_size, args.repeat)
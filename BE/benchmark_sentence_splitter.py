@@ -0,0 +1,74 @@
+# benchmark_sentence_splitter.py
+#
+# 문장 분리 단계 처리량 벤치마크
+#   - row by row : 텍스트마다 kss.split_sentences 호출 (기존 Analyzer / df.apply 방식)
+#   - splitter   : SentenceSplitter (kss 백엔드 선택, fast path, 프로세스 풀)
+# NLP/Data 의 정제된 댓글(cleaned)과 분리된 문장(divided_comment, 짧은 댓글 대용) 두 가지 입력으로
+# texts/s 와 기준(row by row, 같은 백엔드) 대비 결과 일치율을 비교
+#
+# 사용법: python benchmark_sentence_splitter.py --backends auto punct --workers 1 4
+
+import argparse
+import csv
+import time
+from pathlib import Path
+
+from app.analyzer.splitter import SentenceSplitter
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "NLP" / "Data" / "test_data_final_processed.csv"
+
+# (이름, 텍스트 컬럼)
+WORKLOADS = [
+    ("정제된 댓글", "cleaned"),
+    ("짧은 댓글", "divided_comment"),
+]
+
+
+def load_texts(column: str) -> list:
+    with open(DATA_CSV, encoding="utf-8-sig") as f:
+        return list(dict.fromkeys(row[column] for row in csv.DictReader(f) if row[column]))
+
+
+def split_row_by_row(texts: list, backend: str) -> list:
+    from kss import split_sentences
+    return [[s.strip() for s in split_sentences(text, backend=backend, num_workers=1) if s.strip()] for text in texts]
+
+
+def main(backends: list, workers: list, repeat: int, fast_path_chars: int):
+    for name, column in WORKLOADS:
+        texts = load_texts(column) * repeat
+        print(f"\n🔍 {name}: {len(texts)}개 텍스트")
+        print(f"{'backend':<8} | {'mode':<22} | {'time (s)':>8} | {'texts/s':>9} | {'fast path':>9} | {'일치율':>7}")
+
+        for backend in backends:
+            split_row_by_row(texts[:1], backend)  # 형태소 분석기 로딩 비용 제외
+            start = time.perf_counter()
+            reference = split_row_by_row(texts, backend)
+            elapsed = time.perf_counter() - start
+            print(f"{backend:<8} | {'row by row':<22} | {elapsed:>8.2f} | {len(texts) / elapsed:>9.1f} | {'-':>9} | {'-':>7}")
+
+            for n in workers:
+                for chars in (0, fast_path_chars):
+                    with SentenceSplitter(backend=backend, workers=n, fast_path_chars=chars) as splitter:
+                        if n > 1:
+                            splitter.split_many(texts[:n * 2])  # 워커 프로세스 기동 비용 제외
+                            splitter.text_count = splitter.fast_path_count = 0
+                            splitter.elapsed = 0.0
+                        results = splitter.split_many(texts)
+                        stats = splitter.stats()
+                    agreement = sum(a == b for a, b in zip(results, reference)) / len(texts)
+                    mode = f"splitter x{n}" + (f" (fast ≤{chars})" if chars else "")
+                    print(
+                        f"{backend:<8} | {mode:<22} | {stats['seconds']:>8.2f} | {stats['texts_per_sec']:>9.1f} | "
+                        f"{stats['fast_path']:>9} | {agreement:>7.1%}"
+                    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="문장 분리 처리량 비교 (row by row vs SentenceSplitter)")
+    parser.add_argument("--backends", nargs="+", default=["auto", "punct"], help="비교할 kss 백엔드")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4], help="비교할 프로세스 수")
+    parser.add_argument("--repeat", type=int, default=1, help="입력 반복 횟수")
+    parser.add_argument("--fast-path-chars", type=int, default=30, help="fast path 최대 길이")
+    args = parser.parse_args()
+    main(args.backends, args.workers, args.repeat, args.fast_path_chars)
@@ -0,0 +1,81 @@
+# test_backend_parity.py
+#
+# 추론 백엔드(tf / onnx / onnx-int8) 라벨 일치율 및 처리량 리포트
+# - NLP/Data/test_data_final.csv 댓글을 정제/문장 분리한 뒤, tf 백엔드 결과를 기준으로 비교
+# - 기준 일치율(--min-agreement) 미만인 백엔드가 있으면 종료 코드 1
+#
+# 사용법: python test_backend_parity.py --backends tf onnx onnx-int8 --batch-size 64
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from transformers import AutoTokenizer
+
+from app.analyzer.analyzer import Analyzer
+from app.analyzer.backends import load_backend
+
+SAMPLE_CSV = Path(__file__).resolve().parent.parent / "NLP" / "Data" / "test_data_final.csv"
+
+
+def load_sentences(analyzer: Analyzer) -> list:
+    sentences = []
+    with open(SAMPLE_CSV, encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            cleaned = analyzer.clean_text(row["comment"])
+            if cleaned:
+                sentences.extend(analyzer.split_sentences(cleaned))
+    return sentences
+
+
+def predict(backend, tokenizer, sentences: list, batch_size: int, max_length: int):
+    labels = []
+    start = time.perf_counter()
+    for i in range(0, len(sentences), batch_size):
+        enc = tokenizer(
+            sentences[i:i + batch_size],
+            return_tensors="np",
+            truncation=True,
+            padding="max_length",
+            max_length=max_length
+        )
+        labels.extend(np.argmax(backend.predict_logits(enc), axis=1).tolist())
+    return labels, time.perf_counter() - start
+
+
+def main(model_dir: str, backends: list, batch_size: int, max_length: int, min_agreement: float) -> int:
+    analyzer = Analyzer(model_dir=model_dir, max_length=max_length, backend="tf")
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    sentences = load_sentences(analyzer)
+    print(f"🔍 비교 문장 수: {len(sentences)}")
+
+    reference, ref_elapsed = predict(analyzer.backend, tokenizer, sentences, batch_size, max_length)
+
+    failed = False
+    print(f"\n{'backend':<10} | {'agreement':>9} | {'time (s)':>8} | {'sentences/s':>11}")
+    for name in backends:
+        if name == "tf":
+            labels, elapsed = reference, ref_elapsed
+        else:
+            labels, elapsed = predict(load_backend(name, model_dir), tokenizer, sentences, batch_size, max_length)
+
+        agreement = float(np.mean(np.array(labels) == np.array(reference)))
+        status = "✅" if agreement >= min_agreement else "❌"
+        failed |= agreement < min_agreement
+        print(f"{name:<10} | {agreement:>8.2%} | {elapsed:>8.2f} | {len(sentences) / elapsed:>11.1f} {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="추론 백엔드 라벨 일치율 / 처리량 비교")
+    parser.add_argument("--model-dir", default="./asset/kcelectra-base-DC", help="모델 디렉토리 (ONNX 파일 포함)")
+    parser.add_argument("--backends", nargs="+", default=["tf", "onnx", "onnx-int8"], help="비교할 백엔드")
+    parser.add_argument("--batch-size", type=int, default=64, help="배치 크기")
+    parser.add_argument("--max-length", type=int, default=64, help="토큰 최대 길이")
+    parser.add_argument("--min-agreement", type=float, default=0.99, help="tf 대비 최소 라벨 일치율")
+    args = parser.parse_args()
+    sys.exit(main(args.model_dir, args.backends, args.batch_size, args.max_length, args.min_agreement))
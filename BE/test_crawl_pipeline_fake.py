@@ -0,0 +1,97 @@
+# test_crawl_pipeline_fake.py
+#
+# 크롤링 결과 페이지 단위 저장(app/crawler/pipeline.py) 확인 (실제 API 키, DB 불필요)
+# - test_crawling_youtube_fake 의 로컬 fake 서버를 그대로 사용, 저장은 페이지당 write_delay 초 걸리는 가짜 writer
+# - crawl() 로 전부 모은 결과와 pages() → write_pages 로 저장한 행 수가 같은지, 첫 페이지가 채널/영상인지
+# - 저장이 느려도 크롤러가 writer 보다 앞서 내보낸 페이지가 queue 크기(+ 저장 중, 넣는 중인 페이지)를 넘지 않는지 (backpressure)
+# - tracemalloc 최대 메모리: 전부 모은 뒤 저장 vs 페이지마다 저장
+#
+# 사용법: python test_crawl_pipeline_fake.py --comments 1000 --write-delay 0.005
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from app.crawler.pipeline import write_pages
+from app.crawler.sources.youtube import YouTubeCrawler
+from test_crawling_youtube_fake import FakeYouTubeAPI
+
+KEYWORD = SimpleNamespace(id=1, keyword="연세우유 말차생크림빵")
+QUEUE_PAGES = 4
+PAGE_BUFFER = 4
+
+
+async def collect_all(api: FakeYouTubeAPI, max_comments: int):
+    crawler = YouTubeCrawler(api_key="fake-key", base_url=api.base_url, page_buffer=PAGE_BUFFER)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await crawler.crawl(KEYWORD, max_videos=10, max_comments=max_comments)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {key: len(rows) for key, rows in result.items()}, elapsed, peak
+
+
+async def stream(api: FakeYouTubeAPI, max_comments: int, write_delay: float):
+    crawler = YouTubeCrawler(api_key="fake-key", base_url=api.base_url, page_buffer=PAGE_BUFFER)
+    saved = {"channels": 0, "videos": 0, "comments": 0}
+    first_keys, produced, written, max_pending = None, 0, 0, 0
+
+    async def counted(pages):
+        nonlocal produced
+        try:
+            async for page in pages:
+                produced += 1
+                yield page
+        finally:
+            await pages.aclose()
+
+    async def write(page):
+        nonlocal first_keys, written, max_pending
+        first_keys = first_keys or sorted(page)
+        max_pending = max(max_pending, produced - written)
+        await asyncio.sleep(write_delay)  # DB 저장 대신
+        for key, rows in page.items():
+            if key in saved:  # completed_videos 는 저장 행이 아니라 완료 표시
+                saved[key] += len(rows)
+        written += 1
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    await write_pages(counted(crawler.pages(KEYWORD, max_videos=10, max_comments=max_comments)), write, QUEUE_PAGES)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return saved, first_keys, max_pending, written, elapsed, peak
+
+
+async def main(latency: float, comments: int, write_delay: float):
+    with FakeYouTubeAPI(latency=latency, videos_per_search=10, comments_per_video=comments) as api:
+        collected, collect_elapsed, collect_peak = await collect_all(api, comments)
+        saved, first_keys, max_pending, written, stream_elapsed, stream_peak = await stream(api, comments, write_delay)
+
+    print(f"전부 모은 뒤 저장 | {collected} | {collect_elapsed:.2f}s | 최대 메모리 {collect_peak / 1024:.0f} KiB")
+    print(f"페이지마다 저장   | {saved} | {stream_elapsed:.2f}s | 최대 메모리 {stream_peak / 1024:.0f} KiB | 페이지 {written}개, 최대 대기 {max_pending}")
+
+    same = saved == collected
+    ordered = first_keys == ["channels", "videos"]
+    # writer 앞 queue + 저장 중인 페이지 1개 + write_pages 가 queue 에 넣으려고 들고 있는 페이지 1개
+    bounded = max_pending <= QUEUE_PAGES + 2
+    smaller = stream_peak < collect_peak
+
+    print(f"\n{'✅' if same else '❌'} 저장한 행 수 = crawl() 결과")
+    print(f"{'✅' if ordered else '❌'} 첫 페이지는 채널/영상 ({first_keys})")
+    print(f"{'✅' if bounded else '❌'} 크롤러가 앞서 간 페이지 {max_pending} ≤ {QUEUE_PAGES + 2}")
+    print(f"{'✅' if smaller else '❌'} 최대 메모리 {collect_peak / 1024:.0f} → {stream_peak / 1024:.0f} KiB")
+    return 0 if same and ordered and bounded and smaller else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fake YouTube API 서버로 페이지 단위 저장 파이프라인 확인")
+    parser.add_argument("--latency", type=float, default=0.01, help="요청당 지연 (초)")
+    parser.add_argument("--comments", type=int, default=1000, help="영상당 댓글 수")
+    parser.add_argument("--write-delay", type=float, default=0.005, help="페이지 하나 저장에 걸리는 시간 (초)")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.latency, args.comments, args.write_delay)))
@@ -0,0 +1,90 @@
+# test_crawler_cache_fake.py
+#
+# 크롤러 HTTP 캐시(app/crawler/cache.py) 확인 (실제 사이트/API, DB 불필요)
+# - test_crawling_instiz_fake / test_crawling_youtube_fake 의 로컬 fake 서버를 그대로 사용
+# - on 모드 첫 실행(cold)은 네트워크, 두 번째 실행(warm)은 서버 요청 0회로 같은 결과가 나와야 함
+# - fake 서버를 내린 뒤 offline 모드로 같은 크롤링을 재생하고, 캐시에 없는 요청은 OfflineCacheMiss 로 실패해야 함
+#
+# 사용법: python test_crawler_cache_fake.py --latency 0.05
+
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.crawler.cache import OfflineCacheMiss, get_http_cache
+from app.crawler.sources.instiz import InstizCrawler
+from app.crawler.sources.youtube import YouTubeCrawler
+from test_crawling_instiz_fake import FakeInstiz
+from test_crawling_youtube_fake import FakeYouTubeAPI
+
+KEYWORD = SimpleNamespace(id=1, keyword="연세우유 말차생크림빵")
+
+
+async def crawl_instiz(base_url: str, keyword=KEYWORD):
+    crawler = InstizCrawler(base_url=base_url)
+    start = time.perf_counter()
+    posts = await crawler.crawl(keyword, starttime="20241001", endtime="20241031")
+    return sorted(p["post_url"] for p in posts), time.perf_counter() - start
+
+
+async def crawl_youtube(base_url: str, api_key: str):
+    crawler = YouTubeCrawler(api_key=api_key, base_url=base_url)
+    start = time.perf_counter()
+    result = await crawler.crawl(KEYWORD, max_videos=10, max_comments=100)
+    return sorted(c["id"] for c in result["comments"]), time.perf_counter() - start
+
+
+async def main(latency: float):
+    cache_dir = tempfile.mkdtemp(prefix="crawl-cache-")
+    settings.CRAWL_CACHE_DIR = cache_dir
+    runs = []
+    try:
+        with FakeInstiz(latency=latency) as instiz, FakeYouTubeAPI(latency=latency) as youtube:
+            settings.CRAWL_CACHE_MODE = "on"
+            for label in ("cold", "warm"):
+                instiz.reset()
+                youtube.requests.clear()
+                instiz_result = await crawl_instiz(instiz.base_url)
+                # API 키는 캐시 키에서 빠지므로 warm 실행은 다른 키로도 적중해야 함
+                youtube_result = await crawl_youtube(youtube.base_url, api_key=f"{label}-key")
+                runs.append((label, instiz_result, instiz.requests, youtube_result, sum(youtube.requests.values())))
+            instiz_url, youtube_url = instiz.base_url, youtube.base_url
+        stats_on = get_http_cache().stats()
+
+        # fake 서버 종료 후 offline 재생
+        settings.CRAWL_CACHE_MODE = "offline"
+        runs.append(("offline", await crawl_instiz(instiz_url), 0, await crawl_youtube(youtube_url, api_key="offline-key"), 0))
+        try:
+            await crawl_instiz(instiz_url, SimpleNamespace(id=2, keyword="캐시에 없는 키워드"))
+            strict = False
+        except OfflineCacheMiss:
+            strict = True
+        stats_offline = get_http_cache().stats()
+    finally:
+        settings.CRAWL_CACHE_MODE = "off"
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    for label, (posts, instiz_elapsed), instiz_requests, (comments, youtube_elapsed), youtube_requests in runs:
+        print(
+            f"{label:<8} | 인스티즈 {len(posts)}건 {instiz_elapsed:.2f}s (요청 {instiz_requests}) "
+            f"| 유튜브 댓글 {len(comments)}건 {youtube_elapsed:.2f}s (요청 {youtube_requests})"
+        )
+    print(f"캐시 통계: on {stats_on} / offline {stats_offline}")
+
+    same = all(run[1][0] == runs[0][1][0] and run[3][0] == runs[0][3][0] for run in runs)
+    warm_free = runs[1][2] == 0 and runs[1][4] == 0
+    print(f"\n{'✅' if same else '❌'} cold / warm / offline 결과 일치")
+    print(f"{'✅' if warm_free else '❌'} warm 실행 서버 요청 0회")
+    print(f"{'✅' if strict else '❌'} offline 모드 캐시 미스 시 OfflineCacheMiss")
+    return 0 if same and warm_free and strict else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fake 서버로 크롤러 HTTP 캐시 확인")
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.latency)))
@@ -0,0 +1,188 @@
+# test_crawling_instiz_fake.py
+#
+# 로컬 fake 인스티즈 서버로 InstizCrawler 동작/동시성 확인 (실제 사이트, DB 불필요)
+# - 인스티즈 목록(/name?page=N)과 게시글(/name/<id>) HTML 을 실제 페이지와 같은 마크업으로 흉내 내고, 요청마다 latency 만큼 지연
+# - 목록의 'green' 게시글, 본문이 '죄송해요,' 로 시작하는 게시글은 결과에서 빠져야 함
+# - 동시 요청 1 / 목록 선행 1 (순차) 과 기본값(병렬)의 결과가 같은지, 소요 시간과 최대 동시 요청 수, 첫 결과까지 걸린 시간을 비교
+#
+# 사용법: python test_crawling_instiz_fake.py --latency 0.05 --pages 5
+
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import urlparse, parse_qs
+
+from app.crawler.sources.instiz import InstizCrawler
+
+LISTING_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>익명잡담 - 인스티즈(instiz)</title></head>
+<body><table id="mainboard"><tbody>
+{rows}
+</tbody></table></body></html>"""
+
+ROW_TEMPLATE = """<tr id="detour">
+  <td class="listno">{no}</td>
+  <td class="listsubject"><a href="../{board}/{no}?page={page}&amp;category=1">{title}<span class="cmt2">{comments}</span></a></td>
+  <td class="listno regdate">10.{day:02d} 2{hour}:15</td>
+  <td class="listno">{views:,}</td>
+  <td class="listno">{likes}</td>
+</tr>"""
+
+POST_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title}</title></head>
+<body><div id="memo_content_1" class="memo_content">
+  <script>var ad = 1;</script><style>.x{{color:red}}</style>
+  <div>{body}</div>
+  <img src="/img/{no}.jpg">
+</div></body></html>"""
+
+
+class FakeInstiz:
+    """
+    인스티즈 익명잡담 목록/게시글 페이지를 흉내 내는 로컬 HTTP 서버
+    - 목록 한 페이지에 rows_per_page 개 행, pages 페이지 이후는 빈 목록
+    - 게시글 번호가 7 의 배수면 green 게시판 링크, 11 의 배수면 '죄송해요,' 안내글
+    - max_in_flight: 동시에 처리 중이던 요청 수의 최댓값
+    """
+
+    def __init__(self, latency: float = 0.05, pages: int = 5, rows_per_page: int = 20):
+        self.latency = latency
+        self.pages = pages
+        self.rows_per_page = rows_per_page
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "FakeInstiz":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        self.requests = 0
+        self.max_in_flight = 0
+
+    # ── 응답 생성 ───────────────────────────────────────────────
+    def listing(self, page: int) -> str:
+        if page > self.pages:
+            return LISTING_TEMPLATE.format(rows="")
+        rows = []
+        for i in range(self.rows_per_page):
+            no = page * 1000 + i
+            rows.append(ROW_TEMPLATE.format(
+                no=no, page=page, board="name_green" if no % 7 == 0 else "name",
+                title=f"편의점 신상 후기 {no}", comments=i % 5, day=1 + i % 28, hour=i % 4,
+                views=1000 + no, likes=i,
+            ))
+        return LISTING_TEMPLATE.format(rows="\n".join(rows))
+
+    def post(self, no: int) -> str:
+        body = "죄송해요, 삭제된 글입니다." if no % 11 == 0 else f"연세우유 말차생크림빵 먹어봤는데\n   진짜 맛있어요 {no}"
+        return POST_TEMPLATE.format(title=f"편의점 신상 후기 {no}", body=body, no=no)
+
+    def expected_urls(self):
+        return {
+            f"{self.base_url}/name/{page * 1000 + i}?page={page}&category=1"
+            for page in range(1, self.pages + 1)
+            for i in range(self.rows_per_page)
+            if (page * 1000 + i) % 7 and (page * 1000 + i) % 11
+        }
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests += 1
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                try:
+                    time.sleep(fake.latency)
+                    url = urlparse(self.path)
+                    if url.path == "/name":
+                        status, body = 200, fake.listing(int(parse_qs(url.query)["page"][0]))
+                    elif url.path.startswith("/name/"):
+                        status, body = 200, fake.post(int(url.path.rsplit("/", 1)[-1]))
+                    else:
+                        status, body = 404, "not found"
+                finally:
+                    with fake._lock:
+                        fake.in_flight -= 1
+
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+async def crawl(fake: FakeInstiz, max_per_host: int, listing_prefetch: int):
+    keyword = SimpleNamespace(id=1, keyword="연세우유 말차생크림빵")
+    crawler = InstizCrawler(base_url=fake.base_url, max_per_host=max_per_host, listing_prefetch=listing_prefetch)
+    fake.reset()
+    posts, first = [], None
+    start = time.perf_counter()
+    async for post in crawler.stream(keyword, starttime="20241001", endtime="20241031"):
+        if first is None:
+            first = time.perf_counter() - start
+        posts.append(post)
+    return posts, time.perf_counter() - start, first, fake.requests, fake.max_in_flight
+
+
+async def main(latency: float, pages: int, max_per_host: int, listing_prefetch: int):
+    with FakeInstiz(latency=latency, pages=pages) as fake:
+        sequential = await crawl(fake, 1, 1)
+        parallel = await crawl(fake, max_per_host, listing_prefetch)
+        expected = fake.expected_urls()
+
+    for name, (posts, elapsed, first, requests, in_flight) in (
+        ("순차 (x1)", sequential),
+        (f"병렬 (x{max_per_host})", parallel),
+    ):
+        print(
+            f"{name:<10} | 게시글 {len(posts)} | {elapsed:.2f}s (첫 결과 {first:.2f}s) "
+            f"| 요청 {requests}회, 최대 동시 {in_flight}"
+        )
+
+    same = {p["post_url"] for p in sequential[0]} == {p["post_url"] for p in parallel[0]} == expected
+    clean = all(
+        "죄송해요" not in p["content"] and "var ad" not in p["content"]
+        and p["content"].endswith(f"진짜 맛있어요 {p['post_url'].split('/')[-1].split('?')[0]}")
+        for p in parallel[0]
+    )
+    limited = parallel[4] <= max_per_host
+    print(f"\n{'✅' if same and clean else '❌'} 순차/병렬 수집 결과 일치 ({len(expected)}건 예상) | ⚡ x{sequential[1] / parallel[1]:.1f}")
+    print(f"{'✅' if limited else '❌'} 호스트별 동시 요청 {parallel[4]} ≤ {max_per_host}")
+    return 0 if same and clean and limited else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fake 인스티즈 서버로 InstizCrawler 확인")
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    parser.add_argument("--pages", type=int, default=5, help="검색 결과 목록 페이지 수")
+    parser.add_argument("--max-per-host", type=int, default=4, help="병렬 실행 시 호스트별 동시 요청 수")
+    parser.add_argument("--listing-prefetch", type=int, default=2, help="병렬 실행 시 목록 선행 페이지 수")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.latency, args.pages, args.max_per_host, args.listing_prefetch)))
@@ -0,0 +1,193 @@
+# test_crawling_tiktok_fake.py
+#
+# 로컬 fake TikTok 댓글 API 서버로 AsyncTiktokComment / TikTokCrawler 동작·동시성 확인 (실제 API, 브라우저, DB 불필요)
+# - /api/comment/list/ 와 /api/comment/list/reply/ 를 cursor/count/has_more 규칙대로 흉내 내고, 요청마다 latency 만큼 지연
+# - 댓글 5개 중 1개는 답글 스레드(60개, 2페이지)를 가짐
+# - 동시 요청 1 / 선행 페이지 0 (순차) 과 기본값(병렬)의 수집 결과가 기대값과 같은지, 소요 시간과 요청 수를 비교
+# - 검색 결과 스크롤(Selenium)은 일정 간격으로 영상을 내보내는 가짜 함수로 바꿔, 스크롤과 댓글 수집이 겹쳐 진행되는지 확인
+#
+# 사용법: python test_crawling_tiktok_fake.py --latency 0.05 --videos 5 --comments 120
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import urlparse, parse_qs
+
+from app.core.config import settings
+from app.crawler.sources.tiktok import TikTokCrawler
+from app.crawler.sources.tiktokcomment import AsyncTiktokComment
+
+REPLIES_PER_THREAD = 60
+
+
+class FakeTikTokCommentAPI:
+    """
+    TikTok 웹 댓글 API 중 크롤러가 쓰는 두 엔드포인트만 흉내 내는 로컬 HTTP 서버
+    - 영상마다 comments_per_video 개의 댓글, 번호가 5 의 배수인 댓글은 답글 REPLIES_PER_THREAD 개
+    - requests: 엔드포인트별 요청 수
+    """
+
+    def __init__(self, latency: float = 0.05, comments_per_video: int = 120):
+        self.latency = latency
+        self.comments_per_video = comments_per_video
+        self.requests = {"list": 0, "reply": 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "FakeTikTokCommentAPI":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        self.requests = {"list": 0, "reply": 0}
+
+    def expected_count(self) -> int:
+        threads = len(range(0, self.comments_per_video, 5))
+        return self.comments_per_video + threads * REPLIES_PER_THREAD
+
+    # ── 응답 생성 ───────────────────────────────────────────────
+    @staticmethod
+    def _comment(cid: str, text: str, replies: int, video_id: str):
+        return {
+            "cid": cid,
+            "text": text,
+            "create_time": 1727740800,
+            "reply_comment_total": replies,
+            "user": {"unique_id": f"user_{cid}", "nickname": f"닉네임 {cid}", "avatar_thumb": {"url_list": ["https://img.example/a.jpg"]}},
+            "share_info": {"title": f"편의점 신상 {video_id}", "url": f"https://www.tiktok.com/@user/video/{video_id}"},
+        }
+
+    @staticmethod
+    def _page(items, cursor: int, count: int):
+        end = min(cursor + count, len(items))
+        return {"comments": items[cursor:end] or None, "cursor": end, "has_more": int(end < len(items))}
+
+    def comment_list(self, params):
+        video_id = params["aweme_id"][0]
+        items = [
+            self._comment(f"{video_id}-{n}", f"맛있어요 {n}", REPLIES_PER_THREAD if n % 5 == 0 else 0, video_id)
+            for n in range(self.comments_per_video)
+        ]
+        return self._page(items, int(params["cursor"][0]), int(params["count"][0]))
+
+    def reply_list(self, params):
+        parent = params["comment_id"][0]
+        items = [
+            self._comment(f"{parent}-r{n}", f"저도요 {n}", 0, params["item_id"][0])
+            for n in range(REPLIES_PER_THREAD)
+        ]
+        return self._page(items, int(params["cursor"][0]), int(params["count"][0]))
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                endpoint = "reply" if url.path.rstrip("/").endswith("/reply") else "list"
+                with api._lock:
+                    api.requests[endpoint] += 1
+                time.sleep(api.latency)
+
+                body = api.reply_list(params) if endpoint == "reply" else api.comment_list(params)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def fake_search_videos(video_count: int, interval: float):
+    """
+    TikTokCrawler.search_videos 대체: interval 초(스크롤 대기)마다 영상 하나를 발견한 것처럼 on_video 호출
+    """
+    def search_videos(keyword, start_date, end_date, on_video=None, stop=None):
+        videos = []
+        for i in range(video_count):
+            if stop and stop.is_set():
+                break
+            time.sleep(interval)
+            video = {"id": f"74{i:05d}", "title": f"편의점 신상 {i}", "video_url": "", "keyword_id": keyword.id, "collected_at": None}
+            videos.append(video)
+            if on_video:
+                on_video(video)
+        return videos
+
+    return search_videos
+
+
+async def fetch_comments(api: FakeTikTokCommentAPI, video_ids, max_concurrency: int, page_prefetch: int):
+    api.reset()
+    start = time.perf_counter()
+    async with AsyncTiktokComment(base_url=api.base_url, max_concurrency=max_concurrency, page_prefetch=page_prefetch) as scraper:
+        results = [await scraper(aweme_id=video_id) for video_id in video_ids]
+    counts = [len(r.comments) + sum(len(c.replies) for c in r.comments) for r in results]
+    return counts, time.perf_counter() - start, dict(api.requests)
+
+
+async def main(latency: float, video_count: int, comments_per_video: int, concurrency: int, interval: float):
+    video_ids = [f"74{i:05d}" for i in range(video_count)]
+    with FakeTikTokCommentAPI(latency=latency, comments_per_video=comments_per_video) as api:
+        sequential = await fetch_comments(api, video_ids, 1, 0)
+        parallel = await fetch_comments(api, video_ids, concurrency, 2)
+        expected = api.expected_count()
+
+        # 검색 결과 스크롤과 댓글 수집이 겹치는지: 전체 시간 ≈ 스크롤 시간 + 마지막 영상 댓글 수집 시간
+        settings.TIKTOK_BASE_URL = api.base_url
+        settings.TIKTOK_COMMENT_MAX_CONCURRENCY = concurrency
+        crawler = TikTokCrawler()
+        crawler.search_videos = fake_search_videos(video_count, interval)
+        start = time.perf_counter()
+        crawled = await crawler.crawl(SimpleNamespace(id=1, keyword="연세우유 말차생크림빵"), "2024-10-01", "2024-10-31")
+        crawl_elapsed = time.perf_counter() - start
+
+    for name, (counts, elapsed, requests) in (
+        ("순차 (x1)", sequential),
+        (f"병렬 (x{concurrency})", parallel),
+    ):
+        print(f"{name:<10} | 영상 {len(counts)} / 댓글+답글 {sum(counts)} | {elapsed:.2f}s | 요청 {requests}")
+
+    correct = sequential[0] == parallel[0] == [expected] * video_count
+    print(f"\n{'✅' if correct else '❌'} 영상당 댓글+답글 {expected}개 수집 (마지막 페이지 포함) | ⚡ x{sequential[1] / parallel[1]:.1f}")
+
+    scroll_time = video_count * interval
+    per_video = parallel[1] / video_count
+    overlapped = len(crawled["comments"]) == expected * video_count and crawl_elapsed < scroll_time + 2 * per_video + 1.0
+    print(
+        f"{'✅' if overlapped else '❌'} 스크롤 중 댓글 수집: {crawl_elapsed:.2f}s "
+        f"(스크롤 {scroll_time:.2f}s + 순차 댓글 {sequential[1]:.2f}s 대비) | 댓글 {len(crawled['comments'])}"
+    )
+    return 0 if correct and overlapped else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fake TikTok 댓글 API 서버로 AsyncTiktokComment 확인")
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    parser.add_argument("--videos", type=int, default=5, help="영상 수")
+    parser.add_argument("--comments", type=int, default=120, help="영상당 댓글 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="병렬 실행 시 동시 요청 수")
+    parser.add_argument("--interval", type=float, default=1.0, help="가짜 검색 결과에서 영상 하나를 찾는 데 걸리는 시간 (초)")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.latency, args.videos, args.comments, args.concurrency, args.interval)))
@@ -0,0 +1,190 @@
+# test_crawling_youtube_fake.py
+#
+# 로컬 fake YouTube Data API 서버로 YouTubeCrawler 동작/동시성 확인 (실제 API 키, DB 불필요)
+# - search / videos / commentThreads / channels 엔드포인트를 흉내 내고, 요청마다 latency 만큼 지연
+# - 영상 id 가 "-0" 으로 끝나면 commentThreads 에서 403 commentsDisabled 응답
+# - max_concurrency 1 (순차) 과 기본값(병렬)의 결과가 같은지, 소요 시간과 엔드포인트별 요청 수를 비교
+# - 영상 통계/채널 정보가 50개 id 단위 묶음 조회로 처리되는지 확인
+#
+# 사용법: python test_crawling_youtube_fake.py --latency 0.05 --comments 150
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import urlparse, parse_qs
+
+from app.crawler.sources.youtube import YouTubeCrawler
+
+
+class FakeYouTubeAPI:
+    """
+    YouTube Data API v3 의 크롤러가 쓰는 부분만 흉내 내는 로컬 HTTP 서버
+    - requests: 엔드포인트별 요청 수 (Counter)
+    """
+
+    def __init__(self, latency: float = 0.05, videos_per_search: int = 20, comments_per_video: int = 150, channels: int = 7):
+        self.latency = latency
+        self.videos_per_search = videos_per_search
+        self.comments_per_video = comments_per_video
+        self.channels = channels
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "FakeYouTubeAPI":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+    # ── 응답 생성 ───────────────────────────────────────────────
+    def search(self, params):
+        duration = params["videoDuration"][0]
+        count = min(int(params.get("maxResults", ["5"])[0]), self.videos_per_search)
+        return {"items": [
+            {
+                "id": {"videoId": f"{duration}-{i}"},
+                "snippet": {
+                    "channelId": f"channel-{i % self.channels}",
+                    "publishedAt": "2024-10-01T00:00:00Z",
+                    "title": f"편의점 신상 리뷰 {duration} {i}",
+                    "thumbnails": {"high": {"url": f"https://img.example/{duration}-{i}.jpg"}},
+                },
+            }
+            for i in range(count)
+        ]}
+
+    def videos(self, params):
+        return {"items": [
+            {
+                "id": video_id,
+                "statistics": {"viewCount": "1000", "likeCount": "10", "commentCount": str(self.comments_per_video)},
+                "snippet": {"publishedAt": "2024-10-01T00:00:00Z"},
+            }
+            for video_id in params["id"][0].split(",")
+        ]}
+
+    def comment_threads(self, params):
+        video_id = params["videoId"][0]
+        if video_id.endswith("-0"):
+            return 403, {"error": {"code": 403, "message": "comments disabled", "errors": [{"reason": "commentsDisabled"}]}}
+
+        start = int(params.get("pageToken", ["0"])[0])
+        end = min(start + int(params.get("maxResults", ["100"])[0]), self.comments_per_video)
+        body = {"items": [
+            {"snippet": {"topLevelComment": {
+                "id": f"{video_id}-c{n}",
+                "snippet": {"textDisplay": f"맛있어요 {n}", "publishedAt": "2024-10-02T00:00:00Z", "likeCount": n},
+            }}}
+            for n in range(start, end)
+        ]}
+        if end < self.comments_per_video:
+            body["nextPageToken"] = str(end)
+        return 200, body
+
+    def channels_(self, params):
+        return {"items": [
+            {
+                "id": channel_id,
+                "snippet": {"title": f"채널 {channel_id}", "publishedAt": "2020-01-01T00:00:00Z"},
+                "statistics": {"subscriberCount": "12345"},
+            }
+            for channel_id in params["id"][0].split(",")
+        ]}
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                resource = url.path.rstrip("/").rsplit("/", 1)[-1]
+                with api._lock:
+                    api.requests[resource] += 1
+                time.sleep(api.latency)
+
+                status, body = 200, None
+                if resource == "search":
+                    body = api.search(params)
+                elif resource == "videos":
+                    body = api.videos(params)
+                elif resource == "commentThreads":
+                    status, body = api.comment_threads(params)
+                elif resource == "channels":
+                    body = api.channels_(params)
+                else:
+                    status, body = 404, {"error": {"code": 404, "message": "not found", "errors": [{"reason": "notFound"}]}}
+
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+async def crawl(api: FakeYouTubeAPI, max_concurrency: int, max_videos: int, max_comments: int):
+    keyword = SimpleNamespace(id=1, keyword="연세우유 말차생크림빵")
+    crawler = YouTubeCrawler(api_key="fake-key", base_url=api.base_url, max_concurrency=max_concurrency)
+    api.requests.clear()
+    start = time.perf_counter()
+    result = await crawler.crawl(keyword, max_videos=max_videos, max_comments=max_comments)
+    return result, time.perf_counter() - start, dict(api.requests)
+
+
+async def main(latency: float, max_videos: int, max_comments: int, comments_per_video: int, concurrency: int):
+    with FakeYouTubeAPI(latency=latency, comments_per_video=comments_per_video) as api:
+        sequential, seq_elapsed, seq_requests = await crawl(api, 1, max_videos, max_comments)
+        parallel, par_elapsed, par_requests = await crawl(api, concurrency, max_videos, max_comments)
+
+    for name, result, elapsed, requests in (
+        ("순차 (x1)", sequential, seq_elapsed, seq_requests),
+        (f"병렬 (x{concurrency})", parallel, par_elapsed, par_requests),
+    ):
+        print(
+            f"{name:<10} | 영상 {len(result['videos'])} / 댓글 {len(result['comments'])} / 채널 {len(result['channels'])} "
+            f"| {elapsed:.2f}s | 요청 {sum(requests.values())}회 {requests}"
+        )
+
+    same = all(
+        sorted(item["id"] for item in sequential[key]) == sorted(item["id"] for item in parallel[key])
+        for key in ("videos", "comments", "channels")
+    )
+    print(f"\n{'✅' if same else '❌'} 순차/병렬 수집 결과 일치 | ⚡ x{seq_elapsed / par_elapsed:.1f}")
+
+    # 영상 통계/채널 정보는 50개 id 씩 묶어서 조회해야 함
+    expected_lookups = -(-len(parallel["videos"]) // 50) + -(-len(parallel["channels"]) // 50)
+    lookups = par_requests.get("videos", 0) + par_requests.get("channels", 0)
+    detailed = all(video["view_count"] is not None for video in parallel["videos"])
+    batched = lookups <= expected_lookups and detailed
+    print(f"{'✅' if batched else '❌'} 메타데이터 조회 {lookups}회 (영상 {len(parallel['videos'])}개, 채널 {len(parallel['channels'])}개)")
+    return 0 if same and batched else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fake YouTube API 서버로 YouTubeCrawler 확인")
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    parser.add_argument("--max-videos", type=int, default=20, help="길이별 검색 결과 수")
+    parser.add_argument("--max-comments", type=int, default=100, help="영상당 최대 댓글 수")
+    parser.add_argument("--comments", type=int, default=150, help="fake 영상당 댓글 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="병렬 실행 시 동시 요청 수")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.latency, args.max_videos, args.max_comments, args.comments, args.concurrency)))
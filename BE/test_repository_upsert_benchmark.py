@@ -0,0 +1,108 @@
+# test_repository_upsert_benchmark.py
+#
+# CrawlingRepository 저장 벤치마크: YouTube 댓글 N개(기본 10,000) 크롤링 결과를 실제 DB 에 저장하는 데 걸리는 시간과 SQL 실행 수
+# - 임시 키워드를 만들고 한 트랜잭션 안에서 commit=False 로 저장한 뒤 마지막에 롤백 (DB 에 아무것도 남기지 않음)
+# - 1회차: 모두 새 행, 2회차: 같은 데이터를 다시 저장 (모두 중복 → 0건 저장)
+# - 이전 구현과 비교하려면 같은 명령을 이전 커밋에서 실행 (CrawlingRepository 공개 메서드만 사용)
+# - 측정 예 (로컬 PostgreSQL 16, 유닉스 소켓, 댓글 10,000개, SQL 은 실행 수):
+#                          새 데이터              중복 재저장
+#   page-size 100  이전    20.2s / SQL 40,511회   12.0s / SQL 20,210회   (행마다 SELECT 후 INSERT)
+#                  이후     2.5s / SQL    303회    2.0s / SQL    203회   (INSERT ... ON CONFLICT 배치)
+#   page-size 0    이전    22.7s / SQL 40,412회   13.9s / SQL 20,210회
+#                  이후     2.7s / SQL     24회    2.3s / SQL     23회
+#
+# 사용법: python test_repository_upsert_benchmark.py --comments 10000 --page-size 100
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from app.core.db import SessionLocal, engine
+from app.crawler.repositories import CrawlingRepository
+from app.models import Keywords
+
+
+def fake_crawl(keyword_id: int, comment_count: int, videos: int = 100, channels: int = 10):
+    run = uuid.uuid4().hex[:8]
+    now = datetime.now()
+    channel_rows = [
+        {"id": f"bench-{run}-ch{c}", "name": f"채널 {c}", "subscriber_count": 1000 * c, "updated_at": now}
+        for c in range(channels)
+    ]
+    video_rows = [
+        {
+            "id": f"bench-{run}-v{v}", "channel_id": channel_rows[v % channels]["id"], "keyword_id": keyword_id,
+            "created_at": now - timedelta(days=v), "collected_at": now, "like_count": v, "comment_count": comment_count // videos,
+            "view_count": 10 * v, "updated_at": now, "video_type": "short" if v % 2 else "long",
+            "title": f"영상 {v}", "thumbnail_url": "",
+        }
+        for v in range(videos)
+    ]
+    comment_rows = [
+        {
+            "id": f"bench-{run}-c{i}", "video_id": video_rows[i % videos]["id"], "keyword_id": keyword_id,
+            "content": f"말차 생크림빵 맛있어요 {i}", "created_at": now - timedelta(minutes=i), "like_count": i % 7,
+            "collected_at": now,
+        }
+        for i in range(comment_count)
+    ]
+    return channel_rows, video_rows, comment_rows
+
+
+def save(repo: CrawlingRepository, channels, videos, comments, page_size: int):
+    # 크롤링 파이프라인과 같이 채널/영상 먼저, 댓글은 page_size 개씩 (0 이면 한 번에)
+    saved = repo.create_youtube_data(channels=channels, videos=videos, comments=[], commit=False)
+    step = page_size or len(comments) or 1
+    for start in range(0, len(comments), step):
+        page = repo.create_youtube_data(channels=[], videos=[], comments=comments[start:start + step], commit=False)
+        saved["comments_saved"] += page["comments_saved"]
+        saved["collected_comments_saved"] += page["collected_comments_saved"]
+    return saved
+
+
+def main(comment_count: int, page_size: int):
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    db = SessionLocal()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        keyword = Keywords(keyword=f"벤치마크-{uuid.uuid4().hex[:8]}", searched_at=datetime.now())
+        db.add(keyword)
+        db.flush()
+        repo = CrawlingRepository(db)
+        channels, videos, comments = fake_crawl(keyword.id, comment_count)
+
+        results = []
+        for label in ("새 데이터", "중복 재저장"):
+            statements = 0
+            start = time.perf_counter()
+            saved = save(repo, channels, videos, comments, page_size)
+            elapsed = time.perf_counter() - start
+            results.append((label, saved, elapsed, statements))
+            print(f"{label:<8} | {elapsed:6.2f}s | SQL {statements:>6}회 | 댓글 {comment_count / elapsed:8.0f}건/s | {saved}")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+        db.rollback()
+        db.close()
+
+    fresh, again = results[0][1], results[1][1]
+    stored = fresh["comments_saved"] == comment_count and fresh["collected_comments_saved"] == comment_count
+    deduped = again["comments_saved"] == 0 and again["collected_comments_saved"] == 0
+    print(f"\n{'✅' if stored else '❌'} 댓글 {comment_count}건 저장")
+    print(f"{'✅' if deduped else '❌'} 재저장 시 중복 0건")
+    return 0 if stored and deduped else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CrawlingRepository YouTube 저장 벤치마크 (실제 DB 사용, 마지막에 롤백)")
+    parser.add_argument("--comments", type=int, default=10_000, help="저장할 댓글 수")
+    parser.add_argument("--page-size", type=int, default=100, help="댓글을 나눠 저장할 페이지 크기 (0 이면 한 번에)")
+    args = parser.parse_args()
+    raise SystemExit(main(args.comments, args.page_size))
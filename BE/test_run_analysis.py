@@ -1,6 +1,7 @@
 # scripts/run_analysis.py
 
 from app.core.db import get_db
+from app.core.config import settings
 from app.analyzer.services import AnalysisService
 
 def run():
@@ -9,7 +10,10 @@ def run():
 
     try:
         service = AnalysisService(db)
-        result = service.run_batch_analysis()
+        if settings.ANALYSIS_WORKERS > 1:
+            result = service.run_parallel_analysis(workers=settings.ANALYSIS_WORKERS)
+        else:
+            result = service.run_batch_analysis()
         print("분석 완료:", result)
     finally:
         db.close()
@@ -0,0 +1,89 @@
+# test_seen_videos_fake.py
+#
+# 이미 수집한 영상(app/crawler/seen.py) 댓글 건너뛰기 확인 (실제 API 키, DB 불필요)
+# - test_crawling_youtube_fake 의 로컬 fake 서버를 그대로 사용 (fake 댓글 작성 시각은 모두 2024-10-02)
+# - 다른 키워드로 short 검색 결과 영상을 이미 수집했다고 가정
+#   기본: 해당 영상은 commentThreads 요청 없이 영상 목록에만 포함 (저장 시 수집 이력만 추가)
+#   delta: 저장된 최신 댓글(2024-10-02) 이후만 요청 → 영상당 1페이지 요청 후 바로 멈추고 댓글 0개
+# - 댓글 수집 완료 표시(completed_videos): 끝까지 수집한 영상만, 할당량 부족(commentThreads 0회)이면 없음
+#
+# 사용법: python test_seen_videos_fake.py --latency 0.01
+
+import argparse
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.crawler.pipeline import collect_pages
+from app.crawler.quota import QuotaMeter
+from app.crawler.seen import SeenVideos
+from app.crawler.sources.youtube import YouTubeCrawler
+from test_crawling_youtube_fake import FakeYouTubeAPI
+
+KEYWORD = SimpleNamespace(id=2, keyword="말차 생크림빵")
+MAX_VIDEOS = 10
+STORED_AT = datetime(2024, 10, 2)
+
+
+async def crawl(api: FakeYouTubeAPI, seen=None, quota=None):
+    api.requests.clear()
+    crawler = YouTubeCrawler(api_key="fake-key", base_url=api.base_url)
+    result = await collect_pages(crawler.pages(KEYWORD, max_videos=MAX_VIDEOS, max_comments=300, quota=quota, seen=seen))
+    result.setdefault("comments", [])
+    return result, dict(api.requests)
+
+
+async def main(latency: float):
+    known = [f"short-{i}" for i in range(MAX_VIDEOS)]
+    lookups = []
+
+    async def latest_comments(video_ids):
+        lookups.append(len(video_ids))
+        return {video_id: STORED_AT for video_id in video_ids}
+
+    with FakeYouTubeAPI(latency=latency, videos_per_search=MAX_VIDEOS, comments_per_video=250) as api:
+        full, full_requests = await crawl(api)
+        skipped, skipped_requests = await crawl(api, SeenVideos(known))
+        delta, delta_requests = await crawl(api, SeenVideos(known, delta=True, latest_comments=latest_comments))
+        starved, _ = await crawl(api, quota=QuotaMeter(comment_calls=0))
+
+    def known_comments(result):
+        return sum(1 for comment in result["comments"] if comment["video_id"] in known)
+
+    for label, result, requests in (("전체", full, full_requests), ("건너뛰기", skipped, skipped_requests), ("delta", delta, delta_requests)):
+        print(f"{label:<8} | 영상 {len(result['videos'])} / 댓글 {len(result['comments'])} (이미 수집한 영상 {known_comments(result)}) | 요청 {requests}")
+
+    # short-0 은 댓글 비활성화 영상이라 전체 실행에서도 1회만 요청
+    known_calls = 1 + 3 * (MAX_VIDEOS - 1)
+    same_videos = len(full["videos"]) == len(skipped["videos"]) == len(delta["videos"])
+    skip_ok = (
+        known_comments(skipped) == 0
+        and len(skipped["comments"]) == len(full["comments"]) - known_comments(full)
+        and skipped_requests["commentThreads"] == full_requests["commentThreads"] - known_calls
+    )
+    delta_ok = (
+        known_comments(delta) == 0
+        and delta_requests["commentThreads"] == skipped_requests["commentThreads"] + MAX_VIDEOS
+        and lookups == [MAX_VIDEOS]
+    )
+
+    # 댓글 비활성화 영상도 끝까지 확인했으므로 완료, 할당량이 없어 댓글을 못 받은 영상은 완료 아님
+    completed = sorted(full.get("completed_videos", []))
+    completed_ok = (
+        completed == sorted(video["id"] for video in full["videos"])
+        and len(starved["videos"]) == len(full["videos"])
+        and not starved.get("completed_videos")
+    )
+
+    print(f"\n{'✅' if same_videos else '❌'} 영상 목록은 그대로 (수집 이력 저장용)")
+    print(f"{'✅' if skip_ok else '❌'} 이미 수집한 영상 댓글 요청 {known_calls}회 생략")
+    print(f"{'✅' if delta_ok else '❌'} delta: 영상당 1회 요청, 저장된 댓글 이후만 (최신 댓글 조회 {lookups})")
+    print(f"{'✅' if completed_ok else '❌'} 댓글 수집 완료 표시 {len(completed)}개, 할당량 부족 시 {len(starved.get('completed_videos', []))}개")
+    return 0 if same_videos and skip_ok and delta_ok and completed_ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fake YouTube API 서버로 이미 수집한 영상 댓글 건너뛰기 확인")
+    parser.add_argument("--latency", type=float, default=0.01, help="요청당 지연 (초)")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.latency)))
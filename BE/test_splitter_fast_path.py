@@ -0,0 +1,63 @@
+# test_splitter_fast_path.py
+#
+# 문장 분리 fast path(is_single_sentence) 검증
+# - fast path 로 kss 를 건너뛰는 텍스트를 kss 로 실제 분리해 보고, 한 문장이 아닌 텍스트가 있으면 종료 코드 1
+# - 입력: 알려진 오분리 사례 + NLP/Data 의 정제된 댓글(cleaned)과 분리된 문장(divided_comment)
+#
+# 사용법: python test_splitter_fast_path.py --backend auto --fast-path-chars 30
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+from kss import split_sentences
+
+from app.analyzer.splitter import is_single_sentence
+
+DATA_CSV = Path(__file__).resolve().parent.parent / "NLP" / "Data" / "test_data_final_processed.csv"
+
+# kss 는 문장부호 없이도 어절 사이에서 나누는 사례 (fast path 로 처리되면 안 됨)
+KNOWN_CASES = [
+    "맛있어 근데 너무 달아",
+    "맛있다ㅋㅋ 근데 비쌈",
+    "진짜 맛있음ㅋㅋ 또 사먹을듯",
+    "맛있어요 다만 비싸요",
+    "존맛",
+    "맛있다ㅋㅋ",
+    "개맛있다ㅠㅠ",
+]
+
+
+def load_texts() -> list:
+    texts = list(KNOWN_CASES)
+    if DATA_CSV.exists():
+        with open(DATA_CSV, encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                texts.extend(row[column] for column in ("cleaned", "divided_comment") if row[column])
+    return list(dict.fromkeys(texts))
+
+
+def main(backend: str, fast_path_chars: int) -> int:
+    texts = load_texts()
+    fast = [text for text in texts if is_single_sentence(text, fast_path_chars)]
+    print(f"🔍 {len(texts)}개 텍스트 중 fast path {len(fast)}개를 kss({backend})와 비교")
+
+    mismatches = []
+    for text in fast:
+        sentences = [s.strip() for s in split_sentences(text, backend=backend, num_workers=1) if s.strip()]
+        if sentences != [text.strip()]:
+            mismatches.append((text, sentences))
+
+    for text, sentences in mismatches:
+        print(f"❌ {text!r} → kss {sentences}")
+    print(f"{'✅' if not mismatches else '❌'} 불일치 {len(mismatches)}개 / {len(fast)}개")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="문장 분리 fast path 와 kss 결과 비교")
+    parser.add_argument("--backend", default="auto", help="비교할 kss 백엔드")
+    parser.add_argument("--fast-path-chars", type=int, default=30, help="fast path 최대 길이")
+    args = parser.parse_args()
+    sys.exit(main(args.backend, args.fast_path_chars))
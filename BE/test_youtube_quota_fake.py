@@ -0,0 +1,93 @@
+# test_youtube_quota_fake.py
+#
+# YouTube API 할당량 계산/계획(app/crawler/quota.py) 확인 (실제 API 키, DB 불필요)
+# - test_crawling_youtube_fake 의 로컬 fake 서버를 그대로 사용
+# - QuotaMeter 가 집계한 units 가 fake 서버가 받은 요청 × 엔드포인트별 비용과 같은지
+# - 할당량이 모자란 계획에서는 댓글 요청만 줄고 검색/상세 조회 결과는 그대로인지
+# - 여러 키워드 계획: 우선순위(경과 시간 × 수요) 순으로 포함, 댓글 페이지부터 줄이고 남는 키워드는 deferred
+# - HTTP 캐시 on 상태의 두 번째 실행은 0 units
+#
+# 사용법: python test_youtube_quota_fake.py --latency 0.01
+
+import argparse
+import asyncio
+import shutil
+import tempfile
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.crawler.quota import UNIT_COSTS, QuotaMeter, estimate_cost, plan_budget
+from app.crawler.sources.youtube import YouTubeCrawler
+from test_crawling_youtube_fake import FakeYouTubeAPI
+
+KEYWORD = SimpleNamespace(id=1, keyword="연세우유 말차생크림빵")
+MAX_VIDEOS = 20
+
+
+async def crawl(api: FakeYouTubeAPI, plan_item, max_comments: int = 100):
+    api.requests.clear()
+    meter = QuotaMeter(limit=plan_item["projected_cost"], comment_calls=plan_item["comment_calls"])
+    crawler = YouTubeCrawler(api_key="fake-key", base_url=api.base_url)
+    result = await crawler.crawl(KEYWORD, max_videos=MAX_VIDEOS, max_comments=min(max_comments, plan_item["max_comments"]), quota=meter)
+    billed = sum(UNIT_COSTS[resource] * count for resource, count in api.requests.items())
+    return result, meter, billed, dict(api.requests)
+
+
+async def main(latency: float):
+    full = plan_budget([{"keyword_id": 1}], 10_000, MAX_VIDEOS, 100)["scheduled"][0]
+    base = estimate_cost(MAX_VIDEOS, 0)["total"]
+    tight = plan_budget([{"keyword_id": 1}], base + 25, MAX_VIDEOS, 100)["scheduled"][0]
+
+    with FakeYouTubeAPI(latency=latency, videos_per_search=MAX_VIDEOS) as api:
+        full_result, full_meter, full_billed, full_requests = await crawl(api, full)
+        tight_result, tight_meter, tight_billed, tight_requests = await crawl(api, tight)
+
+        cache_dir = tempfile.mkdtemp(prefix="quota-cache-")
+        settings.CRAWL_CACHE_DIR, settings.CRAWL_CACHE_MODE = cache_dir, "on"
+        try:
+            await crawl(api, full)
+            _, warm_meter, _, _ = await crawl(api, full)
+        finally:
+            settings.CRAWL_CACHE_MODE = "off"
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"전체 계획   | 예상 {full['projected_cost']} / 사용 {full_meter.used} / 서버 기준 {full_billed} units | 요청 {full_requests}")
+    print(f"축소 계획   | 예상 {tight['projected_cost']} / 사용 {tight_meter.used} / 서버 기준 {tight_billed} units | 요청 {tight_requests}")
+    print(f"캐시 warm   | 사용 {warm_meter.used} units")
+
+    metered = full_meter.used == full_billed and tight_meter.used == tight_billed
+    within = full_meter.used <= full["projected_cost"] and tight_meter.used <= tight["projected_cost"]
+    degraded = (
+        tight_requests.get("commentThreads", 0) <= tight["comment_calls"] < full_requests["commentThreads"]
+        and len(tight_result["videos"]) == len(full_result["videos"])
+        and 0 < len(tight_result["comments"]) < len(full_result["comments"])
+    )
+
+    # 여러 키워드: 검색/상세 비용 2개분 + 댓글 일부만 남은 상황
+    per_page = estimate_cost(MAX_VIDEOS, 1)["comments"]
+    multi = plan_budget(
+        [
+            {"keyword_id": 1, "staleness_hours": 2, "demand": 0},     # 최근 수집, 수요 없음 → 마지막
+            {"keyword_id": 2, "staleness_hours": None, "demand": 0},  # 한 번도 수집 안 함 → 먼저
+            {"keyword_id": 3, "staleness_hours": 10, "demand": 4},
+        ],
+        2 * base + per_page + 10, MAX_VIDEOS, 200
+    )
+    order = [item["keyword_id"] for item in multi["scheduled"]]
+    pages = [item["comment_calls"] for item in multi["scheduled"]]
+    planned = order == [2, 3] and multi["deferred"] == [1] and pages == [per_page, 10] and multi["projected_cost"] <= multi["budget"]
+    print(f"여러 키워드 | 순서 {order}, 댓글 호출 {pages}, deferred {multi['deferred']}, 예상 {multi['projected_cost']} / {multi['budget']}")
+
+    print(f"\n{'✅' if metered else '❌'} 집계 units = 서버 요청 × 비용")
+    print(f"{'✅' if within else '❌'} 사용량 ≤ 예상 비용")
+    print(f"{'✅' if degraded else '❌'} 할당량 부족 시 댓글만 축소 (영상 {len(tight_result['videos'])}, 댓글 {len(tight_result['comments'])}/{len(full_result['comments'])})")
+    print(f"{'✅' if planned else '❌'} 우선순위 순 계획, 댓글 페이지부터 축소")
+    print(f"{'✅' if warm_meter.used == 0 else '❌'} 캐시 적중은 할당량 미사용")
+    return 0 if metered and within and degraded and planned and warm_meter.used == 0 else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fake YouTube API 서버로 할당량 계산/계획 확인")
+    parser.add_argument("--latency", type=float, default=0.01, help="요청당 지연 (초)")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.latency)))
@@ -0,0 +1,15 @@
+"""
+    aspect_matcher.py
+
+    Aho-Corasick 기반 속성(aspect) 키워드 매처
+    구현은 BE/app/analyzer/matcher.py 하나만 유지하고 여기서는 그 모듈을 그대로 불러옴
+    (두 파이프라인이 같은 사전/매칭 규칙을 사용)
+
+    클래스:
+      - AspectMatcher: 키워드 사전을 하나의 오토마톤으로 컴파일, 문장을 한 번만 스캔하여
+                       매칭된 모든 라벨과 근거 키워드 반환 (first_only=True 시 첫 라벨만)
+"""
+
+from be_shared import load_analyzer_module
+
+load_analyzer_module(__name__, "matcher.py")
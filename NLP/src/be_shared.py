@@ -0,0 +1,28 @@
+"""
+    be_shared.py
+
+    BE/app/analyzer 의 모듈을 NLP 스크립트에서 그대로 불러오는 헬퍼
+    (BE 의 app 패키지는 import 시 Flask 앱 설정까지 불러오므로 패키지 대신 파일 경로로 로드)
+
+    함수:
+      - load_analyzer_module: BE/app/analyzer/<filename> 을 name 모듈로 로드하여 sys.modules 에 등록
+"""
+
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+BE_ANALYZER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "BE", "app", "analyzer"))
+
+
+def load_analyzer_module(name: str, filename: str) -> ModuleType:
+    """
+    name 으로 등록하므로 NLP 쪽 import 이름(예: split_service)이 그대로 유지되고,
+    spawn 프로세스 풀에서도 같은 이름으로 다시 로드됨
+    """
+    spec = importlib.util.spec_from_file_location(name, os.path.join(BE_ANALYZER_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
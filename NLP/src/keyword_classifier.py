@@ -5,6 +5,7 @@
 
     함수:
       - load_patterns: 사전 정의된 키워드 리스트를 패턴 딕셔너리로 변환
+      - load_matcher: 사전 정의된 키워드 리스트를 단일 Aho-Corasick 매처로 변환
       - classify_keywords_df: DataFrame에 대해 각 키워드 패턴에 맞춰 0/1 레이블 컬럼 추가
 
     CLI:
@@ -24,46 +25,29 @@ import argparse
 import pandas as pd
 import re
 from ace_tools_open import display_dataframe_to_user
+from aspect_matcher import AspectMatcher, ASPECT_KEYWORDS
 
 
 def load_patterns() -> dict:
     """
     사전 정의된 키워드 리스트를 regex 패턴 dict로 컴파일하여 반환
+    (레이블 목록 확인 및 기존 코드 호환용, 분류 자체는 load_matcher 사용)
     """
-    keyword_dict = {
-        '맛': [
-            '맛있','달달','단맛','짠맛','맛임','감칠맛','매워','짠','설탕',
-            '단짠','밍밍','매콤','상큼','비릿','인공적','당충전', '느끼'
-        ],
-        '식감': [
-            '식감','쫀득','쫀득함','바삭','퍽퍽','부드러움','쫀쫀함','촉촉',
-            '질겨','씹싸름','빠삭','겉바속촉','꾸덕','미끌','속쫀','뻑뻑','사르르'
-        ],
-        '기타': [
-            '포장','디자인','스타일','편의점','사진','인스타','브랜드','컬러',
-            '비주','비주얼','선물','리뉴얼','CU','GS','세븐','세븐일레븐',
-            '지에스','씨유','이마트','노브랜드','이마트24','배민','B마트',
-            '비마트','팝업','미니스톱'
-        ],
-        '가격': [
-            '가격','가성','할인','가성비','부담','대비','싸구려','가격에비해',
-            '비싸여','넘비싸','이딴게','가심비','이가격','합리적'
-        ],
-        '주관적평가': [
-            '감동','행복','만족','대박','최고','실망','아쉽','아쉬운','추천',
-            '진심','감탄','존맛','비추','느낌','퀄리티','재구매','강추',
-            '굿굿','중독성','개존맛'
-        ]
-    }
-    # regex 컴파일
     patterns = {}
-    for label, kw_list in keyword_dict.items():
+    for label, kw_list in ASPECT_KEYWORDS.items():
         # OR 결합, ignore case
         regex = re.compile('|'.join(map(re.escape, kw_list)), flags=re.IGNORECASE)
         patterns[label] = regex
     return patterns
 
 
+def load_matcher() -> AspectMatcher:
+    """
+    사전 정의된 키워드 리스트를 단일 Aho-Corasick 매처로 컴파일하여 반환
+    """
+    return AspectMatcher(ASPECT_KEYWORDS)
+
+
 def classify_keywords_df(
     df: pd.DataFrame,
     text_col: str = 'divided_comment'
@@ -72,12 +56,13 @@ def classify_keywords_df(
     1) text_col 기준으로 패턴 매칭해 0/1 컬럼 추가
     2) 아무 키워드에도 매칭되지 않은(모든 컬럼 0) 행은 삭제
     """
-    patterns = load_patterns()
-    label_cols = list(patterns.keys())
+    matcher = load_matcher()
+    label_cols = matcher.labels
 
-    # 1) 각 패턴별 매칭 여부 컬럼 생성
-    for label, pat in patterns.items():
-        df[label] = df[text_col].str.contains(pat).astype(int)
+    # 1) 문장마다 한 번만 스캔해서 매칭된 레이블 집합을 구한 뒤 0/1 컬럼 생성
+    matched = df[text_col].map(lambda x: matcher.match(x) if isinstance(x, str) else {})
+    for label in label_cols:
+        df[label] = matched.map(lambda hits: int(label in hits))
 
     # 2) 모든 키워드 컬럼이 0인 행 DROP
     mask = df[label_cols].sum(axis=1) > 0
@@ -98,8 +83,8 @@ if __name__ == '__main__':
     df_out = classify_keywords_df(df, text_col=args.text_col)
 
     if args.preview:
-        cols = ['ID', args.text_col, 'sentiment'] + list(load_patterns().keys())
+        cols = ['ID', args.text_col, 'sentiment'] + list(ASPECT_KEYWORDS.keys())
         display_dataframe_to_user('키워드 분류 예시', df_out[cols].head(20))
 
     df_out.to_csv(args.output, index=False, encoding='utf-8-sig')
-    print(f"[KEYWORD] 저장 완료: {args.output} | 레이블: {', '.join(load_patterns().keys())}")
\ No newline at end of file
+    print(f"[KEYWORD] 저장 완료: {args.output} | 레이블: {', '.join(ASPECT_KEYWORDS.keys())}")
\ No newline at end of file
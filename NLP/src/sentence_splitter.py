@@ -5,21 +5,23 @@
 
     함수:
         - split_sentences_df: DataFrame을 받아서 cleaned 컬럼 기준으로 문장 분리 후 explode
+                              (SentenceSplitter 로 전체 텍스트를 한 번에 병렬 분리)
         - sample_preview: 샘플 데이터를 로드 후 분할 결과를 display
 """
 
 import argparse
 import pandas as pd
-from kss import split_sentences
 from ace_tools_open import display_dataframe_to_user
 from typing import Optional
+from split_service import SentenceSplitter, KSS_BACKENDS
 
 def split_sentences_df(
     df: pd.DataFrame,
     id_col: str = 'ID',
     time_col: Optional[str] = None, 
     text_col: str = 'cleaned',
-    output_col: str = 'divided_comment'
+    output_col: str = 'divided_comment',
+    splitter: Optional[SentenceSplitter] = None
 ) -> pd.DataFrame:
     """
     DataFrame에서 한 줄(comment/cleaned)마다 문장 분리 후 explode 처리
@@ -30,12 +32,15 @@ def split_sentences_df(
         time_col: 작성시간 컬럼명 (없으면 None)
         text_col: 분할할 텍스트 컬럼명
         output_col: 분할된 문장을 담을 컬럼명
+        splitter: 사용할 SentenceSplitter (없으면 기본 설정으로 생성)
 
     Returns:
         exploded_df: id, time(선택), original_comment, cleaned, divided_comment이 포함된 DataFrame
     """
     # 문장 리스트 컬럼 생성
-    df['sent_list'] = df[text_col].apply(lambda x: split_sentences(x) if isinstance(x, str) else [])
+    splitter = splitter or SentenceSplitter()
+    texts = [x if isinstance(x, str) else '' for x in df[text_col]]
+    df['sent_list'] = splitter.split_many(texts)
     # explode
     df_exploded = df.explode('sent_list').reset_index(drop=True)
     # 컬럼명 변경
@@ -56,17 +61,30 @@ if __name__ == '__main__':
     parser.add_argument('--time-col', default=None, help='작성시간 컬럼명')
     parser.add_argument('--text-col', default='cleaned', help='분할할 텍스트 컬럼명')
     parser.add_argument('--output-col', default='divided_comment', help='분할된 문장 컬럼명')
+    parser.add_argument('--backend', default='auto', choices=KSS_BACKENDS, help='kss 형태소 분석 백엔드')
+    parser.add_argument('--workers', type=int, default=1, help='문장 분리 프로세스 수')
+    parser.add_argument('--chunk-size', type=int, default=500, help='프로세스에 한 번에 넘길 텍스트 수')
+    parser.add_argument('--fast-path-chars', type=int, default=0, help='이 길이 이하의 한 어절 텍스트는 kss 생략 (0이면 사용 안 함)')
     parser.add_argument('--preview', action='store_true', help='샘플 20개 미리보기')
     args = parser.parse_args()
 
     df = pd.read_csv(args.input, encoding='utf-8-sig')
-    df_split = split_sentences_df(
-        df,
-        id_col=args.id_col,
-        time_col=args.time_col,
-        text_col=args.text_col,
-        output_col=args.output_col
-    )
+    with SentenceSplitter(
+        backend=args.backend,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        fast_path_chars=args.fast_path_chars
+    ) as splitter:
+        df_split = split_sentences_df(
+            df,
+            id_col=args.id_col,
+            time_col=args.time_col,
+            text_col=args.text_col,
+            output_col=args.output_col,
+            splitter=splitter
+        )
+        stats = splitter.stats()
+    print(f"[SPLIT] {stats['texts']}개 텍스트 → {stats['seconds']:.2f}s, {stats['texts_per_sec']:.1f} texts/s (fast path {stats['fast_path']}개)")
 
     if args.preview:
         display_dataframe_to_user('분리된 문장 예시', df_split.head(20))
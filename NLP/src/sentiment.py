@@ -57,27 +57,33 @@ def predict_sentiment_df(
     - output_col_prob_0, output_col_prob_1: softmax 확률 컬럼 추가
     """
     texts = df[text_col].fillna('').astype(str).tolist()
-    enc = tokenizer(
-        texts,
-        return_tensors='tf',
-        padding='max_length',
-        truncation=True,
-        max_length=max_length
-    )
-    ds = tf.data.Dataset.from_tensor_slices(dict(enc)).batch(batch_size)
+    features = tokenizer(texts, truncation=True, max_length=max_length)
+
+    # 토큰 길이 순으로 정렬해 비슷한 길이끼리 배치 → 배치마다 가장 긴 문장 길이까지만 padding
+    order = sorted(range(len(texts)), key=lambda i: len(features['input_ids'][i]))
+    logits = np.zeros((len(texts), 2), dtype=np.float32)
 
     start = time.perf_counter()
-    preds = model.predict(ds)
+    for b in range(0, len(order), batch_size):
+        idx = order[b:b + batch_size]
+        enc = tokenizer.pad(
+            {k: [v[i] for i in idx] for k, v in features.items()},
+            padding='longest',
+            pad_to_multiple_of=8,
+            return_tensors='tf'
+        )
+        logits[idx] = model(dict(enc), training=False).logits.numpy()
     elapsed = time.perf_counter() - start
 
-    probs = tf.nn.softmax(preds.logits, axis=1).numpy()
+    # 원래 행 순서로 되돌린 logits 기준으로 확률/라벨 계산
+    probs = tf.nn.softmax(logits, axis=1).numpy()
     labels = np.argmax(probs, axis=1)
 
     df[output_col] = labels
     df[f'{output_col}_prob_0'] = probs[:, 0]
     df[f'{output_col}_prob_1'] = probs[:, 1]
 
-    print(f"[SENTI] {len(texts)} samples → {elapsed:.2f}s total, {elapsed/len(texts):.4f}s per sample")
+    print(f"[SENTI] {len(texts)} samples → {elapsed:.2f}s total, {elapsed/max(len(texts), 1):.4f}s per sample")
     return df
 
 
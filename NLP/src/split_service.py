@@ -0,0 +1,15 @@
+"""
+    split_service.py
+
+    kss 문장 분리 서비스
+    구현은 BE/app/analyzer/splitter.py 하나만 유지하고 여기서는 그 모듈을 그대로 불러옴
+    (두 파이프라인이 같은 분리 규칙/fast path 를 사용)
+
+    클래스:
+      - SentenceSplitter: 텍스트 목록을 chunk 단위로 프로세스 풀에 분배하여 문장 분리,
+                          kss 백엔드 선택 및 짧은 한 문장 fast path 지원, 처리량(texts/s) 집계
+"""
+
+from be_shared import load_analyzer_module
+
+load_analyzer_module(__name__, "splitter.py")
@@ -44,6 +44,7 @@ def main(config_path: Path):
     cfg = yaml.safe_load(config_path.read_text(encoding='utf-8'))
     data_cfg  = cfg['data']
     paths_cfg = cfg['paths']
+    split_cfg = cfg.get('split', {})
 
     # 2) config에서 경로 꺼내기
     input_csv    = Path(data_cfg['input_csv'])            # 최초 원본 CSV
@@ -79,7 +80,9 @@ def main(config_path: Path):
             '--id-col',     data_cfg.get('id_col', 'ID'),
             '--time-col',   data_cfg.get('time_col', ''),
             '--text-col',   'cleaned',
-            '--output-col', 'divided_comment'
+            '--output-col', 'divided_comment',
+            '--backend',    str(split_cfg.get('backend', 'auto')),
+            '--workers',    str(split_cfg.get('workers', 1))
         ]
     )
 